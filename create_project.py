@@ -8,8 +8,10 @@ from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
-logger = logging.getLogger(__name__)
 
+from services.stage_filter import GITATTRIBUTES, plan_stage, track_lfs
+
+logger = logging.getLogger(__name__)
 
 # [END: Imports]
 load_dotenv()
@@ -24,7 +26,6 @@ COPYFILES_PATH = (
 
 # [FUNC: create_github_repo]
 def create_github_repo(project_name: str) -> str | None:
-logger.debug("create_github_repo() called")
     """Maak (optioneel) een GitHub-repo. Slaat over als GITHUB_TOKEN ontbreekt."""
     if not GITHUB_TOKEN:
         print("INFO: GITHUB_TOKEN ontbreekt - GitHub stap wordt overgeslagen.")
@@ -51,12 +52,24 @@ logger.debug("create_github_repo() called")
 
 
 
-logger.debug("git_init_and_push() called")
 # [FUNC: git_init_and_push]
 def git_init_and_push(project_path: str, github_repo_url: str):
     try:
         subprocess.run(["git", "init"], cwd=project_path, check=True)
-        subprocess.run(["git", "add", "."], cwd=project_path, check=True)
+        # geen `git add .`: buildmappen, te grote bestanden en .gitignore eruit
+        plan = plan_stage(project_path)
+        if plan.lfs:
+            subprocess.run(["git", "lfs", "install", "--local"], cwd=project_path, check=True)
+            if track_lfs(project_path, plan.lfs) is not None:
+                plan.stage.append(GITATTRIBUTES)
+        if plan.summary():
+            print(f"INFO: {plan.summary()}")
+        subprocess.run(
+            ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+            cwd=project_path,
+            input="\0".join(plan.stage).encode("utf-8"),
+            check=True,
+        )
         subprocess.run(
             ["git", "commit", "-m", "Eerste commit via ProjectAssistent"],
             cwd=project_path,
@@ -81,7 +94,6 @@ def git_init_and_push(project_path: str, github_repo_url: str):
 
 # [FUNC: _write_vscode]
 def _write_vscode(project_path: str, project_name: str, venv_root: str):
-logger.debug("_write_vscode() called")
     """
     Schrijft .vscode/settings.json en tasks.json (BAT-first + UI2PY-tool + Start_Main).
     """
@@ -154,7 +166,6 @@ logger.debug("_write_vscode() called")
 
 
 # [FUNC: create_project]
-logger.debug("create_project() called")
 def create_project(base_folder: str, project_name: str, readme_text: str):
     """
     Maakt een PyQt-project in OneDrive en zet een venv op in C:\\virt omgeving\\<project>\\venv.
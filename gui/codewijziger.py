@@ -16,7 +16,6 @@ logger = logging.getLogger(__name__)
 # [CLASS: Ui_CodeWijzigerWindow]
 class Ui_CodeWijzigerWindow(object):
 # [FUNC: setupUi]
-logger.debug("setupUi() called")
     def setupUi(self, CodeWijzigerWindow):
         CodeWijzigerWindow.setObjectName("CodeWijzigerWindow")
         CodeWijzigerWindow.resize(1162, 862)
@@ -240,7 +239,6 @@ logger.debug("setupUi() called")
         CodeWijzigerWindow.setTabOrder(self.chkLockMarkers, self.chkHideIdentical)
 
 # [END: setupUi]
-logger.debug("retranslateUi() called")
 # [FUNC: retranslateUi]
     def retranslateUi(self, CodeWijzigerWindow):
         _translate = QtCore.QCoreApplication.translate
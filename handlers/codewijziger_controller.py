@@ -1,25 +1,30 @@
 # handlers/codewijziger_controller.py
 
 # [SECTION: Imports]
-import logging
 from __future__ import annotations
 
+import difflib
+import logging
 import os
 import re
-import difflib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from PyQt6 import QtCore, QtWidgets
 
-import subprocess
+from handlers.git_bridge import in_background, on_gui
+from services.git_service import get_git_service
+from services.paths import to_rel_posix
+from services.symbol_cache import find_project_root, find_symbol, get_cache
+
 from datetime import datetime
+
 logger = logging.getLogger(__name__)
 
+# [END: Imports]
 
 
-# [END: Imports]
 # [CLASS: FormState]
 @dataclass
 class FormState:
@@ -71,7 +76,6 @@ _CODE_FENCE = re.compile(r"^\s*```+")
 
 
 # [FUNC: _expand_path]
-logger.debug("_expand_path() called")
 def _expand_path(p: str) -> Path:
     p = p.strip().strip('"').strip("'")
     p = os.path.expandvars(os.path.expanduser(p))
@@ -84,7 +88,6 @@ def parse_wijzigformulier(text: str) -> FormState:
     """
     Parse het standaard wijzigformulier.
     - Herkent labels (Bestand, Actie, Marker-van, Marker-tot, Contextregels, Blok-ID, Korte reden, Voorstel-blok).
-logger.debug("parse_wijzigformulier() called")
     - Alles na 'Voorstel-blok:' is het voorstel; code fences ``` worden genegeerd.
     """
     lines = text.splitlines()
@@ -153,7 +156,6 @@ logger.debug("parse_wijzigformulier() called")
 # [END: parse_wijzigformulier]
 
 
-logger.debug("_read_file_lines() called")
 
 # [FUNC: _read_file_lines]
 def _read_file_lines(path: Path) -> List[str]:
@@ -162,7 +164,6 @@ def _read_file_lines(path: Path) -> List[str]:
 # [END: _read_file_lines]
 
 # [FUNC: _find_marker_range]
-    logger.debug("_find_marker_range() called")
 def _find_marker_range(
     lines: List[str], start_marker: str, end_marker: str
 ) -> Tuple[int, int]:
@@ -184,7 +185,6 @@ def _find_marker_range(
 
 # [END: _find_marker_range]
 
-            logger.debug("_find_all_marker_ranges() called")
 # [FUNC: _find_all_marker_ranges]
 def _find_all_marker_ranges(
     lines: List[str], start_marker: str, end_marker: str
@@ -204,9 +204,33 @@ def _find_all_marker_ranges(
             ei += 1
     return ranges
 
-    logger.debug("_norm_line() called")
 # [END: _find_all_marker_ranges]
 
+_MARKER_NAME = re.compile(r"\[\s*(?:FUNC|CLASS)\s*:\s*([^\]]+?)\s*\]")
+
+
+# [FUNC: _find_symbol_range]
+def _find_symbol_range(path: Optional[Path], marker_van: str) -> Tuple[int, int]:
+    """
+    Terugval zonder markers: zoek de functie/class uit `# [FUNC: naam]` via de
+    projectbrede symboolcache. Retour (start,end) 0-based incl., of (-1,-1).
+    """
+    m = _MARKER_NAME.search(marker_van or "")
+    if not m or not path or path.suffix.lower() != ".py":
+        return (-1, -1)
+    try:
+        cache = get_cache(find_project_root(path))
+        meta = cache.for_file(path)
+        cache.save()
+    except (OSError, SyntaxError, ValueError):
+        return (-1, -1)
+    hit = find_symbol(meta, m.group(1))
+    if not hit:
+        return (-1, -1)
+    return (hit[0] - 1, hit[1] - 1)
+
+# [END: _find_symbol_range]
+
 
 
 # [FUNC: _norm_line]
@@ -221,7 +245,6 @@ def _norm_line(s: str, ignore_ws: bool, ignore_case: bool) -> str:
 # [END: _norm_line]
 
 # [FUNC: _build_hunks_and_opcodes]
-        logger.debug("_build_hunks_and_opcodes() called")
 def _build_hunks_and_opcodes(
     right_text: str,
     left_text: str,
@@ -264,7 +287,6 @@ def _build_hunks_and_opcodes(
                 n_del=n_del,
                 preview=preview,
             )
-                logger.debug("_extract_block_only() called")
         )
     return hunks, opcodes
 
@@ -286,7 +308,6 @@ def _extract_block_only(text: str, marker_van: str, marker_tot: str) -> List[str
     for j in range(s, len(lines)):
         if lines[j].rstrip("\r\n") == mt:
             e = j
-        logger.debug("_ensure_trailing_nl() called")
             break
     if e == -1:
         return []
@@ -298,61 +319,29 @@ def _extract_block_only(text: str, marker_van: str, marker_tot: str) -> List[str
 def _ensure_trailing_nl(lines: List[str]) -> List[str]:
     if not lines:
         return lines
-    logger.debug("_run_git() called")
     if not lines[-1].endswith("\n"):
         lines[-1] = lines[-1] + "\n"
     return lines
 
 # [END: _ensure_trailing_nl]
 
-logger.debug("_git_is_repo() called")
-
-
-# [FUNC: _run_git]
-def _run_git(args: list[str], cwd: Path) -> tuple[int, str, str]:
-    p = subprocess.run(args, cwd=str(cwd), capture_output=True, text=True, shell=False)
-    return p.returncode, p.stdout.strip(), p.stderr.strip()
-
-    logger.debug("_git_after_save() called")
-# [END: _run_git]
-
-# [FUNC: _git_is_repo]
-def _git_is_repo(cwd: Path) -> bool:
-    rc, out, _ = _run_git(["git", "rev-parse", "--is-inside-work-tree"], cwd)
-    return rc == 0 and (out.lower() == "true")
 
-# [END: _git_is_repo]
 
 # [FUNC: _git_after_save]
-def _git_after_save(cwd: Path, target: Path, msg: str, parent) -> None:
-    # alleen het gewijzigde bestand committen
-    try:
-        rel = target.resolve().relative_to(cwd.resolve())
-    except Exception:
-        rel = target.name
-
-    rc, _, err = _run_git(["git", "add", str(rel)], cwd)
-    if rc != 0:
-        QtWidgets.QMessageBox.information(parent, "Git", f"git add faalde:\n{err}")
-        return
-
-    rc, _, err = _run_git(["git", "commit", "-m", msg], cwd)
-    if rc != 0:
-        # vaak: nothing to commit
-        QtWidgets.QMessageBox.information(
-            parent, "Git", f"git commit:\n{err or 'niets te committen'}"
-        )
-        return
+def _git_after_save(cwd: Path, target: Path, msg: str, parent, status) -> None:
+    # alleen het gewijzigde bestand committen; add/commit lopen op de
+    # achtergrond (GitService), de push volgt gebundeld via de PushQueue
+    fut = get_git_service().save(cwd, [to_rel_posix(cwd, target)], msg)
+
+    def _done(res) -> None:
+        if res.no_repo:
+            status("Niet in Git-repo, push overgeslagen.")
+            return
+        status(res.summary().splitlines()[0])
+        if not res.ok and not res.nothing_to_commit:
+            QtWidgets.QMessageBox.information(parent, "Git", res.summary())
 
-    rc, out, err = _run_git(["git", "push"], cwd)
-    if rc == 0:
-        QtWidgets.QMessageBox.information(
-            parent, "Git", "Wijzigingen gecommit en gepusht."
-        )
-    else:
-        QtWidgets.QMessageBox.information(
-            parent, "Git", f"git push faalde:\n{err or out}"
-        )
+    on_gui(fut, _done)
 
 # [END: _git_after_save]
 
@@ -361,7 +350,6 @@ def _git_after_save(cwd: Path, target: Path, msg: str, parent) -> None:
 # [CLASS: CodeWijzigerController]
 class CodeWijzigerController:
     """
-logger.debug("__init__() called")
     Controller voor Codewijziger-UI.
     - Tab 'Formulier': laden, parsen, velden invullen, links/rechts klaarmaken.
     - Tab 'Wijzigingen': hunks tonen, selectief of volledig toepassen, dry-run, opslaan/herstel.
@@ -378,12 +366,12 @@ logger.debug("__init__() called")
         self.ui = ui
         self.window = window
         self.project_root = Path(project_root) if project_root else None
-        logger.debug("_init_defaults() called")
         self.json_path = Path(json_path) if json_path else None
         self.state = FormState()
         self._hunks: List[Hunk] = []
         self._opcodes: List[Tuple[str, int, int, int, int]] = []
         self._syncing_scroll = False
+        self._history_dlg = None
 
         self._connect_signals()
         self._init_defaults()
@@ -404,7 +392,6 @@ logger.debug("__init__() called")
             pass
         for name, val in (
             ("chkIgnoreWhitespace", False),
-            logger.debug("_setup_sync_scroll() called")
             ("chkIgnoreCase", False),
             ("chkHideIdentical", False),
         ):
@@ -419,7 +406,6 @@ logger.debug("__init__() called")
 
 # [FUNC: _setup_sync_scroll]
     def _setup_sync_scroll(self) -> None:
-logger.debug("_sync_scrollbars() called")
         """Optioneel: gesynchroniseerd scrollen tussen links/rechts."""
         left = getattr(self.ui, "txtVoorstel", None)
         right = getattr(self.ui, "txtHuidig", None)
@@ -446,7 +432,6 @@ logger.debug("_sync_scrollbars() called")
             self._syncing_scroll = True
             src = left if direction == "L2R" else right
             dst = right if direction == "L2R" else left
-            logger.debug("_connect_signals() called")
             sbar = src.verticalScrollBar()
             dbar = dst.verticalScrollBar()
             smax = sbar.maximum()
@@ -476,7 +461,6 @@ logger.debug("_sync_scrollbars() called")
         # Wijzigingen – acties
         btn = getattr(self.ui, "btnGeselecteerdToepassen", None)
         if btn is not None:
-        logger.debug("_set_status() called")
             btn.clicked.connect(lambda: self._apply_hunks(selected_only=True))
         btn = getattr(self.ui, "btnBlokToepassen", None)
         if btn is not None:
@@ -488,17 +472,14 @@ logger.debug("_sync_scrollbars() called")
         if btn is not None:
             btn.clicked.connect(self._on_save)
         btn = getattr(self.ui, "btnHerstel", None)
-            logger.debug("_error_box() called")
         if btn is not None:
             btn.clicked.connect(self._on_restore)
 
 # [END: _connect_signals]
-logger.debug("_info_box() called")
 
 # [FUNC: _set_status]
     def _set_status(self, msg: str) -> None:
         sb = getattr(self.ui, "statusbar", None) or getattr(
-        logger.debug("_on_load_form() called")
             self.window, "statusbar", None
         )
         try:
@@ -521,7 +502,6 @@ logger.debug("_info_box() called")
 # [FUNC: _on_load_form]
     def _on_load_form(self) -> None:
         fn, _ = QtWidgets.QFileDialog.getOpenFileName(
-logger.debug("_pick_marker_range_if_needed() called")
             self.window,
             "Kies wijzigformulier",
             str(self.project_root or Path.home()),
@@ -543,11 +523,11 @@ logger.debug("_pick_marker_range_if_needed() called")
     def _pick_marker_range_if_needed(
         self, lines: List[str], st: FormState
     ) -> Tuple[int, int]:
-        logger.debug("_on_analyse_form() called")
         """Kies blok als meerdere matches. Retourneer (start,end) of (-1,-1)."""
         ranges = _find_all_marker_ranges(lines, st.marker_van, st.marker_tot)
         if not ranges:
-            return (-1, -1)
+            # nog niet genormaliseerd? val terug op de symboolcache
+            return _find_symbol_range(st.bestand, st.marker_van)
         if len(ranges) == 1:
             return ranges[0]
         # Meerdere matches → dialoog
@@ -626,7 +606,6 @@ logger.debug("_pick_marker_range_if_needed() called")
                 else:
                     ctx = max(0, st.contextregels)
                     a = max(0, start_idx - ctx)
-                logger.debug("_rebuild_hunks() called")
                     b = min(len(file_lines), end_idx + 1 + ctx)
                     right_block = "".join(file_lines[a:b])
                     right_range = (start_idx, end_idx)
@@ -661,7 +640,6 @@ logger.debug("_pick_marker_range_if_needed() called")
             if hasattr(self.ui, "txtHuidig")
             else self.state.huidig_blok
         )
-            logger.debug("_update_hunks_list() called")
 
         ignore_ws = bool(
             getattr(self.ui, "chkIgnoreWhitespace", None)
@@ -679,7 +657,6 @@ logger.debug("_pick_marker_range_if_needed() called")
         self._hunks, self._opcodes = _build_hunks_and_opcodes(
             right_text=right_text,
             left_text=left_text,
-            logger.debug("_selected_hunk_keys() called")
             ignore_ws=ignore_ws,
             ignore_case=ignore_case,
         )
@@ -694,7 +671,6 @@ logger.debug("_pick_marker_range_if_needed() called")
         lw.clear()
         for hk in self._hunks:
             text = f"{hk.tag.upper():7s}  r:{hk.r1}-{hk.r2}  l:{hk.l1}-{hk.l2}  (+{hk.n_add}/-{hk.n_del})"
-        logger.debug("_apply_hunks() called")
             if hk.preview:
                 text += f"  |  {hk.preview}"
             item = QtWidgets.QListWidgetItem(text)
@@ -755,7 +731,6 @@ logger.debug("_pick_marker_range_if_needed() called")
                 new_right = out
 
             # Lock markers alleen bij “geselecteerd toepassen”
-                            logger.debug("_compose_new_file_lines() called")
             if (
                 getattr(self.ui, "chkLockMarkers", None)
                 and self.ui.chkLockMarkers.isChecked()
@@ -808,7 +783,6 @@ logger.debug("_pick_marker_range_if_needed() called")
                 self._error_box(
                     "Markers niet gevonden",
                     "Er is geen geldig marker-bereik om te vervangen/verwijderen.",
-                logger.debug("_on_dry_run() called")
                 )
                 return None
 
@@ -843,7 +817,6 @@ logger.debug("_pick_marker_range_if_needed() called")
         proposed_right_text = (
             self.ui.txtHuidig.toPlainText()
             if hasattr(self.ui, "txtHuidig")
-        logger.debug("_on_save() called")
             else st.huidig_blok
         )
         if st.actie == "ADD" and not proposed_right_text.strip():
@@ -915,7 +888,6 @@ logger.debug("_pick_marker_range_if_needed() called")
         )
 
         # Repo-root bepalen: voorkeur project_path uit .projassist.json, anders map van het bestand
-        logger.debug("_on_restore() called")
         repo_root = None
         if self.project_root:
             repo_root = Path(self.project_root)
@@ -925,11 +897,6 @@ logger.debug("_pick_marker_range_if_needed() called")
         else:
             repo_root = Path(st.bestand).resolve().parent
 
-        if not _git_is_repo(repo_root):
-            # Niet in een git-repo → geen push
-            self._set_status("Niet in Git-repo, push overgeslagen.")
-            return
-
         # Commit-boodschap
         blok_info = st.blok_id or (st.marker_van if st.marker_van else "")
         reden = (st.korte_reden or "").strip()
@@ -941,16 +908,37 @@ logger.debug("_pick_marker_range_if_needed() called")
             msg += f" — {reden}"
         msg += f" — {stamp}"
 
-        _git_after_save(repo_root, Path(st.bestand), msg, self.window)
+        self._set_status("Git: commit loopt op de achtergrond…")
+        _git_after_save(repo_root, Path(st.bestand), msg, self.window, self._set_status)
 
 # [END: _on_save]
 # [FUNC: _on_restore]
     def _on_restore(self) -> None:
-        """Herstel uit .bak."""
+        """Herstel: historiek uit Git (elke save is een commit), anders de .bak."""
         st = self.state
         if not st.bestand:
             self._error_box("Onbekend bestand", "Er is geen doelbestand ingesteld.")
             return
+        from handlers.history_browser import HistoryBrowser
+        from services.git_history import FileHistory
+
+        try:
+            history = FileHistory(st.bestand)
+        except ValueError:
+            self._restore_from_bak()
+            return
+        if self._history_dlg is not None:
+            self._history_dlg.close()
+        self._history_dlg = HistoryBrowser(
+            history, self.window, self._show_revision_diff, self._restore_revision
+        )
+        self._history_dlg.show()
+
+# [END: _on_restore]
+# [FUNC: _restore_from_bak]
+    def _restore_from_bak(self) -> None:
+        """Herstel uit .bak (bestanden buiten een Git-repo)."""
+        st = self.state
         bak = Path(str(st.bestand) + ".bak")
         if not bak.exists():
             self._error_box("Geen backup", f"Backup niet gevonden: {bak}")
@@ -964,6 +952,44 @@ logger.debug("_pick_marker_range_if_needed() called")
         self._set_status("Backup hersteld.")
         self._info_box("Hersteld", "De backup is succesvol teruggezet.")
 
-# [END: _on_restore]
+# [END: _restore_from_bak]
+# [FUNC: _show_revision_diff]
+    def _show_revision_diff(self, rev) -> None:
+        """Links de versie uit `rev`, rechts het huidige bestand → hunks zoals bij een formulier."""
+        history = self._history_dlg.history
+
+        def _done(text) -> None:
+            if isinstance(text, Exception):
+                self._error_box("Historiek", f"Kon versie niet lezen:\n{text}")
+                return
+            try:
+                current = history.file.read_text(encoding="utf-8")
+            except OSError:
+                current = ""
+            if hasattr(self.ui, "txtVoorstel"):
+                self.ui.txtVoorstel.setPlainText(text)
+            if hasattr(self.ui, "txtHuidig"):
+                self.ui.txtHuidig.setPlainText(current)
+            self._rebuild_hunks()
+            self._set_status(f"Diff: links {rev.short} ({rev.subject}), rechts huidig bestand.")
+
+        in_background(lambda: history.read(rev).decode("utf-8", "replace"), _done)
+
+# [END: _show_revision_diff]
+# [FUNC: _restore_revision]
+    def _restore_revision(self, rev) -> None:
+        history = self._history_dlg.history
+
+        def _done(res) -> None:
+            if isinstance(res, Exception):
+                self._error_box("Herstel mislukt", f"Kon versie niet terugzetten:\n{res}")
+                return
+            self._set_status(f"{history.file.name} hersteld naar {rev.short}.")
+            msg = f"Codewijziger: herstel {history.file.name} naar {rev.short}"
+            _git_after_save(history.root, history.file, msg, self.window, self._set_status)
+
+        in_background(lambda: history.restore(rev), _done)
+
+# [END: _restore_revision]
 # [END: CodeWijzigerController]
 
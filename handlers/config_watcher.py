@@ -0,0 +1,142 @@
+# handlers/config_watcher.py
+
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from PyQt6 import QtCore
+
+from services.config_model import ProjAssistConfig, diff_configs, load_config
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+
+DEBOUNCE_MS = 150
+
+
+# Watcher op de geladen .projassist.json
+# [CLASS: ConfigWatcher]
+class ConfigWatcher(QtCore.QObject):
+    """
+    Houdt één gedeelde, gevalideerde kopie van .projassist.json bij.
+
+    QFileSystemWatcher volgt het bestand én de projectmap (save_json vervangt
+    het bestand atomisch, en de scripts-sidecar staat ernaast). Meldingen
+    worden kort gebundeld; het parsen gebeurt op een werkthread en het
+    resultaat komt via een queued signaal terug op de GUI-thread.
+
+    Signalen:
+      changed(ProjAssistConfig, ConfigDiff) – nieuwe versie met wat er wijzigde
+      failed(str)                           – bestand ongeldig (vorige versie blijft)
+    """
+
+    changed = QtCore.pyqtSignal(object, object)
+    failed = QtCore.pyqtSignal(str)
+    _parsed = QtCore.pyqtSignal(object, object)  # (json_path, config of fout)
+
+    # [FUNC: __init__]
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.json_path: Optional[Path] = None
+        self.config: Optional[ProjAssistConfig] = None
+        self._fs = QtCore.QFileSystemWatcher(self)
+        self._fs.fileChanged.connect(self._schedule)
+        self._fs.directoryChanged.connect(self._schedule)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(DEBOUNCE_MS)
+        self._timer.timeout.connect(self._reparse)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cfgwatch")
+        self._parsed.connect(self._on_parsed)
+
+    # [END: __init__]
+
+    # [FUNC: watch]
+    def watch(self, json_path: Path, config: Optional[ProjAssistConfig] = None) -> None:
+        """Volg (een ander) project; config = reeds geladen versie (anders nu laden)."""
+        self.unwatch()
+        self.json_path = Path(json_path)
+        self.config = config or load_config(self.json_path)
+        self._fs.addPaths([str(self.json_path), str(self.json_path.parent)])
+
+    # [END: watch]
+
+    # [FUNC: unwatch]
+    def unwatch(self) -> None:
+        paths = self._fs.files() + self._fs.directories()
+        if paths:
+            self._fs.removePaths(paths)
+        self._timer.stop()
+        self.json_path = None
+        self.config = None
+
+    # [END: unwatch]
+
+    # [FUNC: stop]
+    def stop(self) -> None:
+        self.unwatch()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # [END: stop]
+
+    # [FUNC: data]
+    def data(self) -> dict:
+        """Eigen kopie van het document (leeg als er niets geladen is)."""
+        return self.config.to_dict() if self.config else {}
+
+    # [END: data]
+
+    # [FUNC: _schedule]
+    def _schedule(self, _path: str = "") -> None:
+        if self.json_path is not None:
+            self._timer.start()  # herstart: meldingen binnen DEBOUNCE_MS bundelen
+
+    # [END: _schedule]
+
+    # [FUNC: _reparse]
+    def _reparse(self) -> None:
+        jp = self.json_path
+        if jp is None:
+            return
+        # na een atomische replace volgt QFileSystemWatcher het oude inode niet meer
+        if jp.exists() and str(jp) not in self._fs.files():
+            self._fs.addPath(str(jp))
+        self._pool.submit(self._load_off_thread, jp)
+
+    # [END: _reparse]
+
+    # [FUNC: _load_off_thread]
+    def _load_off_thread(self, jp: Path) -> None:
+        try:
+            result = load_config(jp)  # gecachet: ongewijzigd bestand kost enkel stats
+        except Exception as ex:
+            result = ex
+        self._parsed.emit(jp, result)
+
+    # [END: _load_off_thread]
+
+    # [FUNC: _on_parsed]
+    def _on_parsed(self, jp: Path, result: object) -> None:
+        if jp != self.json_path:
+            return  # intussen ander project geladen
+        if isinstance(result, Exception):
+            logger.warning("Config ongeldig, vorige versie blijft actief: %s", result)
+            self.failed.emit(str(result))
+            return
+        if result is self.config:
+            return
+        diff = diff_configs(self.config, result)
+        self.config = result
+        if not diff.empty:
+            logger.debug("Config herladen: %s", diff.summary())
+            self.changed.emit(result, diff)
+
+    # [END: _on_parsed]
+
+
+# [END: ConfigWatcher]
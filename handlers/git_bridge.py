@@ -0,0 +1,168 @@
+# handlers/git_bridge.py
+
+# [SECTION: Imports]
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+from typing import Any, Callable, Optional
+
+from PyQt6 import QtCore, QtWidgets
+
+from services.git_service import GitResult, GitSaveResult
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+
+
+# Resultaten van de GitService terug naar de GUI-thread
+# [CLASS: _Relay]
+class _Relay(QtCore.QObject):
+    # emit vanuit de git-thread → queued naar de thread van dit object (GUI)
+    done = QtCore.pyqtSignal(object, object)
+
+    # [FUNC: __init__]
+    def __init__(self):
+        super().__init__()
+        self.done.connect(self._deliver)
+
+    # [END: __init__]
+
+    # [FUNC: _deliver]
+    def _deliver(self, callback: Callable[[Any], None], result: Any) -> None:
+        try:
+            callback(result)
+        except Exception:
+            logger.exception("Git-callback faalde")
+
+    # [END: _deliver]
+
+
+# [END: _Relay]
+
+
+_relay: Optional[_Relay] = None
+
+
+# [FUNC: _get_relay]
+def _get_relay() -> _Relay:
+    global _relay
+    if _relay is None:
+        _relay = _Relay()
+        app = QtCore.QCoreApplication.instance()
+        if app is not None and _relay.thread() is not app.thread():
+            _relay.moveToThread(app.thread())
+    return _relay
+
+# [END: _get_relay]
+
+
+# [FUNC: on_gui]
+def on_gui(future: concurrent.futures.Future, callback: Callable[[Any], None]) -> None:
+    """Roep callback(resultaat) op de GUI-thread aan zodra de git-future klaar is."""
+    relay = _get_relay()
+
+    def _done(f: concurrent.futures.Future) -> None:
+        try:
+            result = f.result()
+        except Exception as ex:  # loop gestopt, onverwachte fout
+            result = GitSaveResult([GitResult(("?",), -1, "", f"git error: {ex}")])
+        relay.done.emit(callback, result)
+
+    future.add_done_callback(_done)
+
+# [END: on_gui]
+
+
+_background: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+# [FUNC: in_background]
+def in_background(fn: Callable[[], Any], callback: Callable[[Any], None]) -> None:
+    """
+    Blokkerende git-code (git_ops.*) buiten de GUI-thread uitvoeren;
+    callback(resultaat of Exception) volgt op de GUI-thread.
+    """
+    global _background
+    if _background is None:
+        _background = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="git-bg")
+    relay = _get_relay()
+
+    def _done(f: concurrent.futures.Future) -> None:
+        try:
+            result = f.result()
+        except Exception as ex:
+            result = ex
+        relay.done.emit(callback, result)
+
+    _background.submit(fn).add_done_callback(_done)
+
+# [END: in_background]
+
+
+# [FUNC: report_save]
+def report_save(
+    future: concurrent.futures.Future,
+    parent: Optional[QtWidgets.QWidget],
+    status: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Standaardmelding voor een GitService.save() of GitTransaction.commit():
+    gelukt (of niets te committen) → enkel een statusregel; echte fout →
+    info-box. Geen repo of niets aangeboden → stil.
+    """
+
+    def _show(res: GitSaveResult) -> None:
+        if res.no_repo or not (res.steps or res.skipped):
+            return
+        if res.ok or res.nothing_to_commit:
+            if status is not None:
+                status(res.summary())
+            return
+        QtWidgets.QMessageBox.information(parent, "Git", res.summary())
+
+    on_gui(future, _show)
+
+# [END: report_save]
+
+
+# [FUNC: watch_push_status]
+def watch_push_status(callback: Callable[[Any], None]) -> Callable[[], None]:
+    """
+    Volg de PushQueue op de GUI-thread: callback(PushStatus) bij elke
+    statuswijziging (ingepland, bezig, gelukt, opnieuw, mislukt).
+    Retourneert een functie om weer af te melden.
+    """
+    from services.push_queue import get_push_queue
+
+    relay = _get_relay()
+    queue = get_push_queue()
+
+    def _listener(status: Any) -> None:
+        relay.done.emit(callback, status)
+
+    queue.add_listener(_listener)
+    return lambda: queue.remove_listener(_listener)
+
+# [END: watch_push_status]
+
+
+# [FUNC: watch_git_queue]
+def watch_git_queue(callback: Callable[[Any], None]) -> Callable[[], None]:
+    """
+    Volg de git-wachtrij op de GUI-thread: callback((root, diepte)) telkens een
+    bewerking op een repo instapt of klaar is. Retourneert een afmeldfunctie.
+    """
+    from services.git_service import get_git_service
+
+    relay = _get_relay()
+    locks = get_git_service().locks
+
+    def _listener(root: Any, depth: int) -> None:
+        relay.done.emit(callback, (root, depth))
+
+    locks.add_listener(_listener)
+    return lambda: locks.remove_listener(_listener)
+
+# [END: watch_git_queue]
@@ -0,0 +1,138 @@
+# handlers/history_browser.py
+
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+from typing import Callable, List
+
+from PyQt6 import QtCore, QtWidgets
+
+from handlers.git_bridge import in_background
+from services.git_history import FileHistory, Revision
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+
+
+# Historiek van één bestand: lijst met commits, lazy per pagina
+# [CLASS: HistoryBrowser]
+class HistoryBrowser(QtWidgets.QDialog):
+    """
+    Niet-modaal venster met de commits van één bestand. De eerste pagina komt
+    meteen; volgende pagina's pas bij scrollen naar het einde (of "Meer laden").
+    Diff en herstel gaan terug naar de aanroeper (Codewijziger).
+    """
+
+    # [FUNC: __init__]
+    def __init__(
+        self,
+        history: FileHistory,
+        parent: QtWidgets.QWidget | None,
+        on_diff: Callable[[Revision], None],
+        on_restore: Callable[[Revision], None],
+    ):
+        super().__init__(parent)
+        self.history = history
+        self._on_diff = on_diff
+        self._on_restore = on_restore
+        self._loading = False
+
+        self.setWindowTitle(f"Historiek: {history.rel}")
+        self.resize(720, 480)
+        lay = QtWidgets.QVBoxLayout(self)
+        self.list = QtWidgets.QListWidget(self)
+        self.list.itemDoubleClicked.connect(lambda _it: self._diff())
+        self.list.verticalScrollBar().valueChanged.connect(self._maybe_load_more)
+        lay.addWidget(self.list)
+        self.lblStatus = QtWidgets.QLabel("", self)
+        lay.addWidget(self.lblStatus)
+
+        row = QtWidgets.QHBoxLayout()
+        self.btnMore = QtWidgets.QPushButton("Meer laden", self)
+        self.btnMore.clicked.connect(self.load_more)
+        btn_diff = QtWidgets.QPushButton("Diff met huidig", self)
+        btn_diff.clicked.connect(self._diff)
+        btn_restore = QtWidgets.QPushButton("Herstel naar deze versie", self)
+        btn_restore.clicked.connect(self._restore)
+        btn_close = QtWidgets.QPushButton("Sluiten", self)
+        btn_close.clicked.connect(self.close)
+        for b in (self.btnMore, btn_diff, btn_restore):
+            row.addWidget(b)
+        row.addStretch(1)
+        row.addWidget(btn_close)
+        lay.addLayout(row)
+
+        self.load_more()
+
+    # [END: __init__]
+
+    # [FUNC: load_more]
+    def load_more(self) -> None:
+        if self._loading or self.history.exhausted:
+            return
+        self._loading = True
+        self.lblStatus.setText("Historiek laden…")
+        in_background(self.history.load_more, self._on_page)
+
+    # [END: load_more]
+
+    # [FUNC: _on_page]
+    def _on_page(self, page: List[Revision] | Exception) -> None:
+        self._loading = False
+        if isinstance(page, Exception):
+            self.lblStatus.setText(f"Fout bij laden: {page}")
+            return
+        for rev in page:
+            item = QtWidgets.QListWidgetItem(rev.label())
+            item.setToolTip(f"{rev.sha}\n{rev.author}\n{rev.path}")
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, rev)
+            self.list.addItem(item)
+        n = len(self.history.revisions)
+        done = self.history.exhausted
+        self.btnMore.setEnabled(not done)
+        self.lblStatus.setText(f"{n} versie(s){'' if done else ' (scroll voor meer)'}")
+
+    # [END: _on_page]
+
+    # [FUNC: _maybe_load_more]
+    def _maybe_load_more(self, value: int) -> None:
+        bar = self.list.verticalScrollBar()
+        if value >= bar.maximum() - 2:
+            self.load_more()
+
+    # [END: _maybe_load_more]
+
+    # [FUNC: _selected]
+    def _selected(self) -> Revision | None:
+        item = self.list.currentItem()
+        return item.data(QtCore.Qt.ItemDataRole.UserRole) if item else None
+
+    # [END: _selected]
+
+    # [FUNC: _diff]
+    def _diff(self) -> None:
+        rev = self._selected()
+        if rev is not None:
+            self._on_diff(rev)
+
+    # [END: _diff]
+
+    # [FUNC: _restore]
+    def _restore(self) -> None:
+        rev = self._selected()
+        if rev is None:
+            return
+        answer = QtWidgets.QMessageBox.question(
+            self,
+            "Herstellen",
+            f"{self.history.file.name} terugzetten naar {rev.short}?\n\n{rev.subject}",
+        )
+        if answer == QtWidgets.QMessageBox.StandardButton.Yes:
+            self._on_restore(rev)
+
+    # [END: _restore]
+
+
+# [END: HistoryBrowser]
@@ -1,54 +1,22 @@
 # handlers/marker_normalizer.py
-import logging
 from __future__ import annotations
+
+import logging
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Callable, Dict, Any
-import re, shutil, datetime, ast, json
+from typing import List, Optional, Tuple, Callable, Dict, Any, Iterable, Iterator
+import re, shutil, datetime, json, os, tempfile, difflib, threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6 import QtWidgets
+from handlers.git_bridge import report_save
+from services.config_model import load_config
+from services.git_service import get_git_service
+from services.paths import resolved_root, to_rel_posix
+from services.symbol_cache import SymbolCache, collect_python, get_cache
 
-
-# [SECTION: GIT HELPERS]
-def _run_git(args: List[str], cwd: Path) -> tuple[int, str, str]:
-logger.debug("_run_git() called")
-    import subprocess
 logger = logging.getLogger(__name__)
 
-    p = subprocess.run(args, cwd=str(cwd), capture_output=True, text=True, shell=False)
-    return p.returncode, p.stdout.strip(), p.stderr.strip()
-
-    logger.debug("_git_is_repo() called")
-
-def _git_is_repo(cwd: Path) -> bool:
-    rc, out, _ = _run_git(["git", "rev-parse", "--is-inside-work-tree"], cwd)
-    return rc == 0 and (out.lower() == "true")
-
-
-def _git_after_save_batch(
-    logger.debug("_git_after_save_batch() called")
-    cwd: Path, target_paths: List[Path], msg: str
-) -> tuple[bool, str]:
-    # add → commit → push; return (ok, detail)
-    rels: List[str] = []
-    for p in target_paths:
-        try:
-            rels.append(str(Path(p).resolve().relative_to(cwd.resolve())))
-        except Exception:
-            rels.append(str(Path(p).name))
-    rc, _, err = _run_git(["git", "add", *rels], cwd)
-    if rc != 0:
-        return False, f"git add faalde: {err}"
-    rc, _, err = _run_git(["git", "commit", "-m", msg], cwd)
-    if rc != 0:
-        # niets te committen is geen echte fout
-        return False, err or "niets te committen"
-    rc, out, err = _run_git(["git", "push"], cwd)
-    if rc != 0:
-        return False, err or out
-    return True, "Wijzigingen gecommit en gepusht."
-
-
-# [END: GIT HELPERS]
 
 # =========================================================
 # Marker-dialect per type
@@ -98,7 +66,6 @@ EXT_SLASHES = {
     ".php",
 }
 EXT_REM = {".bat", ".cmd"}
-logger.debug("_dialect_for_ext() called")
 EXT_XML = {".xml", ".ui", ".html", ".htm", ".xhtml"}
 
 
@@ -114,19 +81,15 @@ def _dialect_for_ext(ext: str) -> Tuple[str, str]:
         return LINE_COMMENT_PREFIXES["hash"]
     return LINE_COMMENT_PREFIXES["hash"]
 
-    logger.debug("_mk_section_begin() called")
 
 # =========================================================
 # Marker-helpers
-logger.debug("_mk_end() called")
 # =========================================================
 def _mk_section_begin(title: str, prefix: str, suffix: str) -> str:
     return f"{prefix}[SECTION: {title}]{suffix}"
-    logger.debug("_mk_func_begin() called")
 
 
 def _mk_end(name: str, prefix: str, suffix: str) -> str:
-logger.debug("_mk_class_begin() called")
     return f"{prefix}[END: {name}]{suffix}"
 
 
@@ -148,16 +111,13 @@ CLEAN_MARKER_LINE = re.compile(
 CLEAN_REGIONS = re.compile(
     r"^\s*(?:#\s*region\b|#\s*endregion\b|//\s*region\b|//\s*endregion\b|;\s*region\b|;\s*endregion\b|REM\s+region\b|REM\s+endregion\b).*$",
     re.IGNORECASE,
-    logger.debug("add() called")
 )
 CLEAN_DECOR = re.compile(r"^\s*#?\s*[-=]{3,}.*$", re.IGNORECASE)
 
 
-logger.debug("_ts() called")
 @dataclass
 class StepLog:
     steps: List[str]
-logger.debug("_backup_file() called")
 
     def add(self, msg: str) -> None:
         self.steps.append(msg)
@@ -172,8 +132,7 @@ def _backup_file(src: Path, project_root: Optional[Path], log: StepLog) -> Path:
         dst_dir = src.parent / "backup" / _ts()
     else:
         try:
-            rel = src.resolve().relative_to(project_root.resolve())
-        logger.debug("_remove_old_markers() called")
+            rel = Path(to_rel_posix(project_root, src))
         except Exception:
             rel = Path(src.name)
         dst_dir = project_root / "backup" / _ts() / rel.parent
@@ -184,15 +143,10 @@ def _backup_file(src: Path, project_root: Optional[Path], log: StepLog) -> Path:
     return dst
 
 
-def _remove_old_markers(lines: List[str], log: StepLog) -> List[str]:
+def _remove_old_markers(lines: Iterable[str], log: StepLog) -> List[str]:
     cleaned, removed = [], 0
     for ln in lines:
-        if (
-    logger.debug("_insert_line() called")
-            CLEAN_MARKER_LINE.match(ln)
-            or CLEAN_REGIONS.match(ln)
-            or CLEAN_DECOR.match(ln)
-        ):
+        if _is_marker_line(ln):
             removed += 1
         else:
             cleaned.append(ln)
@@ -200,143 +154,339 @@ def _remove_old_markers(lines: List[str], log: StepLog) -> List[str]:
     return cleaned
 
 
-def _insert_line(lines: List[str], idx: int, text: str) -> None:
-logger.debug("_py_node_start_lineno() called")
-    if idx < 0:
-        idx = 0
-    if idx > len(lines):
-        idx = len(lines)
-    if not text.endswith("\n"):
-        text += "\n"
-    lines.insert(idx, text)
-        logger.debug("_py_node_end_lineno() called")
+def _iter_merged(
+    lines: List[str], inserts: List[Tuple[int, int, str]]
+) -> Iterator[str]:
+    """
+    Voeg markers in met één lineaire merge van de gesorteerde insert-lijst en
+    de regelstroom (i.p.v. list.insert per marker). Bij gelijke positie komen
+    END-markers vóór BEGIN-markers, zoals bij de vroegere insert-volgorde.
+    """
+    n = len(lines)
+    order = sorted(
+        (min(max(idx, 0), n), -prio, -k, text)
+        for k, (idx, prio, text) in enumerate(inserts)
+    )
+    j = 0
+    last = "\n"
+    for i in range(n + 1):
+        while j < len(order) and order[j][0] == i:
+            if not last.endswith("\n"):
+                yield "\n"
+            text = order[j][3]
+            last = text if text.endswith("\n") else text + "\n"
+            yield last
+            j += 1
+        if i < n:
+            last = lines[i]
+            yield last
+
+
+# Regeleinde bij het schrijven (tekstmodus: "\n" → platform-einde, zoals altijd);
+# preview_markers rekent met hetzelfde einde, zodat CRLF op Windows gelijk blijft.
+_NEWLINE = os.linesep
+
+
+def _write_atomic(path: Path, chunks: Iterable[str]) -> None:
+    """Schrijf incrementeel naar een tempfile naast `path` en vervang daarna atomisch."""
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline=_NEWLINE) as fh:
+            fh.writelines(chunks)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
 
 
 # =========================================================
-logger.debug("last_line() called")
-# Python analyse (AST) + main/imports
+# Tokenizer voor accolade-talen (PowerShell / shell / C-familie)
 # =========================================================
-def _py_node_start_lineno(node: ast.AST) -> int:
-    if isinstance(
-        node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
-    ) and getattr(node, "decorator_list", None):
-        return min(d.lineno for d in node.decorator_list)  # type: ignore[attr-defined]
-    return getattr(node, "lineno", 1)
-
-
-def _py_node_end_lineno(node: ast.AST) -> int:
-    end_ln = getattr(node, "end_lineno", None)
-    if isinstance(end_ln, int):
-        return end_ln
-    logger.debug("_py_find_import_block() called")
-
-    def last_line(n: ast.AST) -> int:
-        v = getattr(n, "end_lineno", None)
-        if isinstance(v, int):
-            return v
-        for attr in ("body", "orelse", "finalbody"):
-            seq = getattr(n, attr, None)
-            if isinstance(seq, list) and seq:
-                return last_line(seq[-1])
-        return getattr(n, "lineno", 1)
-
-    return last_line(node)
-
-
-def _py_find_import_block(lines: List[str]) -> Optional[Tuple[int, int]]:
-    first = last = None
-    paren_depth = 0
-    cont = False
-    in_block = False
-    for i, ln in enumerate(lines):
-        is_import = bool(re.match(r"^\s*(import\s+\w|from\s+\w)", ln))
-        if not in_block:
-            if is_import:
-                first = last = i
-                in_block = True
-                paren_depth = ln.count("(") - ln.count(")")
-                cont = ln.rstrip().endswith("\\")
-            continue
-                logger.debug("_py_collect() called")
-        if is_import or paren_depth > 0 or cont:
-            last = i
-            paren_depth += ln.count("(") - ln.count(")")
-            cont = ln.rstrip().endswith("\\")
+# Eén lineaire pass per bestand: accolades, haakjes en ';' worden alleen
+# geteld in code, niet in strings, commentaar, here-docs of here-strings.
+LEX_C = "c"
+LEX_PS = "ps"
+LEX_SH = "sh"
+
+_ST_CODE = 0
+_ST_STRING = 1  # '...' / "..." (escape-teken per taal)
+_ST_BLOCK = 2  # /* ... */ of <# ... #>
+_ST_TEMPLATE = 3  # JS/TS `...${expr}...`
+_ST_RAW = 4  # Go `...`
+_ST_TRIPLE = 5  # """...""" (Kotlin/Swift/Java/C#)
+_ST_VERBATIM = 6  # C# @"..."
+_ST_HEREDOC = 7  # sh <<EOF / ps @" ... "@
+
+_LEX_SPECIAL = {
+    LEX_C: re.compile(r"[{}();\"'`/]"),
+    LEX_PS: re.compile(r"[{}();\"'#<@`]"),
+    LEX_SH: re.compile(r"[{}();\"'`#<\\]"),
+}
+_LEX_SPECIAL_PHP = re.compile(r"[{}();\"'`/#]")
+# Extensies waar '...' een echte string is (anders: char-literal of lifetime)
+_C_SQ_STRING_EXTS = {".js", ".mjs", ".cjs", ".ts", ".tsx", ".jsx", ".php"}
+_C_TEMPLATE_EXTS = {".js", ".mjs", ".cjs", ".ts", ".tsx", ".jsx"}
+_C_TRIPLE_EXTS = {".kt", ".swift", ".java", ".cs"}
+# JS/TS: '/' na een operator, haakje of sleutelwoord opent een regex-literal
+_JS_REGEX_PREV = re.compile(
+    r"(?:^|[(,=:\[!&|?{};+\-*%<>~^]|\b(?:return|typeof|case|in|of|yield|await|void|delete|new))\s*$"
+)
+_C_CHAR_LIT = re.compile(r"'(?:\\u\{[0-9A-Fa-f]+\}|\\.[^']{0,7}|[^\\'\n])'")
+_SH_HEREDOC = re.compile(r"<<(-?)\s*(['\"]?)([A-Za-z_][\w.-]*)\2")
+_STRING_END = {
+    ('"', "\\"): re.compile(r'\\.|"'),
+    ("'", "\\"): re.compile(r"\\.|'"),
+    ("`", "\\"): re.compile(r"\\.|`"),
+    ('"', "`"): re.compile(r'`.|"'),
+    ("'", ""): re.compile(r"'"),
+}
+_TEMPLATE_END = re.compile(r"\\.|`|\$\{")
+_VERBATIM_END = re.compile(r'""|"')
+
+
+def _js_regex_end(ln: str, p: int) -> Optional[int]:
+    """
+    Einde (na de vlaggen) van een JS/TS regex-literal die op p begint, of None
+    als '/' hier een deling is. Een '/' binnen [...] sluit de regex niet.
+    """
+    if not _JS_REGEX_PREV.search(ln, 0, p):
+        return None
+    in_class = False
+    j, size = p + 1, len(ln)
+    while j < size:
+        c = ln[j]
+        if c == "\\":
+            j += 2
             continue
-        if ln.strip() == "":
-            last = i
-            cont = False
+        if c in "\r\n":
+            return None
+        if in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "/":
+            j += 1
+            while j < size and (ln[j].isalnum() or ln[j] == "_"):
+                j += 1
+            return j
+        j += 1
+    return None
+
+
+@dataclass
+class BraceScan:
+    code_start: List[bool]  # regel begint in code (niet in string/commentaar/here-doc)
+    depth: List[int]  # accolade-diepte bij het begin van de regel
+    paren_end: List[int]  # haakjes-diepte aan het einde van de regel
+    ev_line: List[int]  # events in code: regelnummer ...
+    ev_kind: List[str]  # ... en soort: '{', '}' of ';'
+    close_of: Dict[int, int]  # event-index van '{' -> regel van bijhorende '}'
+    first_event: List[int]  # per regel: index van het eerste event op/na die regel
+
+
+def _scan_braces(lines: List[str], family: str, ext: str = "") -> BraceScan:
+    n = len(lines)
+    code_start = [True] * n
+    depth_at = [0] * n
+    paren_end = [0] * n
+    ev_line: List[int] = []
+    ev_kind: List[str] = []
+    close_of: Dict[int, int] = {}
+    stack: List[int] = []  # open '{'-events
+    tmpl: List[int] = []  # accolade-tellers binnen JS ${...}
+    paren = 0
+    state = _ST_CODE
+    string_end: Optional[re.Pattern] = None
+    block_end = ""
+    here_queue: List[Tuple[str, bool]] = []  # sh: wachtende here-doc terminators
+    here_end, here_strip = "", False
+
+    is_c = family == LEX_C
+    special = _LEX_SPECIAL_PHP if ext == ".php" else _LEX_SPECIAL[family]
+    sq_string = not is_c or ext in _C_SQ_STRING_EXTS
+    multiline_strings = not is_c
+    str_escape = "`" if family == LEX_PS else "\\"
+
+    for i, ln in enumerate(lines):
+        depth_at[i] = len(stack)
+        if state == _ST_HEREDOC:
+            code_start[i] = False
+            body = ln.rstrip("\r\n")
+            if here_strip:
+                body = body.lstrip("\t")
+            if body == here_end or (family == LEX_PS and body.startswith(here_end)):
+                if here_queue:
+                    here_end, here_strip = here_queue.pop(0)
+                else:
+                    state = _ST_CODE
+            paren_end[i] = paren
             continue
-        break
-    if first is None:
-        return None
-    return (first, last if last is not None else first)
 
+        code_start[i] = state == _ST_CODE
+        pos, size = 0, len(ln)
+        while pos < size:
+            if state == _ST_CODE:
+                m = special.search(ln, pos)
+                if not m:
+                    break
+                p = m.start()
+                ch = ln[p]
+                pos = p + 1
+                if ch == "{":
+                    if tmpl:
+                        tmpl[-1] += 1
+                    else:
+                        stack.append(len(ev_line))
+                        ev_line.append(i)
+                        ev_kind.append("{")
+                elif ch == "}":
+                    if tmpl:
+                        if tmpl[-1] == 0:
+                            tmpl.pop()
+                            state = _ST_TEMPLATE
+                        else:
+                            tmpl[-1] -= 1
+                    else:
+                        ev_line.append(i)
+                        ev_kind.append("}")
+                        if stack:
+                            close_of[stack.pop()] = i
+                elif ch == "(":
+                    paren += 1
+                elif ch == ")":
+                    paren = max(0, paren - 1)
+                elif ch == ";":
+                    ev_line.append(i)
+                    ev_kind.append(";")
+                elif ch == '"':
+                    if is_c and ext in _C_TRIPLE_EXTS and ln.startswith('"""', p):
+                        state, pos = _ST_TRIPLE, p + 3
+                    elif ext == ".cs" and p > 0 and ln[p - 1] == "@":
+                        state = _ST_VERBATIM
+                    else:
+                        state, string_end = _ST_STRING, _STRING_END[('"', str_escape)]
+                elif ch == "'":
+                    if sq_string:
+                        state = _ST_STRING
+                        string_end = _STRING_END[("'", "\\" if is_c else "")]
+                    else:
+                        lit = _C_CHAR_LIT.match(ln, p)
+                        if lit:
+                            pos = lit.end()  # anders: Rust-lifetime, negeren
+                elif ch == "`":
+                    if family == LEX_SH:
+                        state, string_end = _ST_STRING, _STRING_END[("`", "\\")]
+                    elif ext in _C_TEMPLATE_EXTS:
+                        state = _ST_TEMPLATE
+                    elif ext == ".go":
+                        state = _ST_RAW
+                    # PowerShell: escape-teken in code
+                    elif family == LEX_PS:
+                        pos = p + 2
+                elif ch == "/":
+                    nxt = ln[p + 1 : p + 2]
+                    if nxt == "/":
+                        break
+                    if nxt == "*":
+                        state, block_end, pos = _ST_BLOCK, "*/", p + 2
+                    elif ext in _C_TEMPLATE_EXTS:
+                        end = _js_regex_end(ln, p)
+                        if end is not None:
+                            pos = end
+                elif ch == "#":
+                    if family != LEX_SH or p == 0 or ln[p - 1] in " \t;&|(":
+                        break
+                elif ch == "<":
+                    if family == LEX_PS and ln.startswith("<#", p):
+                        state, block_end, pos = _ST_BLOCK, "#>", p + 2
+                    elif family == LEX_SH and not ln.startswith("<<<", p):
+                        hd = _SH_HEREDOC.match(ln, p)
+                        if hd:
+                            here_queue.append((hd.group(3), hd.group(1) == "-"))
+                            pos = hd.end()
+                elif ch == "@":
+                    quote = ln[p + 1 : p + 2]
+                    if quote in ("'", '"') and not ln[p + 2 :].strip():
+                        here_queue.append((quote + "@", False))
+                        break
+                elif ch == "\\":
+                    pos = p + 2
+            elif state == _ST_STRING:
+                m = string_end.search(ln, pos)
+                if not m:
+                    break
+                pos = m.end()
+                if m.end() - m.start() == 1:
+                    state = _ST_CODE
+            elif state == _ST_BLOCK:
+                j = ln.find(block_end, pos)
+                if j < 0:
+                    break
+                state, pos = _ST_CODE, j + len(block_end)
+            elif state == _ST_TEMPLATE:
+                m = _TEMPLATE_END.search(ln, pos)
+                if not m:
+                    break
+                pos = m.end()
+                if m.group() == "`":
+                    state = _ST_CODE
+                elif m.group() == "${":
+                    tmpl.append(0)
+                    state = _ST_CODE
+            elif state == _ST_RAW:
+                j = ln.find("`", pos)
+                if j < 0:
+                    break
+                state, pos = _ST_CODE, j + 1
+            elif state == _ST_TRIPLE:
+                j = ln.find('"""', pos)
+                if j < 0:
+                    break
+                state, pos = _ST_CODE, j + 3
+            elif state == _ST_VERBATIM:
+                m = _VERBATIM_END.search(ln, pos)
+                if not m:
+                    break
+                pos = m.end()
+                if m.group() == '"':
+                    state = _ST_CODE
+
+        if state == _ST_STRING and not multiline_strings:
+            state = _ST_CODE  # C-achtige strings lopen niet door over regels
+        if state == _ST_CODE and here_queue:
+            here_end, here_strip = here_queue.pop(0)
+            state = _ST_HEREDOC
+        paren_end[i] = paren
+
+    for k in stack:  # niet-gesloten blokken lopen tot het einde
+        close_of[k] = max(n - 1, 0)
+
+    first_event = [0] * (n + 1)
+    k = len(ev_line)
+    first_event[n] = k
+    for i in range(n - 1, -1, -1):
+        while k > 0 and ev_line[k - 1] >= i:
+            k -= 1
+        first_event[i] = k
+    return BraceScan(
+        code_start, depth_at, paren_end, ev_line, ev_kind, close_of, first_event
+    )
 
-def _py_collect(src_text: str):
-    lines = src_text.splitlines(keepends=True)
-    tree = ast.parse(src_text)
-    logger.debug("_find_main_guard() called")
-    functions: List[Tuple[str, int, int]] = []
-    classes: List[Tuple[str, int, int, List[Tuple[str, int, int]]]] = []
-    for node in tree.body:
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            s = _py_node_start_lineno(node)
-            e = _py_node_end_lineno(node)
-            functions.append((node.name, s, e))
-        elif isinstance(node, ast.ClassDef):
-            cs = _py_node_start_lineno(node)
-            ce = _py_node_end_lineno(node)
-            methods: List[Tuple[str, int, int]] = []
-            for sub in node.body:
-                if isinstance(sub, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    ms = _py_node_start_lineno(sub)
-                    me = _py_node_end_lineno(sub)
-                    methods.append((sub.name, ms, me))
-            classes.append((node.name, cs, ce, methods))
-
-    def _find_main_guard(lines: List[str]) -> Optional[Tuple[int, int]]:
-        start = None
-        for i, ln in enumerate(lines):
-            if re.match(r'^\s*if\s+__name__\s*==\s*[\'"]__main__[\'"]\s*:\s*$', ln):
-                start = i
-                break
-        if start is None:
-            return None
-        end = len(lines) - 1
-        for j in range(start + 1, len(lines)):
-            if re.match(r"^\s*(def|class)\b", lines[j]):
-                end = j - 1
-            logger.debug("_scan_block_braces() called")
-                break
-        return (start, end)
 
-    imp = _py_find_import_block(lines)
-    mg = _find_main_guard(lines)
-    return {
-        "imports": imp,
-        "functions": functions,
-        "classes": classes,
-        "main_guard": mg,
-    }
+def _block_on_line(scan: BraceScan, line: int) -> Optional[int]:
+    """Sluitregel van het eerste blok dat op `line` opent (None als er geen is)."""
+    k = scan.first_event[line]
+    while k < len(scan.ev_line) and scan.ev_line[k] == line:
+        if scan.ev_kind[k] == "{":
+            return scan.close_of[k]
+        k += 1
+    return None
 
-    logger.debug("_ps_collect() called")
 
 # =========================================================
 # PowerShell / Bash / Batch / Generic
 # =========================================================
-def _scan_block_braces(lines: List[str], start_idx: int) -> int:
-    depth = 0
-    started = False
-    for i in range(start_idx, len(lines)):
-        depth += lines[i].count("{")
-        if lines[i].count("{"):
-            started = True
-        depth -= lines[i].count("}")
-        if started and depth <= 0:
-            return i
-    return start_idx
-
 
 def _ps_collect(lines: List[str]):
     funcs: List[Tuple[str, int, int]] = []
@@ -363,22 +513,22 @@ def _ps_collect(lines: List[str]):
                 break
     if first is not None:
         imports = (first, last if last is not None else first)
+    scan = _scan_braces(lines, LEX_PS)
     i = 0
     while i < len(lines):
         ln = lines[i]
+        if not scan.code_start[i]:
+            i += 1
+            continue
         m_fun = re.match(r"^\s*function\s+([A-Za-z0-9_:-]+)\s*\{", ln, re.IGNORECASE)
         m_cls = re.match(r"^\s*class\s+([A-Za-z0-9_]+)\s*\{", ln, re.IGNORECASE)
-        if m_fun:
-            name = m_fun.group(1)
-        logger.debug("_sh_collect() called")
-            end = _scan_block_braces(lines, i)
-            funcs.append((name, i + 1, end + 1))
+        end = _block_on_line(scan, i) if (m_fun or m_cls) else None
+        if m_fun and end is not None:
+            funcs.append((m_fun.group(1), i + 1, end + 1))
             i = end + 1
             continue
-        if m_cls:
-            name = m_cls.group(1)
-            end = _scan_block_braces(lines, i)
-            classes.append((name, i + 1, end + 1))
+        if m_cls and end is not None:
+            classes.append((m_cls.group(1), i + 1, end + 1))
             i = end + 1
             continue
         i += 1
@@ -407,27 +557,162 @@ def _sh_collect(lines: List[str]):
                 r"^\s*function\s+\w+\s*\{", ln
             ):
                 break
-            logger.debug("_bat_collect() called")
             if not re.match(r"^\s*(source\s+\S+|\.\s+\S+)\b", ln):
                 break
     if first is not None:
         imports = (first, last if last is not None else first)
+    scan = _scan_braces(lines, LEX_SH)
     i = 0
     while i < len(lines):
         ln = lines[i]
+        if not scan.code_start[i]:
+            i += 1
+            continue
         m1 = re.match(r"^\s*([A-Za-z_]\w*)\s*\(\s*\)\s*\{", ln)
         m2 = re.match(r"^\s*function\s+([A-Za-z_]\w*)\s*\{", ln)
-        if m1 or m2:
-            name = (m1 or m2).group(1)
-            end = _scan_block_braces(lines, i)
-            funcs.append((name, i + 1, end + 1))
+        end = _block_on_line(scan, i) if (m1 or m2) else None
+        if end is not None:
+            funcs.append(((m1 or m2).group(1), i + 1, end + 1))
             i = end + 1
             continue
         i += 1
-            logger.debug("_generic_import_block() called")
     return {"imports": imports, "functions": funcs, "classes": []}
 
 
+# C-familie (JS/TS/Java/C#/C/C++/Go/Rust/Kotlin/Swift/PHP)
+_C_NAMESPACE = re.compile(
+    r"^\s*(?:export\s+)?(?:declare\s+)?(?:namespace|module)\s+[\w$.:\"']*\s*\{?\s*$"
+    r"|^\s*namespace\s*\{\s*$|^\s*extern\s+\"C\"\s*\{\s*$"
+)
+_C_CLASS = re.compile(
+    r"^\s*(?:(?:export|default|declare|public|private|protected|internal|abstract|"
+    r"sealed|static|final|partial|open|data|readonly|unsafe|pub(?:\([\w\s]+\))?)\s+)*"
+    r"(?:enum\s+)?(?:class|interface|struct|enum|record|trait|object)\s+"
+    r"(?P<name>[A-Za-z_$][\w$]*)"
+    r"|^\s*type\s+(?P<goname>[A-Za-z_]\w*)\s+(?:struct|interface)\b"
+    r"|^\s*impl(?:<[^>]*>)?\s+(?P<impl>[^{]+?)\s*(?:where\b[^{]*)?\{?\s*$"
+)
+_C_FUNC_PATTERNS = [
+    # function/func/fn/fun-sleutelwoord (JS, PHP, Go, Rust, Kotlin, Swift)
+    re.compile(
+        r"^\s*(?:(?:export|default|async|public|private|protected|internal|static|"
+        r"final|abstract|override|open|suspend|inline|mutating|unsafe|extern|const|"
+        r"pub(?:\([\w\s]+\))?)\s+)*"
+        r"(?:function\s*\*?|func|fn|fun)\s+(?:\([^)]*\)\s*)?(?:<[^>]*>\s*)?"
+        r"(?:[\w$]+\.)?(?P<name>[A-Za-z_$][\w$]*)\s*[(<]"
+    ),
+    # JS/TS: const naam = (...) => { / function (...) {
+    re.compile(
+        r"^\s*(?:export\s+)?(?:const|let|var)\s+(?P<name>[A-Za-z_$][\w$]*)\s*"
+        r"(?::[^=]+)?=\s*(?:async\s+)?"
+        r"(?:function\b[^(]*\(|\([^()]*\)\s*(?::\s*[^=]+)?=>|[A-Za-z_$][\w$]*\s*=>)"
+    ),
+    # Getypeerde functies/methodes (Java, C#, C/C++, TS-klassemethodes)
+    re.compile(
+        r"^\s*(?:[\w$<>\[\]?,.*&:~]+\s+)*?"
+        r"(?P<name>(?:[A-Za-z_]\w*::)*~?[A-Za-z_$][\w$]*)\s*\([^()]*\)\s*"
+        r"[^;{}()=]*(?:\{[^{}]*\}\s*|\{?\s*)$"
+    ),
+]
+_C_NOT_A_FUNC = frozenset(
+    "if for while switch catch return new else do try using lock foreach "
+    "synchronized sizeof typeof with when elif function throw await yield "
+    "delete case match loop defer go unless".split()
+)
+_C_ANNOTATION = re.compile(
+    r"^\s*(?:@[\w.]+(?:\(.*\))?|\[[A-Z][\w.]*(?:\(.*\))?\]|#\[.*\])\s*$"
+)
+_C_SIGNATURE_MAX_LINES = 50
+
+
+def _c_block_at(scan: BraceScan, lines: List[str], i: int) -> Optional[int]:
+    """
+    Sluitregel van het blok dat bij de header op regel i hoort: de '{' moet op
+    het einde van de (eventueel meerregelige) signatuur staan of, Allman-stijl,
+    op de regel erna. Een ';' eerst betekent declaratie zonder body.
+    """
+    n = len(lines)
+    paren_before = scan.paren_end[i - 1] if i > 0 else 0
+    j = i
+    while (
+        j < n - 1
+        and scan.paren_end[j] > paren_before
+        and j - i < _C_SIGNATURE_MAX_LINES
+    ):
+        j += 1
+    k = scan.first_event[i]
+    if k >= len(scan.ev_line) or scan.ev_kind[k] != "{":
+        return None
+    ln = scan.ev_line[k]
+    if ln <= j or (ln == j + 1 and lines[ln].lstrip().startswith("{")):
+        return scan.close_of[k]
+    return None
+
+
+def _c_header_start(scan: BraceScan, lines: List[str], i: int) -> int:
+    # annotaties/attributen/decorators horen bij de header (zoals in Python)
+    while i > 0 and scan.code_start[i - 1] and _C_ANNOTATION.match(lines[i - 1]):
+        i -= 1
+    return i
+
+
+def _c_match_func(ln: str) -> Optional[str]:
+    for pat in _C_FUNC_PATTERNS:
+        m = pat.match(ln)
+        if m and m.group("name") not in _C_NOT_A_FUNC:
+            return m.group("name")
+    return None
+
+
+def _c_collect(lines: List[str], ext: str):
+    scan = _scan_braces(lines, LEX_C, ext)
+    functions: List[Tuple[str, int, int]] = []
+    classes: List[Tuple[str, int, int, List[Tuple[str, int, int]]]] = []
+    ns_ends: List[int] = []  # sluitregels van open namespaces (transparant)
+    cls_end = -1
+    methods: List[Tuple[str, int, int]] = []
+    for i, ln in enumerate(lines):
+        if not scan.code_start[i]:
+            continue
+        while ns_ends and i > ns_ends[-1]:
+            ns_ends.pop()
+        d = scan.depth[i] - len(ns_ends)
+        if d == 0:
+            if _C_NAMESPACE.match(ln):
+                end = _c_block_at(scan, lines, i)
+                if end is not None:
+                    ns_ends.append(end)
+                continue
+            m = _C_CLASS.match(ln)
+            if m:
+                end = _c_block_at(scan, lines, i)
+                if end is not None:
+                    name = m.group("name") or m.group("goname") or m.group("impl")
+                    methods = []
+                    start = _c_header_start(scan, lines, i)
+                    classes.append((name.strip(), start + 1, end + 1, methods))
+                    cls_end = end
+                continue
+            name = _c_match_func(ln)
+            if name:
+                end = _c_block_at(scan, lines, i)
+                if end is not None:
+                    start = _c_header_start(scan, lines, i)
+                    functions.append((name, start + 1, end + 1))
+        elif d == 1 and i <= cls_end and not _C_CLASS.match(ln):
+            name = _c_match_func(ln)
+            if name:
+                end = _c_block_at(scan, lines, i)
+                if end is not None:
+                    start = _c_header_start(scan, lines, i)
+                    methods.append((name, start + 1, end + 1))
+    return {
+        "imports": _generic_import_block(lines),
+        "functions": functions,
+        "classes": classes,
+    }
+
+
 def _bat_collect(lines: List[str]):
     funcs: List[Tuple[str, int, int]] = []
     label_lines: List[Tuple[str, int]] = []
@@ -452,7 +737,6 @@ def _generic_import_block(lines: List[str]) -> Optional[Tuple[int, int]]:
             if first is None:
                 first = i
             last = i
-    logger.debug("normalize_markers() called")
             continue
         if first is not None:
             if ln.strip() == "":
@@ -468,67 +752,62 @@ def _generic_import_block(lines: List[str]) -> Optional[Tuple[int, int]]:
 
 
 # =========================================================
-# Single-file normalizer (bestaand gedrag)
+# Detectie + inserts (gedeeld door normaliseren en dry-run)
 # =========================================================
-def normalize_markers(
-    file_path: Path,
-    project_root: Optional[Path] = None,
-    git_callback: Optional[Callable[[List[Path], str], None]] = None,
-) -> List[str]:
-    log = StepLog([])
-    file_path = Path(file_path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Bestand niet gevonden: {file_path}")
+BEGIN_PRIO = 0
+CLASS_END_PRIO = 1
+END_PRIO = 2
 
-    # Self-protectie
-    if file_path.name.lower() == "marker_normalizer.py":
-        log.add("Overgeslagen: marker_normalizer.py zelf wordt niet gemarkeerd.")
-        return log.steps
 
-    ext = file_path.suffix.lower()
-    prefix, suffix = _dialect_for_ext(ext)
-    log.add(f"Bestand: {file_path} (ext: {ext}) — dialect: {prefix.strip()}")
+def _is_marker_line(ln: str) -> bool:
+    return bool(
+        CLEAN_MARKER_LINE.match(ln) or CLEAN_REGIONS.match(ln) or CLEAN_DECOR.match(ln)
+    )
 
-    # 1) Back-up
-    _backup_file(file_path, project_root, log)
 
-    # 2) Clean
-    orig_text = file_path.read_text(encoding="utf-8-sig", errors="replace")  # strip BOM
-    lines = orig_text.splitlines(keepends=True)
-    lines = _remove_old_markers(lines, log)
+def _generic_collect(lines: List[str]) -> Dict[str, Any]:
+    return {
+        "imports": _generic_import_block(lines),
+        "functions": [],
+        "classes": [],
+        "main_guard": None,
+    }
 
-    # 3) Detectie per type
-    meta = {"imports": None, "functions": [], "classes": [], "main_guard": None}
+
+def _collector_for_ext(ext: str) -> Optional[Callable[[List[str]], Dict[str, Any]]]:
+    """Detectiefunctie per taal; None voor XML-achtige bestanden (geen injectie)."""
     if ext == ".py":
-        meta = _py_collect("".join(lines))
-    elif ext in {".ps1", ".psm1"}:
-        meta = _ps_collect(lines)
-    elif ext in {".sh", ".bash", ".zsh"}:
-        meta = _sh_collect(lines)
-    elif ext in EXT_REM:
-        meta = _bat_collect(lines)
-    elif ext in EXT_SLASHES:
-        meta["imports"] = _generic_import_block(lines)
-    elif ext in EXT_XML:
-        file_path.write_text("".join(lines), encoding="utf-8")
-        log.add(f"{ext}: alleen oude markers verwijderd (geen injectie).")
-        if git_callback:
-            try:
-                git_callback([file_path], f"Normalize markers: {file_path.name}")
-                log.add("Git: wijzigingen vastgelegd.")
-            except Exception as ex:
-                log.add(f"Git: overgeslagen/fout: {ex}")
-        log.add("Klaar.")
-        return log.steps
-    else:
-        meta["imports"] = _generic_import_block(lines)
+        return collect_python  # AST, gedeeld met codewijziger/log-injectie
+    if ext in {".ps1", ".psm1"}:
+        return _ps_collect
+    if ext in {".sh", ".bash", ".zsh"}:
+        return _sh_collect
+    if ext in EXT_REM:
+        return _bat_collect
+    if ext in EXT_SLASHES:
+        return lambda lines: _c_collect(lines, ext)
+    if ext in EXT_XML:
+        return None
+    return _generic_collect
 
-    # 4) Inserts (tie-breaker)
+
+def _collect_meta(
+    lines: List[str], ext: str, cache: Optional[SymbolCache] = None
+) -> Optional[Dict[str, Any]]:
+    """Blokken per taal, via de symboolcache als die er is (parse enkel bij nieuwe inhoud)."""
+    collect = _collector_for_ext(ext)
+    if collect is None:
+        return None
+    if cache is None:
+        return collect(lines)
+    return cache.for_lines(lines, ext, collect)
+
+
+def _build_inserts(
+    meta: Dict[str, Any], prefix: str, suffix: str
+) -> Tuple[List[Tuple[int, int, str]], int]:
     inserts: List[Tuple[int, int, str]] = []
     total_methods = 0
-    BEGIN_PRIO = 0
-    CLASS_END_PRIO = 1
-    END_PRIO = 2
 
     for cname, cstart, cend, methods in meta["classes"]:
         inserts.append((cstart - 1, BEGIN_PRIO, _mk_class_begin(cname, prefix, suffix)))
@@ -555,17 +834,89 @@ def normalize_markers(
             (s, BEGIN_PRIO, _mk_section_begin("CLI / Entrypoint", prefix, suffix))
         )
         inserts.append((e + 1, END_PRIO, _mk_end("CLI / Entrypoint", prefix, suffix)))
+    return inserts, total_methods
+
+
+# =========================================================
+# Single-file normalizer (bestaand gedrag)
+# =========================================================
+# Per bestand één schrijver tegelijk (watcher, normalize_project, knoppen):
+# vaste set RLocks op hash van het pad, dus geen groeiende lock-tabel.
+_FILE_LOCKS = [threading.RLock() for _ in range(64)]
 
-    inserts.sort(key=lambda t: (-t[0], t[1]))
-    for idx, _prio, text in inserts:
-        _insert_line(lines, idx, text)
 
-    # 6) Opslaan
-    file_path.write_text("".join(lines), encoding="utf-8")
+def file_lock(path: Path) -> threading.RLock:
+    key = os.path.normcase(os.path.abspath(path))
+    return _FILE_LOCKS[hash(key) % len(_FILE_LOCKS)]
+
+
+def normalize_markers(
+    file_path: Path,
+    project_root: Optional[Path] = None,
+    git_callback: Optional[Callable[[List[Path], str], None]] = None,
+    backup: bool = True,
+    cache: Optional[SymbolCache] = None,
+) -> List[str]:
+    with file_lock(file_path):
+        return _normalize_markers(file_path, project_root, git_callback, backup, cache)
+
+
+def _normalize_markers(
+    file_path: Path,
+    project_root: Optional[Path] = None,
+    git_callback: Optional[Callable[[List[Path], str], None]] = None,
+    backup: bool = True,
+    cache: Optional[SymbolCache] = None,
+) -> List[str]:
+    log = StepLog([])
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"Bestand niet gevonden: {file_path}")
+
+    # Self-protectie
+    if file_path.name.lower() == "marker_normalizer.py":
+        log.add("Overgeslagen: marker_normalizer.py zelf wordt niet gemarkeerd.")
+        return log.steps
+
+    ext = file_path.suffix.lower()
+    prefix, suffix = _dialect_for_ext(ext)
+    log.add(f"Bestand: {file_path} (ext: {ext}) — dialect: {prefix.strip()}")
+
+    # 1) Back-up (de watcher schakelt dit uit: hij schrijft enkel markerregels)
+    if backup:
+        _backup_file(file_path, project_root, log)
+
+    # 2) Clean (tijdens het inlezen: slechts één kopie van de regels in geheugen)
+    with file_path.open("r", encoding="utf-8-sig", errors="replace") as fh:  # strip BOM
+        lines = _remove_old_markers(fh, log)
+
+    # 3) Detectie per type (symboolcache: geen parse als deze inhoud al gekend is)
+    own_cache = cache is None and project_root is not None
+    if own_cache:
+        cache = get_cache(project_root)
+    meta = _collect_meta(lines, ext, cache)
+    if meta is None:
+        _write_atomic(file_path, lines)
+        log.add(f"{ext}: alleen oude markers verwijderd (geen injectie).")
+        if git_callback:
+            try:
+                git_callback([file_path], f"Normalize markers: {file_path.name}")
+                log.add("Git: wijzigingen vastgelegd.")
+            except Exception as ex:
+                log.add(f"Git: overgeslagen/fout: {ex}")
+        log.add("Klaar.")
+        return log.steps
+
+    # 4) Inserts (tie-breaker)
+    inserts, total_methods = _build_inserts(meta, prefix, suffix)
+
+    # 5) Merge + opslaan (incrementeel via tempfile)
+    _write_atomic(file_path, _iter_merged(lines, inserts))
+    if own_cache:
+        cache.save()
 
     # 7) Log
     log.add("Markers toegepast en bestand opgeslagen.")
-    logger.debug("_load_json() called")
     log.add(
         "Samenvatting: "
         f"imports={'ja' if meta['imports'] else 'nee'}, "
@@ -582,18 +933,182 @@ def normalize_markers(
             log.add(f"Git: overgeslagen/fout: {ex}")
 
     log.add("Klaar.")
-        logger.debug("normalize_project() called")
     return log.steps
 
 
 # =========================================================
-# Project-breed normaliseren
+# Dry-run (alleen in geheugen: geen back-up, geen write, geen git)
 # =========================================================
-def _load_json(path: Path) -> Dict[str, Any]:
+@dataclass
+class FileReport:
+    path: str
+    markers_added: int = 0
+    markers_removed: int = 0
+    markers_moved: int = 0
+    line_delta: int = 0
+    bytes_delta: int = 0
+    error: str = ""
+    diff: str = ""
+
+    @property
+    def changed(self) -> bool:
+        return bool(
+            self.markers_added
+            or self.markers_removed
+            or self.markers_moved
+            or self.line_delta
+            or self.bytes_delta
+        )
+
+
+@dataclass
+class NormalizeReport:
+    files: List[FileReport]
+
+    @property
+    def changed_files(self) -> List[FileReport]:
+        return [f for f in self.files if f.changed]
+
+    @property
+    def errors(self) -> List[FileReport]:
+        return [f for f in self.files if f.error]
+
+    @property
+    def diff(self) -> str:
+        return "".join(f.diff for f in self.files)
+
+    def summary(self) -> str:
+        rows = [
+            f"{f.path}: +{f.markers_added} -{f.markers_removed} ~{f.markers_moved} "
+            f"regels {f.line_delta:+d}, bytes {f.bytes_delta:+d}"
+            for f in self.changed_files
+        ]
+        rows += [f"{f.path}: FOUT {f.error}" for f in self.errors]
+        rows.append(
+            f"Te wijzigen: {len(self.changed_files)}/{len(self.files)} bestand(en)."
+        )
+        return "\n".join(rows)
+
+
+def _marker_anchors(lines: Iterable[str]) -> List[Tuple[str, int]]:
+    """(marker-tekst, aantal inhoudsregels ervoor) per markerregel."""
+    out: List[Tuple[str, int]] = []
+    content = 0
+    for ln in lines:
+        if _is_marker_line(ln):
+            out.append((ln.strip(), content))
+        else:
+            content += 1
+    return out
+
+
+def _marker_stats(
+    old: List[Tuple[str, int]], new: List[Tuple[str, int]]
+) -> Tuple[int, int, int]:
+    old_by: Dict[str, List[int]] = {}
+    new_by: Dict[str, List[int]] = {}
+    for text, pos in old:
+        old_by.setdefault(text, []).append(pos)
+    for text, pos in new:
+        new_by.setdefault(text, []).append(pos)
+    old_cnt = Counter({k: len(v) for k, v in old_by.items()})
+    new_cnt = Counter({k: len(v) for k, v in new_by.items()})
+    added = sum((new_cnt - old_cnt).values())
+    removed = sum((old_cnt - new_cnt).values())
+    moved = 0
+    for text in old_by.keys() & new_by.keys():
+        moved += sum(1 for a, b in zip(old_by[text], new_by[text]) if a != b)
+    return added, removed, moved
+
+
+def preview_markers(
+    file_path: Path,
+    rel: Optional[str] = None,
+    with_diff: bool = False,
+    cache: Optional[SymbolCache] = None,
+) -> FileReport:
+    """
+    Bereken de genormaliseerde inhoud volledig in geheugen en rapporteer wat
+    `normalize_markers` zou wijzigen. Schrijft, back-upt en commit niets.
+    """
+    file_path = Path(file_path)
+    rep = FileReport(path=rel or file_path.as_posix())
+    if file_path.name.lower() == "marker_normalizer.py":
+        return rep
+    try:
+        raw = file_path.read_bytes()
+    except OSError as ex:
+        rep.error = str(ex)
+        return rep
+
+    # zoals normalize_markers: BOM weg, universele regeleinden ("\r\n"/"\r" → "\n")
+    text = raw.decode("utf-8-sig", errors="replace")
+    old_lines = text.replace("\r\n", "\n").replace("\r", "\n").splitlines(keepends=True)
+    lines = [ln for ln in old_lines if not _is_marker_line(ln)]
+    ext = file_path.suffix.lower()
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+        meta = _collect_meta(lines, ext, cache)
+    except Exception as ex:
+        rep.error = str(ex)
+        return rep
+    if meta is None:
+        new_lines = lines
+    else:
+        prefix, suffix = _dialect_for_ext(ext)
+        inserts, _ = _build_inserts(meta, prefix, suffix)
+        new_lines = list(_iter_merged(lines, inserts))
+
+    (
+        rep.markers_added,
+        rep.markers_removed,
+        rep.markers_moved,
+    ) = _marker_stats(_marker_anchors(old_lines), _marker_anchors(new_lines))
+    new_text = "".join(new_lines)
+    rep.line_delta = len(new_lines) - len(old_lines)
+    # vergeleken met de bytes die _write_atomic echt zou schrijven
+    new_raw = new_text.replace("\n", _NEWLINE).encode("utf-8")
+    rep.bytes_delta = len(new_raw) - len(raw)
+    if with_diff and new_lines != old_lines:
+        rep.diff = "".join(
+            difflib.unified_diff(
+                old_lines, new_lines, f"a/{rep.path}", f"b/{rep.path}"
+            )
+        )
+    return rep
+
+
+# =========================================================
+# Project-breed normaliseren
+# =========================================================
+def listed_py_scripts(json_path: Path) -> List[str]:
+    # string- én dict-entries ({"path": ...}), gevalideerd bij het laden
+    rel_paths = load_config(json_path).script_paths()
+
+    # Filter: alleen .py en niet in backup/
+    return [p for p in rel_paths if p.endswith(".py") and not p.startswith("backup/")]
+
+
+def normalize_listed(
+    project_root: Path, rel_paths: List[str]
+) -> Tuple[List[Path], List[str]]:
+    """Normaliseer de gegeven scripts (zonder UI/git). Retour (verwerkt, fouten)."""
+    processed: List[Path] = []
+    errors: List[str] = []
+    cache = get_cache(project_root)
+
+    for rel in rel_paths:
+        abs_p = resolved_root(project_root) / Path(rel)
+        try:
+            normalize_markers(
+                abs_p, project_root=project_root, git_callback=None, cache=cache
+            )
+            processed.append(abs_p)
+        except FileNotFoundError:
+            errors.append(f"Ontbrekend bestand: {rel}")
+        except Exception as ex:
+            errors.append(f"{rel}: {ex}")
+    cache.save()
+    return processed, errors
 
 
 def normalize_project(
@@ -601,12 +1116,37 @@ def normalize_project(
     json_path: Path,
     parent: Optional[QtWidgets.QWidget] = None,
     commit_to_git: bool = True,
-) -> None:
+    dry_run: bool = False,
+    with_diff: bool = False,
+    max_workers: Optional[int] = None,
+) -> Optional[NormalizeReport]:
     """
     Normaliseert markers voor alle .py scripts uit .projassist.json (scripts[]),
     slaat 'backup/'-paden over, maakt per bestand back-up in project_root/backup/<ts>/...
     Één (optionele) Git-commit/push aan het einde.
+
+    dry_run=True: berekent alles parallel in geheugen en geeft een NormalizeReport
+    terug (optioneel met unified diff); er wordt niets geschreven, geback-upt,
+    gecommit of getoond.
     """
+    if dry_run:
+        if not project_root or not Path(project_root).exists():
+            raise FileNotFoundError(f"Projectroot niet gevonden: {project_root}")
+        if not json_path or not Path(json_path).exists():
+            raise FileNotFoundError(f".projassist.json niet gevonden: {json_path}")
+        rel_paths = listed_py_scripts(Path(json_path))
+        root = Path(project_root)
+        cache = get_cache(root)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            files = list(
+                pool.map(
+                    lambda rel: preview_markers(root / Path(rel), rel, with_diff, cache),
+                    rel_paths,
+                )
+            )
+        cache.save()
+        return NormalizeReport(files)
+
     if not project_root or not project_root.exists():
         QtWidgets.QMessageBox.critical(parent, "Markers", "Projectroot niet gevonden.")
         return
@@ -616,14 +1156,7 @@ def normalize_project(
         )
         return
 
-    cfg = _load_json(json_path)
-    listed = cfg.get("scripts") if isinstance(cfg.get("scripts"), list) else []
-    rel_paths: List[str] = [str(x) for x in listed if isinstance(x, str)]
-
-    # Filter: alleen .py en niet in backup/
-    rel_paths = [
-        p for p in rel_paths if p.endswith(".py") and not p.startswith("backup/")
-    ]
+    rel_paths = listed_py_scripts(json_path)
 
     if not rel_paths:
         QtWidgets.QMessageBox.information(
@@ -631,30 +1164,18 @@ def normalize_project(
         )
         return
 
-    processed: List[Path] = []
-    errors: List[str] = []
-
-    for rel in rel_paths:
-        abs_p = (project_root / Path(rel)).resolve()
-        try:
-            steps = normalize_markers(
-                abs_p, project_root=project_root, git_callback=None
-            )
-            processed.append(abs_p)
-        except FileNotFoundError:
-            errors.append(f"Ontbrekend bestand: {rel}")
-        except Exception as ex:
-            errors.append(f"{rel}: {ex}")
+    processed, errors = normalize_listed(project_root, rel_paths)
 
-    # Git (één batch)
+    # Git (één batch, op de achtergrond; resultaat volgt in een eigen melding)
     git_msg = ""
-    if commit_to_git and processed and _git_is_repo(project_root):
-        ok, detail = _git_after_save_batch(
+    if commit_to_git and processed:
+        fut = get_git_service().save(
             project_root,
-            [json_path, *processed],
+            [to_rel_posix(project_root, p) for p in (json_path, *processed)],
             "MarkerNormalizer: project-breed genormaliseerd",
         )
-        git_msg = detail if ok else f"Git waarschuwing: {detail}"
+        report_save(fut, parent)
+        git_msg = "Git: commit loopt op de achtergrond; de push volgt gebundeld."
 
     # Meldingen
     if errors:
@@ -667,3 +1188,38 @@ def normalize_project(
     if git_msg:
         msg += f"\n{git_msg}"
     QtWidgets.QMessageBox.information(parent, "Markers voltooid", msg)
+
+
+# =========================================================
+# CLI: controle voor CI (exit 1 als markers niet up-to-date zijn)
+# =========================================================
+def _main(argv: Optional[List[str]] = None) -> int:
+    import argparse, sys
+
+    ap = argparse.ArgumentParser(
+        prog="python -m handlers.marker_normalizer",
+        description="Controleer (dry-run) of markers up-to-date zijn.",
+    )
+    ap.add_argument("project_root", type=Path)
+    ap.add_argument("--json", type=Path, default=None, help="pad naar .projassist.json")
+    ap.add_argument("--diff", action="store_true", help="toon unified diff")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    root: Path = args.project_root
+    report = normalize_project(
+        root,
+        args.json or root / ".projassist.json",
+        dry_run=True,
+        with_diff=args.diff,
+        max_workers=args.workers,
+    )
+    assert report is not None
+    if args.diff:
+        sys.stdout.write(report.diff)
+    print(report.summary())
+    return 1 if report.changed_files or report.errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
@@ -0,0 +1,538 @@
+# handlers/marker_watcher.py
+
+# [SECTION: Imports]
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional, Tuple
+
+from handlers.marker_normalizer import (
+    EXT_REM,
+    EXT_SLASHES,
+    file_lock,
+    normalize_markers,
+    preview_markers,
+)
+from services.symbol_cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+
+# Alleen code-bestanden; config (yml/ini/...) en XML/UI blijven buiten de watcher
+WATCH_EXTS = {".py", ".ps1", ".psm1", ".sh", ".bash", ".zsh"} | EXT_SLASHES | EXT_REM
+IGNORE_DIRS = {
+    "backup",
+    "__pycache__",
+    "venv",
+    "node_modules",
+    "build",
+    "dist",
+}
+WRITER_SCAN_TTL = 2.0  # /proc hoogstens één keer per zoveel seconden doorlopen
+SELF_WRITE_TTL = 30.0  # eigen writes herkennen, daarna vergeten
+
+
+# Filter
+# [FUNC: _ignored_dir]
+def _ignored_dir(name: str) -> bool:
+    return name.startswith(".") or name.lower() in IGNORE_DIRS
+
+# [END: _ignored_dir]
+
+
+# [FUNC: _is_candidate]
+def _is_candidate(root: Path, path: Path) -> bool:
+    try:
+        rel = path.relative_to(root)
+    except ValueError:
+        return False
+    if any(_ignored_dir(part) for part in rel.parts[:-1]):
+        return False
+    name = path.name
+    if name.endswith((".tmp", "~")) or name.startswith((".#", "~$")):
+        return False
+    if name.lower() == "marker_normalizer.py":
+        return False
+    return path.suffix.lower() in WATCH_EXTS
+
+# [END: _is_candidate]
+
+
+# [FUNC: _walk_dirs]
+def _walk_dirs(top: Path):
+    stack = [top]
+    while stack:
+        d = stack.pop()
+        yield d
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False) and not _ignored_dir(e.name):
+                        stack.append(Path(e.path))
+        except OSError:
+            continue
+
+# [END: _walk_dirs]
+
+
+# Bestand open voor schrijven?
+_writer_cache: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+_writer_lock = threading.Lock()
+
+
+# [FUNC: _proc_writers]
+def _proc_writers(root: str) -> FrozenSet[str]:
+    """
+    Linux: paden onder root die een ander proces (zelfde gebruiker) schrijvend
+    open heeft. Eén /proc-scan per root en per WRITER_SCAN_TTL, gedeeld door
+    alle wachtende bestanden; fdinfo wordt enkel gelezen voor fd's onder root.
+    """
+    now = time.monotonic()
+    with _writer_lock:
+        hit = _writer_cache.get(root)
+        if hit and now - hit[0] < WRITER_SCAN_TTL:
+            return hit[1]
+    prefix = root.rstrip("/") + "/"
+    me, uid = os.getpid(), os.getuid()
+    found = set()
+    try:
+        pids = [p for p in os.listdir("/proc") if p.isdigit() and int(p) != me]
+    except OSError:
+        pids = []
+    for pid in pids:
+        fd_dir = f"/proc/{pid}/fd"
+        try:
+            if os.stat(f"/proc/{pid}").st_uid != uid:
+                continue  # andere gebruiker: geen editor van ons
+            fds = os.listdir(fd_dir)
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(f"{fd_dir}/{fd}")
+            except OSError:
+                continue
+            if not target.startswith(prefix) or target in found:
+                continue
+            try:
+                with open(f"/proc/{pid}/fdinfo/{fd}", encoding="ascii") as fh:
+                    for line in fh:
+                        if line.startswith("flags:"):
+                            if int(line.split()[1], 8) & (os.O_WRONLY | os.O_RDWR):
+                                found.add(target)
+                            break
+            except (OSError, ValueError):
+                continue
+    result = frozenset(found)
+    with _writer_lock:
+        _writer_cache[root] = (time.monotonic(), result)
+    return result
+
+# [END: _proc_writers]
+
+
+# [FUNC: _open_for_write]
+def _open_for_write(path: Path, root: Path) -> bool:
+    if sys.platform.startswith("linux"):
+        return str(path) in _proc_writers(str(root))
+    if os.name == "nt":
+        # Een editor die schrijft houdt het bestand vergrendeld (geen share-write)
+        try:
+            fd = os.open(str(path), os.O_RDWR)
+        except PermissionError:
+            return True
+        except OSError:
+            return False
+        os.close(fd)
+    return False
+
+# [END: _open_for_write]
+
+
+# Backends: inotify (Linux) en polling (overal)
+# [CLASS: _InotifyBackend]
+class _InotifyBackend:
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    _EVENT = struct.Struct("iIII")
+
+    # [FUNC: __init__]
+    def __init__(self, root: Path):
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 faalde")
+        self._fd = fd
+        self._wd: Dict[int, Path] = {}
+        try:
+            self._add_tree(root)
+        except OSError:
+            os.close(fd)
+            raise
+
+    # [END: __init__]
+
+    # [FUNC: _add_tree]
+    def _add_tree(self, top: Path) -> None:
+        for d in _walk_dirs(top):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(d)), self.MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err == errno.ENOSPC:
+                    raise OSError(err, "inotify watch-limiet bereikt")
+                continue
+            self._wd[wd] = d
+
+    # [END: _add_tree]
+
+    # [FUNC: read]
+    def read(self, timeout: float) -> List[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        out: List[Path] = []
+        i, size = 0, self._EVENT.size
+        while i + size <= len(data):
+            wd, mask, _cookie, ln = self._EVENT.unpack_from(data, i)
+            name = data[i + size : i + size + ln].split(b"\0", 1)[0]
+            i += size + ln
+            if mask & self.IN_Q_OVERFLOW:
+                logger.warning("inotify: wachtrij overgelopen; events gemist.")
+                continue
+            if mask & self.IN_IGNORED:
+                self._wd.pop(wd, None)
+                continue
+            base = self._wd.get(wd)
+            if base is None or not name:
+                continue
+            path = base / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not _ignored_dir(path.name):
+                    self._add_tree(path)
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+                out.append(path)
+        return out
+
+    # [END: read]
+
+    # [FUNC: close]
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    # [END: close]
+
+
+# [END: _InotifyBackend]
+
+
+# [CLASS: _PollingBackend]
+class _PollingBackend:
+    # [FUNC: __init__]
+    def __init__(self, root: Path, interval: float = 1.0):
+        self.root = root
+        self.interval = interval
+        self._snap = self._scan()
+        self._next = time.monotonic() + interval
+
+    # [END: __init__]
+
+    # [FUNC: _scan]
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snap: Dict[Path, Tuple[int, int]] = {}
+        for d in _walk_dirs(self.root):
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.is_file(follow_symlinks=False):
+                            st = e.stat(follow_symlinks=False)
+                            snap[Path(e.path)] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+        return snap
+
+    # [END: _scan]
+
+    # [FUNC: read]
+    def read(self, timeout: float) -> List[Path]:
+        wait = self._next - time.monotonic()
+        if wait > timeout:
+            time.sleep(max(timeout, 0.0))
+            return []
+        if wait > 0:
+            time.sleep(wait)
+        snap = self._scan()
+        self._next = time.monotonic() + self.interval
+        changed = [p for p, sig in snap.items() if self._snap.get(p) != sig]
+        self._snap = snap
+        return changed
+
+    # [END: read]
+
+    # [FUNC: close]
+    def close(self) -> None:
+        self._snap = {}
+
+    # [END: close]
+
+
+# [END: _PollingBackend]
+
+
+# Watcher
+# [CLASS: MarkerWatcher]
+@dataclass
+class MarkerWatcher:
+    """
+    Houdt markers vers: bewaakt project_root, bundelt snelle opslagen (debounce)
+    en normaliseert enkel het aangeraakte bestand in een achtergrondthread.
+    Bestanden die nog schrijvend open staan worden uitgesteld; per bestand en
+    globaal is er een rate-limit zodat de watcher niet met een editor vecht.
+    """
+
+    project_root: Path
+    debounce: float = 0.8
+    min_interval: float = 5.0  # per bestand
+    max_per_minute: int = 30  # globaal
+    backup: bool = False
+    use_polling: bool = False
+    poll_interval: float = 1.0
+    on_result: Optional[Callable[[Path, List[str]], None]] = None
+
+    _pending: Dict[Path, Tuple[float, Optional[Tuple[int, int]]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _self_writes: Dict[Path, Tuple[Tuple[int, int], float]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _last_run: Dict[Path, float] = field(default_factory=dict, init=False, repr=False)
+    _recent: Deque[float] = field(default_factory=deque, init=False, repr=False)
+    _stop: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+
+    # [FUNC: running]
+    @property
+    def running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    # [END: running]
+
+    # [FUNC: start]
+    def start(self) -> None:
+        if self.running:
+            return
+        self.project_root = Path(self.project_root).resolve()
+        backend = self._make_backend()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(backend,), name="MarkerWatcher", daemon=True
+        )
+        self._thread.start()
+        logger.info("MarkerWatcher gestart (%s): %s", type(backend).__name__, self.project_root)
+
+    # [END: start]
+
+    # [FUNC: stop]
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+
+    # [END: stop]
+
+    # [FUNC: _make_backend]
+    def _make_backend(self):
+        if not self.use_polling and sys.platform.startswith("linux"):
+            try:
+                return _InotifyBackend(self.project_root)
+            except (OSError, AttributeError) as ex:
+                logger.info("inotify niet beschikbaar (%s); terugval op polling.", ex)
+        return _PollingBackend(self.project_root, self.poll_interval)
+
+    # [END: _make_backend]
+
+    # [FUNC: _run]
+    def _run(self, backend) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    for path in backend.read(self._next_timeout()):
+                        self._on_event(path)
+                    self._process_due()
+                except Exception:
+                    # één slecht event of bestand mag de watcher niet stilleggen
+                    logger.exception("MarkerWatcher: fout in de lus; gaat verder.")
+                    self._stop.wait(1.0)
+        finally:
+            backend.close()
+
+    # [END: _run]
+
+    # [FUNC: _next_timeout]
+    def _next_timeout(self) -> float:
+        if not self._pending:
+            return 0.5
+        due = min(d for d, _ in self._pending.values()) - time.monotonic()
+        return min(max(due, 0.05), 0.5)
+
+    # [END: _next_timeout]
+
+    # [FUNC: _sig]
+    @staticmethod
+    def _sig(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    # [END: _sig]
+
+    # [FUNC: _on_event]
+    def _on_event(self, path: Path) -> None:
+        if not _is_candidate(self.project_root, path):
+            return
+        sig = self._sig(path)
+        own = self._self_writes.get(path)
+        if sig is None or (own is not None and own[0] == sig):
+            return  # verdwenen, of onze eigen write
+        # elke nieuwe save schuift de deadline op (debounce)
+        self._pending[path] = (time.monotonic() + self.debounce, sig)
+
+    # [END: _on_event]
+
+    # [FUNC: _process_due]
+    def _process_due(self) -> None:
+        now = time.monotonic()
+        for path, (_sig, at) in list(self._self_writes.items()):
+            if now - at > SELF_WRITE_TTL:
+                del self._self_writes[path]
+        for path, (due, sig) in list(self._pending.items()):
+            if due > now:
+                continue
+            cur = self._sig(path)
+            if cur is None:
+                self._pending.pop(path)
+                continue
+            if cur != sig or _open_for_write(path, self.project_root):
+                self._pending[path] = (now + self.debounce, cur)
+                continue
+            last = self._last_run.get(path)
+            if last is not None and now - last < self.min_interval:
+                self._pending[path] = (last + self.min_interval, cur)
+                continue
+            while self._recent and now - self._recent[0] >= 60.0:
+                self._recent.popleft()
+            if len(self._recent) >= self.max_per_minute:
+                self._pending[path] = (self._recent[0] + 60.0, cur)
+                continue
+            self._pending.pop(path)
+            self._normalize(path, now)
+
+    # [END: _process_due]
+
+    # [FUNC: _normalize]
+    def _normalize(self, path: Path, now: float) -> None:
+        rel = path.relative_to(self.project_root).as_posix()
+        # zelfde slot als normalize_markers: een lopende normalize_project of knop
+        # schrijft dit bestand niet tegelijk; daarna meldt preview "up-to-date"
+        with file_lock(path):
+            rep = preview_markers(path, rel, cache=get_cache(self.project_root))
+            if rep.error:
+                logger.warning("MarkerWatcher: %s overgeslagen: %s", rel, rep.error)
+                return
+            if not rep.changed:
+                return  # al up-to-date: geen no-op rewrite
+            try:
+                steps = normalize_markers(path, project_root=self.project_root, backup=self.backup)
+            except Exception as ex:
+                logger.warning("MarkerWatcher: %s mislukt: %s", rel, ex)
+                return
+            sig = self._sig(path)
+        if sig:
+            self._self_writes[path] = (sig, now)
+        self._last_run[path] = now
+        self._recent.append(now)
+        logger.info(
+            "MarkerWatcher: %s genormaliseerd (+%d -%d ~%d).",
+            rel,
+            rep.markers_added,
+            rep.markers_removed,
+            rep.markers_moved,
+        )
+        if self.on_result:
+            try:
+                self.on_result(path, steps)
+            except Exception:
+                logger.exception("MarkerWatcher: on_result faalde.")
+
+    # [END: _normalize]
+
+
+# [END: MarkerWatcher]
+
+
+# CLI: python -m handlers.marker_watcher <project_root>
+# [FUNC: _main]
+def _main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        prog="python -m handlers.marker_watcher",
+        description="Houd markers automatisch up-to-date tijdens het bewerken.",
+    )
+    ap.add_argument("project_root", type=Path)
+    ap.add_argument("--poll", action="store_true", help="forceer polling i.p.v. inotify")
+    ap.add_argument("--debounce", type=float, default=0.8)
+    ap.add_argument("--backup", action="store_true", help="back-up vóór elke wijziging")
+    args = ap.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    watcher = MarkerWatcher(
+        args.project_root,
+        debounce=args.debounce,
+        backup=args.backup,
+        use_polling=args.poll,
+    )
+    watcher.start()
+    try:
+        while watcher.running:
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+    return 0
+
+# [END: _main]
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
@@ -1,5 +1,4 @@
 # [SECTION: Imports]
-import logging
 from __future__ import annotations
 import sys, json, logging, subprocess
 from pathlib import Path
@@ -9,6 +8,7 @@ import os, shutil
 from handlers.sync_projassist import SyncProjassistService
 from handlers.marker_normalizer import normalize_project
 from handlers.log_injector import LogInjectorService
+from services.config_model import ConfigError, load_config
 logger = logging.getLogger(__name__)
 
 # [END: Imports]
@@ -19,19 +19,21 @@ VENV_PY_EXE = Path(r"C:\virt omgeving\Projectassisten2_0\venv\Scripts\python.exe
 # [CLASS: ProjAssistHandlers]
 class ProjAssistHandlers:
     # [FUNC: __init__]
-logger.debug("__init__() called")
     def __init__(self, ui, parent: Optional[QtWidgets.QWidget] = None):
         self.ui = ui
         self.parent = parent
         self.json_path: Optional[Path] = None
         self.json_data: dict = {}
         self.project_root: Optional[Path] = None
+        self._config_watcher = None
+        self._config_error: Optional[str] = None
         self._connect_signals()
         self._init_ui_defaults()
+        self._unwatch_push = self._watch_push_status()
+        self._unwatch_queue = self._watch_git_queue()
 
     # [END: __init__]
 
-    logger.debug("_init_ui_defaults() called")
     # [FUNC: _init_ui_defaults]
     def _init_ui_defaults(self):
         if hasattr(self.ui, "plainTextScriptEditor"):
@@ -52,10 +54,8 @@ logger.debug("__init__() called")
                 w.setText("")
 
     # [END: _init_ui_defaults]
-logger.debug("_connect_signals() called")
 
     # [FUNC: _connect_signals]
-logger.debug("hook() called")
     def _connect_signals(self):
         c = self.ui
 
@@ -74,6 +74,8 @@ logger.debug("hook() called")
         hook("btnBladerenProject", self._choose_project_folder)
         hook("btnVerwijderProject", self._delete_project_clicked)
         hook("btnOpenGitRepo", self._open_github_repo)
+        hook("btnPushNow", self._push_now)
+        hook("btnScriptStatus", self._show_script_status)
 
         # Scripts beheren (aanmaken/registreren – ongewijzigd)
         hook("btnBladerenScript", self._choose_new_script_folder)
@@ -100,6 +102,8 @@ logger.debug("hook() called")
         # NIEUW: markers normaliseren
         hook("btnSetMarkers", self._set_markers_clicked)
         hook("btnMarkProject", self._on_mark_project_clicked)
+        hook("btnWatchMarkers", self._toggle_marker_watch)
+        hook("btnWorkspaceBatch", self._on_workspace_batch)
 
         # NIEUW: project scripts syncen met .projassist.json
         hook("btnSyncProjassist", self._on_sync_projassist)
@@ -107,7 +111,6 @@ logger.debug("hook() called")
         # NIEUW: logging toevoegen
         hook("btnAddLogAllProject", self._on_add_log_all_project)
 
-        logger.debug("_load_json_clicked() called")
     # [END: _connect_signals]
 
     # [FUNC: _load_json_clicked]
@@ -121,14 +124,13 @@ logger.debug("hook() called")
         if not path:
             return
         self._load_json(Path(path))
-            logger.debug("_load_json() called")
 
     # [END: _load_json_clicked]
 
     # [FUNC: _load_json]
     def _load_json(self, json_path: Path):
         try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
+            cfg = load_config(json_path)
         except Exception as ex:
             QtWidgets.QMessageBox.critical(
                 self.parent,
@@ -137,22 +139,67 @@ logger.debug("hook() called")
             )
             return
         self.json_path = json_path
-        self.json_data = data or {}
+        self.json_data = cfg.to_dict()
         self.project_root = json_path.parent
-        name = self.json_data.get("project_name") or self.project_root.name
-        if hasattr(self.ui, "lblProjectName"):
-            self.ui.lblProjectName.setText(str(name))
-        if hasattr(self.ui, "lblProjectName1"):
-            self.ui.lblProjectName1.setText(str(name))
+        self._show_project_name()
+        self._watch_config(cfg)
 
         # NIEUW: bij nieuw project nog geen script gekozen → label resetten
         w = getattr(self.ui, "lblProjectScipt", None)
         if w:
-        logger.debug("_browse_load_script_clicked() called")
             w.setText("—")
 
     # [END: _load_json]
 
+    # [FUNC: _show_project_name]
+    def _show_project_name(self):
+        name = self.json_data.get("project_name") or self.project_root.name
+        if hasattr(self.ui, "lblProjectName"):
+            self.ui.lblProjectName.setText(str(name))
+        if hasattr(self.ui, "lblProjectName1"):
+            self.ui.lblProjectName1.setText(str(name))
+
+    # [END: _show_project_name]
+
+    # [FUNC: _watch_config]
+    def _watch_config(self, cfg):
+        # één watcher per venster; volgt telkens het geladen project
+        if self._config_watcher is None:
+            from handlers.config_watcher import ConfigWatcher
+
+            self._config_watcher = ConfigWatcher(self.parent)
+            self._config_watcher.changed.connect(self._on_config_changed)
+            self._config_watcher.failed.connect(self._on_config_failed)
+        self._config_error = None
+        self._config_watcher.watch(self.json_path, cfg)
+
+    # [END: _watch_config]
+
+    # [FUNC: _on_config_changed]
+    def _on_config_changed(self, cfg, diff):
+        # sync, registratie of externe edit: gedeelde kopie bijwerken
+        self._config_error = None
+        self.json_data = cfg.to_dict()
+        if "project_name" in diff.keys:
+            self._show_project_name()
+
+    # [END: _on_config_changed]
+
+    # [FUNC: _on_config_failed]
+    def _on_config_failed(self, msg: str):
+        # ongeldige (externe) edit: vorige versie blijft actief; elke fout één keer melden
+        if msg == self._config_error:
+            return
+        self._config_error = msg
+        text = f".projassist.json ongeldig, vorige versie blijft actief: {msg}"
+        bar = getattr(self.parent, "statusBar", None)
+        if callable(bar):
+            bar().showMessage(text, 15000)
+        else:
+            QtWidgets.QMessageBox.warning(self.parent, "Configuratie", text)
+
+    # [END: _on_config_failed]
+
     # [FUNC: _browse_load_script_clicked]
     def _browse_load_script_clicked(self):
         start_dir = str(self.project_root or "")
@@ -165,7 +212,6 @@ logger.debug("hook() called")
         if not path:
             return
         le = getattr(self.ui, "lineLoadEditscript", None)
-            logger.debug("_load_script_to_editor_clicked() called")
         if le:
             le.setText(path)
 
@@ -190,7 +236,6 @@ logger.debug("hook() called")
             text = f"[Kon bestand niet lezen]\n{path}\n\n{ex}"
         if hasattr(self.ui, "plainTextScriptEditor"):
             self.ui.plainTextScriptEditor.setPlainText(text)
-        logger.debug("_browse_delete_script_clicked() called")
         # NIEUW: na succesvol laden → bestandsnaam tonen in het label
         if label:
             label.setText(path.name)
@@ -207,7 +252,6 @@ logger.debug("hook() called")
             "Python/Ui (*.py *.ui);;Alle (*.*)",
         )
         if not path:
-        logger.debug("_delete_script_clicked() called")
             return
         le = getattr(self.ui, "lineEditDeleteScipt", None)  # let op: objectName exact
         if le:
@@ -237,39 +281,39 @@ logger.debug("hook() called")
         ):
             return
 
-        # 1) fysiek bestand verwijderen (OneDrive path is ook gewoon een pad)
-        try:
-            abs_path.unlink(missing_ok=True)
-        except Exception as ex:
-            QtWidgets.QMessageBox.critical(
-                self.parent, "Verwijderen", f"Kon bestand niet verwijderen:\n{ex}"
-            )
-            return
+        from services.git_transaction import git_transaction
 
-        # 2) git: deletion commit + push
-        try:
-            self._git_record([abs_path], f"Remove script: {abs_path.name}")
-        except Exception:
-            pass
-
-        # 3) JSON bijwerken
-        msg_json = "Geen .projassist.json geladen; JSON niet aangepast."
-        if self.json_path:
+        # bestand + JSON-entry weg → samen één commit
+        with git_transaction(self.project_root, f"Remove script: {abs_path.name}") as tx:
+            # 1) fysiek bestand verwijderen (OneDrive path is ook gewoon een pad)
             try:
-                from services.script_ops import remove_script
-
-                removed = remove_script(
-                    self.json_path, abs_path, delete_from_disk=False
-                )
-                self._load_json(self.json_path)  # state verversen
-                msg_json = (
-                    "Uit JSON verwijderd." if removed else "Niet gevonden in JSON."
-                )
+                abs_path.unlink(missing_ok=True)
             except Exception as ex:
-                msg_json = f"Kon JSON niet bijwerken: {ex}"
+                QtWidgets.QMessageBox.critical(
+                    self.parent, "Verwijderen", f"Kon bestand niet verwijderen:\n{ex}"
+                )
+                return
+            tx.touch(abs_path)
+
+            # 2) JSON bijwerken
+            msg_json = "Geen .projassist.json geladen; JSON niet aangepast."
+            if self.json_path:
+                try:
+                    from services.script_ops import remove_script
+
+                    removed = remove_script(
+                        self.json_path, abs_path, delete_from_disk=False
+                    )
+                    msg_json = (
+                        "Uit JSON verwijderd." if removed else "Niet gevonden in JSON."
+                    )
+                except Exception as ex:
+                    msg_json = f"Kon JSON niet bijwerken: {ex}"
+        self._report_tx(tx)
+        if self.json_path:
+            self._load_json(self.json_path)  # state verversen
 
         QtWidgets.QMessageBox.information(
-                logger.debug("_set_markers_clicked() called")
             self.parent, "Script", f"Script verwijderd.\n{msg_json}"
         )
         if le:
@@ -298,7 +342,6 @@ logger.debug("hook() called")
             logs = normalize_markers(
                 path,
                 project_root=project_root,
-                logger.debug("_on_sync_projassist() called")
                 git_callback=lambda paths, msg: self._git_record(paths, msg),
             )
             # Toon pop-up met de stappen
@@ -315,7 +358,6 @@ logger.debug("hook() called")
                 self.parent, "Sync", "Laad eerst een .projassist.json (project)."
             )
             return
-            logger.debug("_on_mark_project_clicked() called")
 
         svc = SyncProjassistService(
             project_root=self.project_root,
@@ -332,7 +374,6 @@ logger.debug("hook() called")
             QtWidgets.QMessageBox.information(
                 self.parent, "Markers", "Laad eerst een .projassist.json (project)."
             )
-                logger.debug("_on_add_log_all_project() called")
             return
         # Eén commit aan het einde
         normalize_project(
@@ -344,11 +385,68 @@ logger.debug("hook() called")
 
     # [END: _on_mark_project_clicked]
 
+    # [FUNC: _toggle_marker_watch]
+    def _toggle_marker_watch(self):
+        w = getattr(self, "_marker_watcher", None)
+        if w and w.running:
+            w.stop()
+            self._marker_watcher = None
+            QtWidgets.QMessageBox.information(self.parent, "Markers", "Watch-modus gestopt.")
+            return
+        if not self.project_root:
+            QtWidgets.QMessageBox.information(
+                self.parent, "Markers", "Laad eerst een .projassist.json (project)."
+            )
+            return
+        from handlers.marker_watcher import MarkerWatcher
+
+        self._marker_watcher = MarkerWatcher(self.project_root)
+        self._marker_watcher.start()
+        QtWidgets.QMessageBox.information(
+            self.parent,
+            "Markers",
+            "Watch-modus actief: gewijzigde scripts krijgen automatisch verse markers.",
+        )
+
+    # [END: _toggle_marker_watch]
+
+    # [FUNC: _on_workspace_batch]
+    def _on_workspace_batch(self):
+        base = QtWidgets.QFileDialog.getExistingDirectory(
+            self.parent, "Kies workspace-map (alle .projassist.json eronder)"
+        )
+        if not base:
+            return
+        from handlers.git_bridge import in_background
+        from handlers.workspace_batch import run_workspace
+
+        # sync + markers over alle projecten: buiten de GUI-thread
+        btn = getattr(self.ui, "btnWorkspaceBatch", None)
+        if btn is not None:
+            btn.setEnabled(False)
+        root = Path(base)
+        in_background(lambda: run_workspace(root), self._show_batch_report)
+
+    # [END: _on_workspace_batch]
+
+    # [FUNC: _show_batch_report]
+    def _show_batch_report(self, report):
+        btn = getattr(self.ui, "btnWorkspaceBatch", None)
+        if btn is not None:
+            btn.setEnabled(True)
+        if isinstance(report, Exception):
+            QtWidgets.QMessageBox.critical(self.parent, "Workspace", f"Fout:\n{report}")
+            return
+        box = QtWidgets.QMessageBox(self.parent)
+        box.setWindowTitle("Workspace")
+        box.setText(f"{len(report.projects)} project(en) verwerkt onder:\n{report.base}")
+        box.setDetailedText(report.table())
+        box.exec()
+
     # [FUNC: _on_add_log_all_project]
     def _on_add_log_all_project(self):
         if not self.project_root or not self.json_path:
             QtWidgets.QMessageBox.information(
-        logger.debug("_choose_project_folder() called")
                 self.parent, "Logging", "Laad eerst een .projassist.json (project)."
             )
             return
@@ -365,7 +463,6 @@ logger.debug("hook() called")
     def _choose_project_folder(self):
         folder = QtWidgets.QFileDialog.getExistingDirectory(
             self.parent, "Kies projectfolder"
-        logger.debug("_delete_project_clicked() called")
         )
         if folder and hasattr(self.ui, "lineProjectFolder"):
             self.ui.lineProjectFolder.setText(folder)
@@ -418,11 +515,10 @@ logger.debug("hook() called")
 
         # project_name + github_url uitlezen
         try:
-            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta = load_config(meta_path)
+            project_name, github_url = meta.project_name, meta.github_repo
         except Exception:
-            meta = {}
-        project_name = str(meta.get("project_name") or root.name)
-        github_url = meta.get("github_repo")
+            project_name, github_url = root.name, None
 
         # extra vragen: venv + github
         venv_root = Path(r"C:\virt omgeving") / project_name
@@ -521,7 +617,6 @@ logger.debug("hook() called")
 
         if not fouten:
             QtWidgets.QMessageBox.information(
-        logger.debug("_prime_github_token_from_global_env() called")
                 self.parent,
                 "Verwijderd",
                 f"✅ Project '{project_name}' is volledig verwijderd.",
@@ -549,7 +644,6 @@ logger.debug("hook() called")
             if not env_file.exists():
                 return
             for line in env_file.read_text(
-                logger.debug("_open_github_repo() called")
                 encoding="utf-8", errors="ignore"
             ).splitlines():
                 if "=" not in line or line.strip().startswith("#"):
@@ -569,22 +663,10 @@ logger.debug("hook() called")
     def _open_github_repo(self):
         import webbrowser
 
+        # gedeelde kopie, door de config-watcher actueel gehouden
         url = self.json_data.get("github_repo") if self.json_data else None
-        if (
-            not url
-            and self.project_root
-            and (self.project_root / ".projassist.json").exists()
-            logger.debug("_choose_new_script_folder() called")
-        ):
-            try:
-                url = json.loads(
-                    (self.project_root / ".projassist.json").read_text(encoding="utf-8")
-                ).get("github_repo")
-            except Exception:
-                url = None
         if url:
             webbrowser.open(url)
-        logger.debug("_choose_existing_script_file() called")
         else:
             QtWidgets.QMessageBox.information(
                 self.parent, "GitHub", "Geen GitHub-URL gevonden."
@@ -594,7 +676,6 @@ logger.debug("hook() called")
 
     # [FUNC: _choose_new_script_folder]
     def _choose_new_script_folder(self):
-    logger.debug("_create_new_script_clicked() called")
         folder = QtWidgets.QFileDialog.getExistingDirectory(
             self.parent, "Kies map voor nieuw script"
         )
@@ -629,20 +710,25 @@ logger.debug("hook() called")
             getattr(self.ui, "lineScriptLocatie", None).text().strip()
             if hasattr(self.ui, "lineScriptLocatie")
             else ""
-            logger.debug("_register_existing_script_clicked() called")
         )
         if not name or not folder:
             QtWidgets.QMessageBox.warning(
                 self.parent, "Scripts", "Naam en locatie zijn verplicht."
             )
             return
+        from services.git_transaction import git_transaction
+        from services.project_config import ProjectConfig
         from services.script_ops import create_new_script, set_github_url_for_script
 
-        entry = create_new_script(self.json_path, folder, name)
         filename = name if name.endswith(".py") else f"{name}.py"
         new_file = Path(folder) / filename
-        self._git_record([new_file], f"Add script: {entry.get('path')}")
-        set_github_url_for_script(self.json_path, new_file, branch="main")
+        # nieuw bestand + registratie + URL → één write van .projassist.json, één commit
+        with git_transaction(self.project_root, f"Add script: {filename}") as tx:
+            with ProjectConfig.for_path(self.json_path).batch():
+                entry = create_new_script(self.json_path, folder, name)
+                set_github_url_for_script(self.json_path, new_file, branch="main")
+            tx.message = f"Add script: {entry.get('path')}"
+        self._report_tx(tx)
         QtWidgets.QMessageBox.information(
             self.parent, "Script", f"Aangemaakt en geregistreerd: {entry.get('path')}"
         )
@@ -658,7 +744,6 @@ logger.debug("hook() called")
             return
         path = (
             getattr(self.ui, "lineScriptPad", None).text().strip()
-        logger.debug("_choose_build_project_path() called")
             if hasattr(self.ui, "lineScriptPad")
             else ""
         )
@@ -668,17 +753,23 @@ logger.debug("hook() called")
         from services.script_ops import (
             register_existing_script,
             set_github_url_for_script,
-            logger.debug("_choose_build_output_path() called")
         )
 
-        entry = register_existing_script(self.json_path, path)
-        self._git_record([Path(path)], f"Register script: {entry.get('path')}")
-        set_github_url_for_script(self.json_path, path, branch="main")
+        from services.git_transaction import git_transaction
+        from services.project_config import ProjectConfig
+
+        with git_transaction(self.project_root, "Register script") as tx:
+            with ProjectConfig.for_path(self.json_path).batch():
+                entry = register_existing_script(self.json_path, path)
+                set_github_url_for_script(self.json_path, path, branch="main")
+            # bestaand bestand: zelf niet geschreven, wel mee committen
+            tx.touch(Path(path) if Path(path).is_absolute() else self.json_path.parent / path)
+            tx.message = f"Register script: {entry.get('path')}"
+        self._report_tx(tx)
         QtWidgets.QMessageBox.information(
             self.parent, "Script", f"Geregistreerd: {entry.get('path')}"
         )
 
-        logger.debug("_export_project_clicked() called")
     # [END: _register_existing_script_clicked]
 
     # [FUNC: _choose_build_project_path]
@@ -706,7 +797,6 @@ logger.debug("hook() called")
         from build_exe import build_exe
 
         proj = (
-logger.debug("_git_record() called")
             getattr(self.ui, "lineProjectPath", None).text().strip()
             if hasattr(self.ui, "lineProjectPath")
             else ""
@@ -726,31 +816,134 @@ logger.debug("_git_record() called")
             self.parent,
             "Export" if ok else "Fout",
             (msg[-2000:] if isinstance(msg, str) else str(msg)),
-            logger.debug("open_project_creator() called")
         )
 
     # [END: _export_project_clicked]
 
+    # [FUNC: _report_tx]
+    def _report_tx(self, tx):
+        # commit van een git_transaction (achtergrond): statusregel, of info-box bij een fout
+        if tx.future is None:
+            return
+        from handlers.git_bridge import report_save
+
+        bar = getattr(self.parent, "statusBar", None)
+        status = (lambda text: bar().showMessage(f"Git: {text}", 5000)) if callable(bar) else None
+        report_save(tx.future, self.parent, status)
+
+    # [END: _report_tx]
+
     # [FUNC: _git_record]
     def _git_record(self, paths: list[Path | str], message: str):
-        try:
-            if not self.project_root:
-                return
-            from services.git_ops import is_repo, add, commit, push
+        # één add/commit op de achtergrond (GitService), push gebundeld via de PushQueue; stil
+        from services.git_transaction import git_transaction
 
-            if not is_repo(self.project_root):
+        with git_transaction(self.project_root, message) as tx:
+            tx.touch(*paths)
+        fut = tx.future
+        if fut is None:
+            return
+
+        def _report(res):
+            # niet meer stil: een mislukte commit (bv. repo bezet) komt in log en statusbalk
+            if res.ok or res.no_repo or res.nothing_to_commit:
                 return
-            _ok, _ = add([str(p) for p in paths], cwd=self.project_root)
-            _ok2, _out2 = commit(message, cwd=self.project_root)
-            try:
-                _ok3, _out3 = push(cwd=self.project_root)
-            except Exception:
-                pass
-        except Exception:
-            logging.debug("git_record: genegeerde fout", exc_info=True)
+            logger.warning("git_record (%s): %s", message, res.summary())
+            bar = getattr(self.parent, "statusBar", None)
+            if callable(bar):
+                bar().showMessage(f"Git: {res.summary()}", 10000)
+
+        from handlers.git_bridge import on_gui
+
+        on_gui(fut, _report)
 
     # [END: _git_record]
 
+    # [FUNC: _watch_push_status]
+    def _watch_push_status(self):
+        # pushstatus in de statusbalk (geen dialogen); zonder statusbalk niets te doen
+        bar = getattr(self.parent, "statusBar", None)
+        if not callable(bar):
+            return None
+        from handlers.git_bridge import watch_push_status
+
+        return watch_push_status(lambda st: bar().showMessage(st.text(), 8000))
+
+    # [END: _watch_push_status]
+
+    # [FUNC: _watch_git_queue]
+    def _watch_git_queue(self):
+        # wachtrijdiepte in de statusbalk zodra er echt iets wacht (> 1 per repo)
+        bar = getattr(self.parent, "statusBar", None)
+        if not callable(bar):
+            return None
+        from handlers.git_bridge import watch_git_queue
+
+        def _show(item):
+            root, depth = item
+            if depth > 1:
+                bar().showMessage(f"Git: {depth} bewerkingen in wachtrij ({root.name})", 3000)
+
+        return watch_git_queue(_show)
+
+    # [END: _watch_git_queue]
+
+    # [FUNC: _push_now]
+    def _push_now(self):
+        from services.push_queue import get_push_queue
+
+        queue = get_push_queue()
+        if not queue.pending():
+            bar = getattr(self.parent, "statusBar", None)
+            if callable(bar):
+                bar().showMessage("Git: niets te pushen.", 5000)
+            return
+        queue.flush()
+
+    # [END: _push_now]
+
+    # [FUNC: _show_script_status]
+    def _show_script_status(self):
+        if not self.project_root or not self.json_path:
+            QtWidgets.QMessageBox.information(
+                self.parent, "Git-status", "Laad eerst een .projassist.json (project)."
+            )
+            return
+        from handlers.git_bridge import in_background
+        from services import git_ops
+
+        root = self.project_root
+        try:
+            scripts = load_config(self.json_path).script_paths()
+        except ConfigError as ex:
+            QtWidgets.QMessageBox.critical(self.parent, "Git-status", str(ex))
+            return
+        in_background(lambda: git_ops.script_states(root, scripts), self._on_script_states)
+
+    # [END: _show_script_status]
+
+    # [FUNC: _on_script_states]
+    def _on_script_states(self, states):
+        from services.git_status import CLEAN, STATE_LABELS
+
+        if isinstance(states, Exception):
+            QtWidgets.QMessageBox.critical(self.parent, "Git-status", f"Fout:\n{states}")
+            return
+        if states is None:
+            QtWidgets.QMessageBox.information(self.parent, "Git-status", "Project staat niet in een Git-repo.")
+            return
+        dirty = {p: s for p, s in states.items() if s != CLEAN}
+        box = QtWidgets.QMessageBox(self.parent)
+        box.setWindowTitle("Git-status")
+        box.setText(f"{len(states)} script(s), {len(dirty)} niet ongewijzigd.")
+        width = max((len(p) for p in states), default=0)
+        box.setDetailedText(
+            "\n".join(f"{p.ljust(width)}  {STATE_LABELS.get(s, s)}" for p, s in sorted(states.items()))
+        )
+        box.exec()
+
+    # [END: _on_script_states]
+
     # [FUNC: open_project_creator]
     def open_project_creator(self):
         Ui_MainWindow = None
@@ -769,7 +962,6 @@ logger.debug("_git_record() called")
             QtWidgets.QMessageBox.information(
                 self.parent, "Project Creator", "MainWindow UI niet beschikbaar."
             )
-                logger.debug("_choose_creator_folder() called")
             return
         win = QtWidgets.QDialog(self.parent)
         ui_creator = Ui_MainWindow()
@@ -779,7 +971,6 @@ logger.debug("_git_record() called")
         try:
             ui_creator.SelectPrjocetFolder.clicked.disconnect()
         except Exception:
-            logger.debug("_on_start_create_project() called")
             pass
         ui_creator.SelectPrjocetFolder.clicked.connect(
             lambda: self._choose_creator_folder(ui_creator)
@@ -789,7 +980,6 @@ logger.debug("_git_record() called")
         except Exception:
             pass
         ui_creator.StartCreateProject.clicked.connect(
-            logger.debug("_run_create_project() called")
             lambda: self._on_start_create_project(win, ui_creator)
         )
         win.setWindowModality(QtCore.Qt.WindowModality.ApplicationModal)
@@ -825,7 +1015,6 @@ logger.debug("_git_record() called")
         if not base or not name:
             QtWidgets.QMessageBox.warning(
                 dlg, "Project", "Folder en projectnaam zijn verplicht."
-        logger.debug("_on_rm_error() called")
             )
             return
         script = (
@@ -841,7 +1030,6 @@ logger.debug("_git_record() called")
         try:
             proc = subprocess.run(args, capture_output=True, text=True, check=False)
             if proc.returncode == 0:
-            logger.debug("_prime_github_token_from_dotenv() called")
                 QtWidgets.QMessageBox.information(dlg, "Project", "Project aangemaakt.")
             else:
                 QtWidgets.QMessageBox.critical(
@@ -867,7 +1055,6 @@ logger.debug("_git_record() called")
 
     # [END: _on_rm_error]
 
-            logger.debug("_delete_local_venv_variants() called")
     # [FUNC: _prime_github_token_from_dotenv]
     def _prime_github_token_from_dotenv(self, project_root: Path):
         """
@@ -1,127 +1,94 @@
 # [SECTION: Imports]
-import logging
 from __future__ import annotations
 
-import json
-import subprocess
+import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from PyQt6 import QtWidgets
-logger = logging.getLogger(__name__)
 
+from handlers.git_bridge import in_background, report_save
+from services.config_model import ConfigError, load_config
+from services.git_repo import current_branch
+from services.git_service import get_git_service
+from services.json_store import STORE_KEY, save_json, sidecar_path
+from services.paths import to_rel_posix
+from services.fs_scan import IgnoreMatcher, ScanResult, incremental_scan, matcher_from_config
+from services.manifest import manifest_enabled, update_manifest
+from services.script_ops import ReconcileReport, reconcile_scripts, script_paths
 
+logger = logging.getLogger(__name__)
 
 # [END: Imports]
-# [FUNC: _run_git]
-logger.debug("_run_git() called")
-def _run_git(args: List[str], cwd: Path) -> tuple[int, str, str]:
-    p = subprocess.run(args, cwd=str(cwd), capture_output=True, text=True, shell=False)
-    return p.returncode, p.stdout.strip(), p.stderr.strip()
-
-# [END: _run_git]
-
-logger.debug("_git_is_repo() called")
-# [FUNC: _git_is_repo]
-def _git_is_repo(cwd: Path) -> bool:
-    rc, out, _ = _run_git(["git", "rev-parse", "--is-inside-work-tree"], cwd)
-    return rc == 0 and (out.lower() == "true")
-
-# [END: _git_is_repo]
-logger.debug("_git_current_branch() called")
-
-# [FUNC: _git_current_branch]
-def _git_current_branch(cwd: Path) -> Optional[str]:
-    rc, out, _ = _run_git(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd)
-    return out if rc == 0 and out else None
 
-# [END: _git_current_branch]
-    logger.debug("_git_after_save() called")
 
 # [FUNC: _git_after_save]
 def _git_after_save(cwd: Path, target_paths: List[Path], msg: str, parent) -> None:
     # target_paths: bestanden relatief aan cwd of absolute paden
-    rels: List[str] = []
-    for p in target_paths:
-        try:
-            rels.append(str(Path(p).resolve().relative_to(cwd.resolve())))
-        except Exception:
-            rels.append(str(Path(p).name))
-    rc, _, err = _run_git(["git", "add", *rels], cwd)
-    if rc != 0:
-        QtWidgets.QMessageBox.information(parent, "Git", f"git add faalde:\n{err}")
-        return
-    rc, _, err = _run_git(["git", "commit", "-m", msg], cwd)
-    if rc != 0:
-        QtWidgets.QMessageBox.information(
-            parent, "Git", f"git commit:\n{err or 'niets te committen'}"
-        )
-        return
-    rc, out, err = _run_git(["git", "push"], cwd)
-    if rc != 0:
-        QtWidgets.QMessageBox.information(
-            parent, "Git", f"git push faalde:\n{err or out}"
-        )
-    else:
-        QtWidgets.QMessageBox.information(
-            parent, "Git", "Wijzigingen gecommit en gepusht."
-        )
+    rels = [to_rel_posix(cwd, p) for p in target_paths]
+    report_save(get_git_service().save(cwd, rels, msg), parent)
 
 # [END: _git_after_save]
-logger.debug("_load_json() called")
+
+
+# [FUNC: _config_files]
+def _config_files(json_path: Path) -> List[Path]:
+    """Te committen bestanden: .projassist.json + bij de gesplitste layout de sidecar."""
+    store = load_config(json_path).get(STORE_KEY)
+    return [json_path, sidecar_path(json_path, store)] if store else [json_path]
+
+# [END: _config_files]
 
 
 
 # [FUNC: _load_json]
 def _load_json(path: Path) -> Dict[str, Any]:
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except FileNotFoundError:
-        return {}
-    except Exception:
-        logger.debug("_save_json() called")
-        return {}
+    # gevalideerd + gecachet (services.config_model); eigen wijzigbare kopie
+    return load_config(path).to_dict()
 
 # [END: _load_json]
 
 # [FUNC: _save_json]
 def _save_json(path: Path, data: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    logger.debug("_scan_scripts() called")
+    save_json(path, data)
 
 # [END: _save_json]
 
 
 
 # [FUNC: _scan_scripts]
-def _scan_scripts(root: Path, exts: tuple[str, ...] = (".py", ".ui")) -> List[str]:
-    out: List[str] = []
-    backup_root = (root / "backup").resolve()
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
-        # sla alles onder <root>/backup/… over
-        try:
-            if backup_root in p.resolve().parents:
-                continue
-        except Exception:
-            pass
-        if p.suffix.lower() in exts:
-            rel = p.relative_to(root).as_posix()
-            out.append(rel)
-    out.sort(key=lambda s: (0 if s.endswith(".py") else 1, s.lower()))
-    return out
+def _scan_scripts(
+    root: Path,
+    exts: tuple[str, ...] = (".py", ".ui"),
+    matcher: Optional[IgnoreMatcher] = None,
+    snapshot_path: Optional[Path] = None,
+) -> ScanResult:
+    """
+    scandir-walk: backup/, .git/, venv/, ... worden gesnoeid vóór het afdalen;
+    met snapshot_path worden enkel mappen met een gewijzigde mtime herlijst.
+    files/added/removed gefilterd op exts.
+    """
+    res = incremental_scan(root, matcher, snapshot_path)
+    exts = tuple(e.lower() for e in exts)
+
+    def keep(paths: set[str]) -> set[str]:
+        return {s for s in paths if s.lower().endswith(exts)}
+
+    return ScanResult(
+        files=keep(res.files),
+        added=keep(res.added),
+        removed=keep(res.removed),
+        relisted=res.relisted,
+        reused=res.reused,
+    )
 
 # [END: _scan_scripts]
 
 
 
-# [FUNC: _build_github_url_map]
-            logger.debug("_build_github_url_map() called")
-def _build_github_url_map(
-    root: Path, scripts: List[str], cfg: Dict[str, Any]
-) -> Dict[str, str]:
+# [FUNC: _github_url_for]
+def _github_url_for(root: Path, cfg: Dict[str, Any]) -> Optional[Callable[[str], str]]:
     """
     Verwacht in cfg (uit .projassist.json) bijv.:
       - 'github_repo': 'https://github.com/<owner>/<repo>'
@@ -129,31 +96,76 @@ def _build_github_url_map(
     """
     base = (cfg.get("github_repo") or "").strip()
     if not base:
-        return {}
+        return None
+    if base.endswith(".git"):
+        base = base[:-4]
     branch = (cfg.get("branch") or "").strip()
     if not branch:
-        # Probeer huidige branch uit Git te halen
-        if _git_is_repo(root):
-            branch = _git_current_branch(root) or "main"
-        else:
+        # Probeer huidige branch uit Git te halen (één keer per sync)
+        branch = current_branch(root) or "main"
+        if branch == "HEAD":  # detached
             branch = "main"
     # Maak browser-URL's (geen raw)
     # https://github.com/<owner>/<repo>/blob/<branch>/<path>
-    return {rel: f"{base.rstrip('/')}/blob/{branch}/{rel}" for rel in scripts}
+    prefix = f"{base.rstrip('/')}/blob/{branch}/"
+    return lambda rel: prefix + rel
+
+# [END: _github_url_for]
+
+
+
+# [FUNC: sync_scripts]
+def sync_scripts(
+    root: Path, json_path: Path, prune: bool = True, manifest: Optional[bool] = None
+) -> ReconcileReport:
+    """
+    Kern van de sync zonder UI/git: scan + reconcile (+ manifest), JSON enkel
+    schrijven bij wijzigingen. Gebruikt door SyncProjassistService en de
+    workspace-batch. manifest=None: bijwerken als de sectie al bestaat.
+    """
+    cfg = _load_json(json_path)
+    # slaat 'backup/' + standaardmappen + cfg["scan_ignore"] al over
+    scan = _scan_scripts(
+        root,
+        matcher=matcher_from_config(cfg),
+        snapshot_path=root / ".projassist_cache" / "scan_snapshot.pickle",
+    )
+    scanned = sorted(scan.files, key=lambda s: (0 if s.endswith(".py") else 1, s.lower()))
+
+    # Reconcile: één schema, verdwenen scripts eruit, renames via inhoud-hash
+    # (enkel onder de nieuw verschenen bestanden), script_urls opnieuw
+    # opgebouwd (zie services.script_ops)
+    report = reconcile_scripts(
+        root,
+        cfg,
+        scanned,
+        url_for=_github_url_for(root, cfg),
+        prune=prune,
+        added=scan.added,
+        removed=scan.removed,
+    )
+    if manifest or (manifest is None and manifest_enabled(cfg)):
+        delta = update_manifest(root, cfg, script_paths(cfg))
+        report.manifest_updates = (
+            len(delta.added) + len(delta.changed) + len(delta.touched) + len(delta.removed)
+        )
+    if report.changed:
+        _save_json(json_path, cfg)
+    return report
 
-# [END: _build_github_url_map]
+# [END: sync_scripts]
 
 
 
-logger.debug("run() called")
 # [CLASS: SyncProjassistService]
 @dataclass
 class SyncProjassistService:
     project_root: Path
     json_path: Path
     parent_window: QtWidgets.QWidget
+    prune: bool = True  # False: enkel toevoegen (oud gedrag), niets verwijderen
 
-# [FUNC: run]
+    # [FUNC: run]
     def run(self) -> None:
         root = self.project_root
         if not root or not root.exists():
@@ -167,53 +179,33 @@ class SyncProjassistService:
             )
             return
 
-        cfg = _load_json(self.json_path)
-        scanned = _scan_scripts(root)  # slaat 'backup/' al over
+        # scan + reconcile (git ls-files/hash-object) buiten de GUI-thread
+        json_path, prune = self.json_path, self.prune
+        in_background(lambda: sync_scripts(root, json_path, prune=prune), self._finish)
 
-        # Bestaande lijst ophalen/normaliseren en 'backup/' verwijderen
-        existing: List[str] = []
-        if isinstance(cfg.get("scripts"), list):
-            existing = [str(x) for x in cfg.get("scripts") if isinstance(x, (str,))]
-        existing = [s for s in existing if not s.startswith("backup/")]
+    # [END: run]
 
-        # Unieke merge: eerst bestaande (opgeschoond), dan nieuwe
-        existing_set = set(existing)
-        new_items = [s for s in scanned if s not in existing_set]
-        updated_list = existing + new_items
+    # [FUNC: _finish]
+    def _finish(self, report) -> None:
+        if isinstance(report, ConfigError):
+            QtWidgets.QMessageBox.critical(self.parent_window, "Sync", str(report))
+            return
+        if isinstance(report, Exception):
+            QtWidgets.QMessageBox.critical(self.parent_window, "Sync", f"Sync mislukt:\n{report}")
+            return
 
-        # URL-map opschonen (verwijder keys onder 'backup/')
-        url_map = (
-            cfg.get("script_urls") if isinstance(cfg.get("script_urls"), dict) else {}
-        )
-        if url_map:
-            url_map = {k: v for k, v in url_map.items() if not k.startswith("backup/")}
-
-        changed = bool(new_items or len(updated_list) != len(cfg.get("scripts", [])))
-        if changed:
-            cfg["scripts"] = updated_list
-            # URL's bijwerken of aanvullen
-            built_urls = _build_github_url_map(root, updated_list, cfg)
-            if built_urls:
-                url_map.update(built_urls)
-                cfg["script_urls"] = url_map
-            elif url_map:
-                cfg["script_urls"] = url_map
-
-            # Schrijf JSON
-            _save_json(self.json_path, cfg)
-
-            # Auto Git
-            if _git_is_repo(root):
-                _git_after_save(
-                    cwd=root,
-                    target_paths=[self.json_path],
-                    msg="SyncProjAssist: scripts gesynchroniseerd en JSON bijgewerkt",
-                    parent=self.parent_window,
-                )
+        if report.changed:
+            # Auto Git (achtergrond; geen repo → stil overgeslagen)
+            _git_after_save(
+                cwd=self.project_root,
+                target_paths=_config_files(self.json_path),
+                msg="SyncProjAssist: scripts gesynchroniseerd en JSON bijgewerkt",
+                parent=self.parent_window,
+            )
             QtWidgets.QMessageBox.information(
                 self.parent_window,
                 "Sync voltooid",
-                f"{len(new_items)} nieuw(e) script(s) toegevoegd en lijst opgeschoond.",
+                f"Scripts: {report.summary()}",
             )
         else:
             QtWidgets.QMessageBox.information(
@@ -222,6 +214,8 @@ class SyncProjassistService:
                 "Alle scripts stonden al correct in .projassist.json.",
             )
 
-# [END: run]
+    # [END: _finish]
+
+
 # [END: SyncProjassistService]
 
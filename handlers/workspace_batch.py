@@ -0,0 +1,212 @@
+# handlers/workspace_batch.py
+
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from handlers.marker_normalizer import (
+    listed_py_scripts,
+    normalize_listed,
+    normalize_project,
+)
+from handlers.sync_projassist import sync_scripts
+from services import git_ops
+from services.fs_scan import DEFAULT_IGNORES, IgnoreMatcher, iter_files
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+
+PROJECT_FILE = ".projassist.json"
+
+
+# Ontdekken
+# [FUNC: discover_projects]
+def discover_projects(base: Path) -> List[Path]:
+    """Alle .projassist.json onder base (backup/, venv/, .git/, ... gesnoeid)."""
+    base = Path(base)
+    # elk project heeft zijn eigen backup/ → hier niet enkel aan base verankeren
+    matcher = IgnoreMatcher.from_patterns([*DEFAULT_IGNORES, "backup/"])
+    found = [
+        base / rel
+        for rel in iter_files(base, matcher)
+        if rel.rsplit("/", 1)[-1] == PROJECT_FILE
+    ]
+    return sorted(found, key=lambda p: str(p).lower())
+
+# [END: discover_projects]
+
+
+# Rapport
+# [CLASS: ProjectResult]
+@dataclass
+class ProjectResult:
+    name: str
+    json_path: Path
+    sync: str = "—"
+    markers: str = "—"
+    git: str = "—"
+    errors: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+# [END: ProjectResult]
+
+
+# [CLASS: WorkspaceReport]
+@dataclass
+class WorkspaceReport:
+    base: Path
+    projects: List[ProjectResult]
+
+    # [FUNC: table]
+    def table(self) -> str:
+        head = ("Project", "Sync", "Markers", "Git", "Fouten", "Tijd")
+        rows = [
+            (
+                r.name,
+                r.sync,
+                r.markers,
+                r.git,
+                "; ".join(r.errors) or "—",
+                f"{r.seconds:.1f}s",
+            )
+            for r in self.projects
+        ]
+        widths = [max(len(str(c)) for c in col) for col in zip(head, *rows)]
+
+        def fmt(row) -> str:
+            return "  ".join(str(c).ljust(w) for c, w in zip(row, widths)).rstrip()
+
+        lines = [fmt(head), fmt(tuple("-" * w for w in widths))]
+        lines += [fmt(r) for r in rows]
+        n_err = sum(1 for r in self.projects if r.errors)
+        lines.append(f"{len(self.projects)} project(en), {n_err} met fouten.")
+        return "\n".join(lines)
+
+    # [END: table]
+
+
+# [END: WorkspaceReport]
+
+
+# Per project
+# [FUNC: _git_text]
+def _git_text(root: Path) -> str:
+    st = git_ops.status_summary(root)
+    if st is None:
+        return "geen repo"
+    parts = [st["branch"] or "?"]
+    if st["changed"] or st["untracked"]:
+        parts.append(f"{st['changed']} gewijzigd, {st['untracked']} nieuw")
+    else:
+        parts.append("schoon")
+    if st["ahead"] or st["behind"]:
+        parts.append(f"↑{st['ahead']} ↓{st['behind']}")
+    return ", ".join(parts)
+
+# [END: _git_text]
+
+
+# [FUNC: process_project]
+def process_project(
+    json_path: Path, do_sync: bool = True, apply_markers: bool = False
+) -> ProjectResult:
+    root = json_path.parent
+    res = ProjectResult(name=root.name, json_path=json_path)
+    t0 = time.perf_counter()
+
+    if do_sync:
+        try:
+            rep = sync_scripts(root, json_path)
+            res.sync = (
+                f"+{len(rep.added)} -{len(rep.removed)} ~{len(rep.renamed)}"
+                if rep.changed
+                else "ok"
+            )
+        except Exception as ex:
+            res.errors.append(f"sync: {ex}")
+
+    try:
+        if apply_markers:
+            done, errs = normalize_listed(root, listed_py_scripts(json_path))
+            res.markers = f"{len(done)} genormaliseerd"
+            res.errors.extend(errs)
+        else:
+            report = normalize_project(root, json_path, dry_run=True, max_workers=2)
+            n = len(report.changed_files)
+            res.markers = f"{n} te wijzigen" if n else "up-to-date"
+            res.errors.extend(f"{f.path}: {f.error}" for f in report.errors)
+    except Exception as ex:
+        res.errors.append(f"markers: {ex}")
+
+    try:
+        res.git = _git_text(root)
+    except Exception as ex:
+        res.errors.append(f"git: {ex}")
+
+    res.seconds = time.perf_counter() - t0
+    return res
+
+# [END: process_project]
+
+
+# Workspace
+# [FUNC: run_workspace]
+def run_workspace(
+    base: Path,
+    do_sync: bool = True,
+    apply_markers: bool = False,
+    max_workers: Optional[int] = None,
+) -> WorkspaceReport:
+    """
+    Sync + markers (dry-run, of toepassen met apply_markers) + git-status voor
+    elk project onder base, parallel op een begrensde pool. Geen UI, geen commits.
+    """
+    projects = discover_projects(base)
+    workers = max_workers or min(8, (os.cpu_count() or 2) + 2)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(
+            pool.map(lambda jp: process_project(jp, do_sync, apply_markers), projects)
+        )
+    return WorkspaceReport(Path(base), results)
+
+# [END: run_workspace]
+
+
+# CLI: python -m handlers.workspace_batch <map>
+# [FUNC: _main]
+def _main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        prog="python -m handlers.workspace_batch",
+        description="Sync, markers en git-status voor alle projecten onder een map.",
+    )
+    ap.add_argument("base", type=Path)
+    ap.add_argument("--no-sync", action="store_true")
+    ap.add_argument("--apply", action="store_true", help="markers ook toepassen")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    report = run_workspace(
+        args.base,
+        do_sync=not args.no_sync,
+        apply_markers=args.apply,
+        max_workers=args.workers,
+    )
+    print(report.table())
+    return 1 if any(r.errors for r in report.projects) else 0
+
+# [END: _main]
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
@@ -0,0 +1,156 @@
+# handlers/workspace_bootstrap.py
+
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from services.git_clone import CloneResult, fast_clone, repo_name
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+
+PROJECT_PREFIX = "project_"
+
+
+# Bronnen: GitHub-account of expliciete URL's/paden
+# [FUNC: github_repos]
+def github_repos(owner: str, prefix: str = PROJECT_PREFIX, token: Optional[str] = None) -> List[str]:
+    """Clone-URL's van alle repo's van owner waarvan de naam met prefix begint."""
+    import requests
+
+    token = token or os.getenv("GITHUB_TOKEN")
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"token {token}"
+    urls: List[str] = []
+    page = 1
+    while True:
+        resp = requests.get(
+            f"https://api.github.com/users/{owner}/repos",
+            headers=headers,
+            params={"per_page": 100, "page": page, "type": "owner"},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        batch = resp.json()
+        urls += [r["clone_url"] for r in batch if r["name"].startswith(prefix)]
+        if len(batch) < 100:
+            return sorted(urls, key=str.lower)
+        page += 1
+
+# [END: github_repos]
+
+
+# Rapport
+# [CLASS: BootstrapReport]
+@dataclass
+class BootstrapReport:
+    base: Path
+    results: List[CloneResult]
+
+    # [FUNC: table]
+    def table(self) -> str:
+        head = ("Project", "Status", "Mappen", "Fout", "Tijd")
+        rows = [
+            (
+                r.dest.name,
+                r.status,
+                ", ".join(r.sparse) or "—",
+                r.error.splitlines()[-1] if r.error else "—",
+                f"{r.seconds:.1f}s",
+            )
+            for r in self.results
+        ]
+        widths = [max(len(str(c)) for c in col) for col in zip(head, *rows)]
+
+        def fmt(row) -> str:
+            return "  ".join(str(c).ljust(w) for c, w in zip(row, widths)).rstrip()
+
+        lines = [fmt(head), fmt(tuple("-" * w for w in widths))]
+        lines += [fmt(r) for r in rows]
+        n_err = sum(1 for r in self.results if not r.ok)
+        lines.append(f"{len(self.results)} repo('s), {n_err} met fouten.")
+        return "\n".join(lines)
+
+    # [END: table]
+
+
+# [END: BootstrapReport]
+
+
+# Workspace klaarzetten
+# [FUNC: bootstrap_workspace]
+def bootstrap_workspace(
+    base: Path,
+    sources: Iterable[str],
+    sparse: bool = True,
+    depth: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> BootstrapReport:
+    """
+    Elke bron (URL of pad naar een bare repo) als partial clone onder
+    base/<naam>, parallel op een begrensde pool; klonen wachten vooral op het
+    netwerk, dus meer workers dan cores. Bestaande repo's blijven ongemoeid.
+    """
+    base = Path(base)
+    base.mkdir(parents=True, exist_ok=True)
+    sources = list(dict.fromkeys(sources))
+    workers = max_workers or min(8, len(sources) or 1)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(
+            pool.map(
+                lambda src: fast_clone(src, base / repo_name(src), sparse=sparse, depth=depth),
+                sources,
+            )
+        )
+    return BootstrapReport(base, results)
+
+# [END: bootstrap_workspace]
+
+
+# CLI: python -m handlers.workspace_bootstrap <map> [bronnen] [--owner X]
+# [FUNC: _main]
+def _main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        prog="python -m handlers.workspace_bootstrap",
+        description="Bestaande projecten snel klonen (partial, sparse) naar een werkmap.",
+    )
+    ap.add_argument("base", type=Path)
+    ap.add_argument("sources", nargs="*", help="clone-URL's of paden naar (bare) repo's")
+    ap.add_argument("--owner", help="alle repo's van dit GitHub-account met --prefix")
+    ap.add_argument("--prefix", default=PROJECT_PREFIX)
+    ap.add_argument("--full", action="store_true", help="volledige checkout i.p.v. sparse")
+    ap.add_argument("--depth", type=int, default=None, help="ook shallow (laatste N commits)")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    sources = list(args.sources)
+    if args.owner:
+        sources += github_repos(args.owner, args.prefix)
+    if not sources:
+        ap.error("geen bronnen: geef URL's/paden of --owner")
+
+    report = bootstrap_workspace(
+        args.base,
+        sources,
+        sparse=not args.full,
+        depth=args.depth,
+        max_workers=args.workers,
+    )
+    print(report.table())
+    return 1 if any(not r.ok for r in report.results) else 0
+
+# [END: _main]
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
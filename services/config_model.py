@@ -0,0 +1,374 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from services.json_store import STORE_KEY, materialize_scripts, sidecar_path
+from services.paths import resolved_root
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+# Schema van .projassist.json (JSON Schema-subset: type, properties, required,
+# additionalProperties, items, anyOf, minLength). Onbekende top-level keys
+# blijven toegelaten; enkel de keys die de app zelf leest worden gecontroleerd.
+_STR = {"type": "string"}
+_OPT_STR = {"type": ["string", "null"]}
+
+SCRIPT_SCHEMA: dict = {
+    "anyOf": [
+        {"type": "string", "minLength": 1},
+        {
+            "type": "object",
+            "required": ["path"],
+            "properties": {
+                "path": {"type": "string", "minLength": 1},
+                "name": _STR,
+                "type": _STR,
+                "github_url": _OPT_STR,
+            },
+        },
+    ]
+}
+
+SCHEMA: dict = {
+    "type": "object",
+    "properties": {
+        "project_name": _STR,
+        "profile": _STR,
+        "project_path": _STR,
+        "venv_root": _STR,
+        "venv_path": _STR,
+        "github_repo": _OPT_STR,
+        "gpt_status_url": _OPT_STR,
+        "scripts": {"type": "array", "items": SCRIPT_SCHEMA},
+        "script_urls": {"type": "object", "additionalProperties": _STR},
+        "scan_ignore": {"anyOf": [_STR, {"type": "array", "items": _STR}]},
+        STORE_KEY: {"type": "string", "minLength": 1},
+        "manifest": {"type": "object"},
+        "rules": {"type": "object"},
+        "ai_rules": {"type": "array", "items": {"type": "object"}},
+        "git_stage": {
+            "type": "object",
+            "properties": {
+                "max_file_mb": {"type": "number"},
+                "lfs": {"type": ["boolean", "null"]},
+                "block_dirs": {"type": "array", "items": _STR},
+            },
+        },
+    },
+}
+
+
+# [CLASS: ConfigError]
+class ConfigError(ValueError):
+    """Ongeldige .projassist.json (JSON-fout of schema-overtreding)."""
+
+
+# [END: ConfigError]
+
+Validator = Callable[[Any, str], None]
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+# [FUNC: compile_schema]
+def compile_schema(schema: dict) -> Validator:
+    """
+    Vertaal het schema één keer naar geneste closures; valideren is daarna
+    enkel functie-aanroepen, zonder het schema opnieuw te interpreteren.
+    De validator gooit ConfigError met de plaats van de fout (bv. scripts[3].path).
+    """
+    checks: list[Validator] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        preds = tuple(_TYPES[n] for n in names)
+        expected = " of ".join(names)
+
+        def check_type(v: Any, where: str) -> None:
+            if not any(p(v) for p in preds):
+                raise ConfigError(
+                    f"{where or 'document'}: verwacht {expected}, kreeg {type(v).__name__}"
+                )
+
+        checks.append(check_type)
+
+    if "minLength" in schema:
+        n = schema["minLength"]
+
+        def check_len(v: Any, where: str) -> None:
+            if isinstance(v, str) and len(v.strip()) < n:
+                raise ConfigError(f"{where}: mag niet leeg zijn")
+
+        checks.append(check_len)
+
+    if "anyOf" in schema:
+        options = [compile_schema(s) for s in schema["anyOf"]]
+
+        def check_any(v: Any, where: str) -> None:
+            errors = []
+            for opt in options:
+                try:
+                    opt(v, where)
+                    return
+                except ConfigError as ex:
+                    errors.append(str(ex))
+            raise ConfigError(errors[-1] if len(errors) == 1 else " | ".join(errors))
+
+        checks.append(check_any)
+
+    required = tuple(schema.get("required", ()))
+    props = {k: compile_schema(s) for k, s in schema.get("properties", {}).items()}
+    extra = schema.get("additionalProperties")
+    extra_check = compile_schema(extra) if isinstance(extra, dict) else None
+    if required or props or extra_check:
+
+        def check_object(v: Any, where: str) -> None:
+            if not isinstance(v, dict):
+                return
+            for key in required:
+                if key not in v:
+                    raise ConfigError(f"{where or 'document'}: '{key}' ontbreekt")
+            for key, val in v.items():
+                sub = props.get(key, extra_check)
+                if sub is not None:
+                    sub(val, f"{where}.{key}" if where else key)
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = compile_schema(schema["items"])
+
+        def check_items(v: Any, where: str) -> None:
+            if isinstance(v, list):
+                for i, item in enumerate(v):
+                    item_check(item, f"{where}[{i}]")
+
+        checks.append(check_items)
+
+    def validate(v: Any, where: str = "") -> None:
+        for c in checks:
+            c(v, where)
+
+    return validate
+
+# [END: compile_schema]
+
+
+_validate = compile_schema(SCHEMA)
+
+
+# [CLASS: ScriptEntry]
+@dataclass(frozen=True, slots=True)
+class ScriptEntry:
+    path: str
+    name: str
+    type: str
+    github_url: Optional[str] = None
+
+    # [FUNC: from_raw]
+    @classmethod
+    def from_raw(cls, raw: Any) -> "ScriptEntry":
+        path = (raw if isinstance(raw, str) else raw["path"]).strip().replace("\\", "/")
+        meta = raw if isinstance(raw, dict) else {}
+        return cls(
+            path=path,
+            name=meta.get("name") or Path(path).stem,
+            type=meta.get("type") or Path(path).suffix.lstrip(".").lower() or "py",
+            github_url=meta.get("github_url") or None,
+        )
+
+    # [END: from_raw]
+
+
+# [END: ScriptEntry]
+
+
+# [CLASS: ProjAssistConfig]
+@dataclass(frozen=True, slots=True)
+class ProjAssistConfig:
+    """Gevalideerde, onveranderlijke weergave van .projassist.json (gedeeld via de cache)."""
+
+    json_path: Path
+    project_name: str
+    github_repo: Optional[str] = None
+    scripts: Tuple[ScriptEntry, ...] = ()
+    script_urls: Dict[str, str] = field(default_factory=dict)
+    _raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    # [FUNC: project_root]
+    @property
+    def project_root(self) -> Path:
+        return self.json_path.parent
+
+    # [END: project_root]
+
+    # [FUNC: script_paths]
+    def script_paths(self) -> list[str]:
+        return [s.path for s in self.scripts]
+
+    # [END: script_paths]
+
+    # [FUNC: get]
+    def get(self, key: str, default: Any = None) -> Any:
+        """Overige (niet getypeerde) keys; geeft een kopie terug."""
+        return copy.deepcopy(self._raw.get(key, default))
+
+    # [END: get]
+
+    # [FUNC: to_dict]
+    def to_dict(self) -> dict:
+        """Eigen, wijzigbare kopie van het document (volgorde en extra keys intact)."""
+        return copy.deepcopy(self._raw)
+
+    # [END: to_dict]
+
+    # [FUNC: from_dict]
+    @classmethod
+    def from_dict(cls, json_path: Path, data: Any) -> "ProjAssistConfig":
+        _validate(data, "")
+        scripts: dict[str, ScriptEntry] = {}
+        for raw in data.get("scripts") or []:
+            entry = ScriptEntry.from_raw(raw)
+            scripts.setdefault(entry.path, entry)
+        return cls(
+            json_path=json_path,
+            project_name=data.get("project_name") or json_path.parent.name,
+            github_repo=data.get("github_repo") or None,
+            scripts=tuple(scripts.values()),
+            script_urls=dict(data.get("script_urls") or {}),
+            _raw=data,
+        )
+
+    # [END: from_dict]
+
+
+# [END: ProjAssistConfig]
+
+_CACHE: Dict[Path, Tuple[tuple, ProjAssistConfig]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+# [FUNC: _stamp]
+def _stamp(path: Path) -> Optional[tuple]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+# [END: _stamp]
+
+
+# [FUNC: load_config]
+def load_config(json_path: str | Path) -> ProjAssistConfig:
+    """
+    Lees + valideer .projassist.json, gecachet per (pad, mtime/size/inode van
+    het document en de eventuele scripts-sidecar). Herhaalde aanroepen zonder
+    wijziging op schijf parsen niets opnieuw. Ontbrekend bestand → lege config.
+    Raises ConfigError bij ongeldige JSON of een schema-overtreding.
+    """
+    jp = Path(json_path)
+    key = resolved_root(jp.parent) / jp.name
+    stamp = _stamp(key)
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+    if hit and hit[0][0] == stamp:
+        side = hit[1]._raw.get(STORE_KEY)
+        if not side or hit[0][1] == _stamp(sidecar_path(key, side)):
+            return hit[1]
+
+    if stamp is None:
+        return ProjAssistConfig.from_dict(key, {})
+    try:
+        data = json.loads(key.read_text(encoding="utf-8"))
+    except ValueError as ex:
+        raise ConfigError(f"{key}: geen geldige JSON ({ex})") from ex
+    side_stamp = None
+    if isinstance(data, dict) and data.get(STORE_KEY):
+        try:
+            side_stamp = _stamp(sidecar_path(key, data[STORE_KEY]))
+            materialize_scripts(key, data)
+        except ValueError as ex:
+            raise ConfigError(f"{key}: {ex}") from None
+    try:
+        cfg = ProjAssistConfig.from_dict(key, data)
+    except ConfigError as ex:
+        raise ConfigError(f"{key}: {ex}") from None
+    with _CACHE_LOCK:
+        _CACHE[key] = ((stamp, side_stamp), cfg)
+    return cfg
+
+# [END: load_config]
+
+
+# [CLASS: ConfigDiff]
+@dataclass(frozen=True, slots=True)
+class ConfigDiff:
+    keys: Tuple[str, ...] = ()  # gewijzigde top-level keys (buiten scripts)
+    scripts_added: Tuple[str, ...] = ()
+    scripts_removed: Tuple[str, ...] = ()
+    scripts_changed: Tuple[str, ...] = ()
+
+    # [FUNC: empty]
+    @property
+    def empty(self) -> bool:
+        return not (self.keys or self.scripts_added or self.scripts_removed or self.scripts_changed)
+
+    # [END: empty]
+
+    # [FUNC: summary]
+    def summary(self) -> str:
+        parts = []
+        if self.keys:
+            parts.append("gewijzigd: " + ", ".join(self.keys))
+        if self.scripts_added:
+            parts.append(f"{len(self.scripts_added)} script(s) toegevoegd")
+        if self.scripts_removed:
+            parts.append(f"{len(self.scripts_removed)} script(s) verwijderd")
+        if self.scripts_changed:
+            parts.append(f"{len(self.scripts_changed)} script(s) aangepast")
+        return "; ".join(parts) or "geen wijzigingen"
+
+    # [END: summary]
+
+
+# [END: ConfigDiff]
+
+
+# [FUNC: diff_configs]
+def diff_configs(old: Optional[ProjAssistConfig], new: ProjAssistConfig) -> ConfigDiff:
+    """Wat veranderde er tussen twee versies (scripts op pad, de rest per key)."""
+    old_raw = old._raw if old is not None else {}
+    skip = ("scripts", "script_urls")
+    keys = sorted(
+        k
+        for k in set(old_raw) | set(new._raw)
+        if k not in skip and old_raw.get(k) != new._raw.get(k)
+    )
+    before = {s.path: s for s in old.scripts} if old is not None else {}
+    after = {s.path: s for s in new.scripts}
+    return ConfigDiff(
+        keys=tuple(keys),
+        scripts_added=tuple(p for p in after if p not in before),
+        scripts_removed=tuple(p for p in before if p not in after),
+        scripts_changed=tuple(p for p in after if p in before and before[p] != after[p]),
+    )
+
+# [END: diff_configs]
@@ -0,0 +1,331 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+# Altijd overgeslagen (aanvulbaar/overschrijfbaar via "scan_ignore" in .projassist.json)
+DEFAULT_IGNORES: Tuple[str, ...] = (
+    "/backup/",
+    ".git/",
+    "venv/",
+    ".venv/",
+    "node_modules/",
+    "__pycache__/",
+    ".projassist_cache/",
+)
+
+
+# [FUNC: _translate]
+def _translate(pat: str) -> str:
+    """Vertaal één .gitignore-glob naar regex (zonder ankers)."""
+    out: List[str] = []
+    i, n = 0, len(pat)
+    while i < n:
+        c = pat[i]
+        if c == "*":
+            if pat.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pat.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = pat.find("]", i + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pat[i + 1 : j].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pat[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+# [END: _translate]
+
+
+# [CLASS: IgnoreMatcher]
+@dataclass
+class IgnoreMatcher:
+    """
+    .gitignore-achtige regels op relatieve POSIX-paden:
+    `#` commentaar, `!` heractiveert, `/` achteraan = enkel mappen, een `/`
+    vooraan of in het midden verankert aan de projectroot, `*`, `?`, `[..]`, `**`.
+    De laatste regel die matcht wint.
+    """
+
+    rules: List[Tuple[Pattern[str], bool, bool]] = field(default_factory=list)
+
+    # [FUNC: from_patterns]
+    @classmethod
+    def from_patterns(cls, patterns: Iterable[str]) -> "IgnoreMatcher":
+        rules: List[Tuple[Pattern[str], bool, bool]] = []
+        for raw in patterns:
+            pat = str(raw).strip()
+            if not pat or pat.startswith("#"):
+                continue
+            negate = pat.startswith("!")
+            if negate:
+                pat = pat[1:]
+            dir_only = pat.endswith("/")
+            pat = pat.rstrip("/")
+            anchored = "/" in pat
+            pat = pat.lstrip("/")
+            if not pat:
+                continue
+            body = _translate(pat)
+            rx = re.compile(("^" if anchored else "^(?:.*/)?") + body + "$")
+            rules.append((rx, negate, dir_only))
+        return cls(rules)
+
+    # [END: from_patterns]
+
+    # [FUNC: ignored]
+    def ignored(self, rel: str, is_dir: bool) -> bool:
+        hit = False
+        for rx, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if rx.match(rel):
+                hit = not negate
+        return hit
+
+    # [END: ignored]
+
+    # [FUNC: signature]
+    def signature(self) -> str:
+        """Hash van de regels; een andere set regels maakt een snapshot ongeldig."""
+        h = hashlib.sha1()
+        for rx, negate, dir_only in self.rules:
+            h.update(f"{rx.pattern}\0{negate:d}{dir_only:d}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    # [END: signature]
+
+
+# [END: IgnoreMatcher]
+
+
+# [FUNC: matcher_from_config]
+def matcher_from_config(cfg: dict) -> IgnoreMatcher:
+    """Standaardregels + `scan_ignore` (lijst of string met regels) uit .projassist.json."""
+    extra = cfg.get("scan_ignore") if isinstance(cfg, dict) else None
+    if isinstance(extra, str):
+        extra = extra.splitlines()
+    if not isinstance(extra, list):
+        extra = []
+    return IgnoreMatcher.from_patterns([*DEFAULT_IGNORES, *extra])
+
+# [END: matcher_from_config]
+
+
+# [FUNC: list_dir]
+def list_dir(
+    abs_dir: str, rel_dir: str, matcher: IgnoreMatcher
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Eén scandir-call: (bestanden, submappen) als (rel, abs), genegeerde mappen
+    al weggesnoeid. Type-info komt uit de DirEntry zelf (geen extra stat/resolve).
+    """
+    files: List[Tuple[str, str]] = []
+    dirs: List[Tuple[str, str]] = []
+    try:
+        it = os.scandir(abs_dir)
+    except OSError as ex:
+        logger.debug("scandir overgeslagen: %s (%s)", abs_dir, ex)
+        return files, dirs
+    with it:
+        for e in it:
+            rel = f"{rel_dir}/{e.name}" if rel_dir else e.name
+            try:
+                # symlink-mappen niet volgen (lussen, back-ups elders)
+                if e.is_dir(follow_symlinks=False):
+                    if not matcher.ignored(rel, True):
+                        dirs.append((rel, e.path))
+                elif e.is_file() and not matcher.ignored(rel, False):
+                    files.append((rel, e.path))
+            except OSError:
+                continue
+    return files, dirs
+
+# [END: list_dir]
+
+
+# [FUNC: iter_files]
+def iter_files(root: Path, matcher: Optional[IgnoreMatcher] = None) -> Iterator[str]:
+    """Alle niet-genegeerde bestanden onder root als relatieve POSIX-paden."""
+    matcher = matcher or IgnoreMatcher.from_patterns(DEFAULT_IGNORES)
+    stack: List[Tuple[str, str]] = [("", os.fspath(root))]
+    while stack:
+        rel_dir, abs_dir = stack.pop()
+        files, dirs = list_dir(abs_dir, rel_dir, matcher)
+        for rel, _ in files:
+            yield rel
+        stack.extend(dirs)
+
+# [END: iter_files]
+
+
+# [FUNC: scan_files]
+def scan_files(
+    root: Path,
+    exts: Tuple[str, ...],
+    matcher: Optional[IgnoreMatcher] = None,
+) -> List[str]:
+    exts = tuple(e.lower() for e in exts)
+    return [rel for rel in iter_files(root, matcher) if rel.lower().endswith(exts)]
+
+# [END: scan_files]
+
+
+# =========================================================
+# Incrementeel scannen met een bewaarde map-snapshot
+# =========================================================
+SNAPSHOT_VERSION = 1
+# mtime-granulariteit: mappen die vlak vóór de vorige scan wijzigden zijn
+# "racy" (een latere wijziging in dezelfde tik blijft onzichtbaar) → herlijsten
+RACY_NS = 2_000_000_000
+
+
+# [CLASS: ScanResult]
+@dataclass
+class ScanResult:
+    files: Set[str]
+    added: Set[str]
+    removed: Set[str]
+    relisted: int = 0  # mappen opnieuw gelijst (mtime gewijzigd/nieuw)
+    reused: int = 0  # mappen uit de snapshot (enkel een stat)
+
+
+# [END: ScanResult]
+
+
+# [FUNC: _load_snapshot]
+def _load_snapshot(path: Path, signature: str) -> Optional[dict]:
+    try:
+        with path.open("rb") as fh:
+            data = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        logger.warning("Scan-snapshot onleesbaar, volledige scan: %s", ex)
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != SNAPSHOT_VERSION
+        or data.get("signature") != signature
+    ):
+        return None
+    return data
+
+# [END: _load_snapshot]
+
+
+# [FUNC: _save_snapshot]
+def _save_snapshot(path: Path, data: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=path.name, dir=path.parent)
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError as ex:
+        logger.warning("Scan-snapshot niet opgeslagen: %s", ex)
+
+# [END: _save_snapshot]
+
+
+# [FUNC: incremental_scan]
+def incremental_scan(
+    root: Path,
+    matcher: Optional[IgnoreMatcher] = None,
+    snapshot_path: Optional[Path] = None,
+) -> ScanResult:
+    """
+    Scan met een bewaarde snapshot {map: (mtime_ns, bestanden, submappen)}.
+    Enkel mappen waarvan de mtime wijzigde worden opnieuw gelijst; de rest kost
+    één stat. added/removed zijn set-delta's t.o.v. de vorige snapshot.
+    Zonder snapshot_path: gewone volledige scan (added = alles).
+    """
+    matcher = matcher or IgnoreMatcher.from_patterns(DEFAULT_IGNORES)
+    signature = matcher.signature()
+    prev = _load_snapshot(snapshot_path, signature) if snapshot_path else None
+    old_dirs: Dict[str, Tuple[int, List[str], List[str]]] = prev["dirs"] if prev else {}
+    trusted_before = prev["taken_ns"] - RACY_NS if prev else 0
+
+    taken_ns = time.time_ns()
+    root_s = os.fspath(root)
+    new_dirs: Dict[str, Tuple[int, List[str], List[str]]] = {}
+    files: Set[str] = set()
+    relisted = reused = 0
+    stack: List[str] = [""]
+    while stack:
+        rel_dir = stack.pop()
+        abs_dir = os.path.join(root_s, rel_dir) if rel_dir else root_s
+        try:
+            mtime = os.stat(abs_dir).st_mtime_ns
+        except OSError:
+            continue
+        old = old_dirs.get(rel_dir)
+        if old and old[0] == mtime and mtime < trusted_before:
+            _, names, subdirs = old
+            reused += 1
+        else:
+            f, d = list_dir(abs_dir, rel_dir, matcher)
+            names = [rel.rsplit("/", 1)[-1] for rel, _ in f]
+            subdirs = [rel.rsplit("/", 1)[-1] for rel, _ in d]
+            relisted += 1
+        new_dirs[rel_dir] = (mtime, names, subdirs)
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        files.update(prefix + n for n in names)
+        stack.extend(prefix + n for n in subdirs)
+
+    old_files: Set[str] = set()
+    for rel_dir, (_, names, _) in old_dirs.items():
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        old_files.update(prefix + n for n in names)
+
+    if snapshot_path:
+        _save_snapshot(
+            snapshot_path,
+            {
+                "version": SNAPSHOT_VERSION,
+                "signature": signature,
+                "taken_ns": taken_ns,
+                "dirs": new_dirs,
+            },
+        )
+    return ScanResult(
+        files=files,
+        added=files - old_files,
+        removed=old_files - files,
+        relisted=relisted,
+        reused=reused,
+    )
+
+# [END: incremental_scan]
@@ -0,0 +1,331 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from services.git_repo import current_branch, find_repo_root
+from services.git_service import GitResult
+from services.git_status import FileStatus, RepoStatus, parse_porcelain_v2
+
+try:  # optioneel: git in-process i.p.v. één git-proces per bewerking
+    from dulwich import porcelain  # type: ignore
+    from dulwich.repo import Repo  # type: ignore
+except ImportError:  # pragma: no cover - afhankelijk van de omgeving
+    porcelain = None
+    Repo = None
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+# Standaard de git-executable; PROJASSIST_GIT_BACKEND=dulwich kiest (opt-in) de
+# in-process backend, enkel als dulwich geïnstalleerd is.
+BACKEND_ENV = "PROJASSIST_GIT_BACKEND"
+NOTHING_TO_COMMIT = "nothing to commit, working tree clean"
+
+
+# [FUNC: _posix]
+def _posix(p: str | bytes) -> str:
+    return (p.decode("utf-8", "replace") if isinstance(p, bytes) else p).replace("\\", "/")
+
+# [END: _posix]
+
+
+# [FUNC: _not_a_repo]
+def _not_a_repo(args: tuple, cwd: str | Path) -> GitResult:
+    return GitResult(args, 128, "", f"fatal: not a git repository: {cwd}")
+
+# [END: _not_a_repo]
+
+
+# [CLASS: GitBackend]
+class GitBackend:
+    """
+    Wat git_ops en GitService van git nodig hebben. Bewerkingen geven een
+    GitResult terug (zelfde vorm als een git-proces: returncode, stdout,
+    stderr), zodat de aanroepers niet weten welke backend er draait.
+    Repo-ontdekking en branch lezen gebeuren voor elke backend in Python
+    (services.git_repo).
+    """
+
+    name = "?"
+    in_process = False
+
+    # [FUNC: is_repo]
+    def is_repo(self, cwd: str | Path) -> bool:
+        return find_repo_root(cwd) is not None
+
+    # [END: is_repo]
+
+    # [FUNC: current_branch]
+    def current_branch(self, cwd: str | Path) -> Optional[str]:
+        return current_branch(cwd)
+
+    # [END: current_branch]
+
+    def add(self, paths: Iterable[str | Path], cwd: str | Path) -> GitResult:
+        raise NotImplementedError
+
+    def commit(self, message: str, cwd: str | Path) -> GitResult:
+        raise NotImplementedError
+
+    def rm(self, paths: Iterable[str | Path], cwd: str | Path, cached: bool = False) -> GitResult:
+        raise NotImplementedError
+
+    def push(self, cwd: str | Path, remote: str, branch: str) -> GitResult:
+        raise NotImplementedError
+
+    def status(self, cwd: str | Path) -> Optional[RepoStatus]:
+        raise NotImplementedError
+
+
+# [END: GitBackend]
+
+
+# [CLASS: SubprocessBackend]
+class SubprocessBackend(GitBackend):
+    """De git-executable via de gedeelde GitService (altijd beschikbaar)."""
+
+    name = "subprocess"
+
+    # [FUNC: __init__]
+    def __init__(self, service=None):
+        self._service = service
+
+    # [END: __init__]
+
+    # [FUNC: _run]
+    def _run(self, args: list[str], cwd: str | Path, locked: bool = True) -> GitResult:
+        if self._service is None:
+            from services.git_service import get_git_service
+
+            self._service = get_git_service()
+        return self._service.run_sync(args, cwd, locked=locked)
+
+    # [END: _run]
+
+    # [FUNC: add]
+    def add(self, paths, cwd):
+        return self._run(["add", "--", *(os.fspath(p) for p in paths)], cwd)
+
+    # [END: add]
+
+    # [FUNC: commit]
+    def commit(self, message, cwd):
+        return self._run(["commit", "-m", message], cwd)
+
+    # [END: commit]
+
+    # [FUNC: rm]
+    def rm(self, paths, cwd, cached=False):
+        args = ["rm"] + (["--cached"] if cached else [])
+        return self._run(args + ["--", *(os.fspath(p) for p in paths)], cwd)
+
+    # [END: rm]
+
+    # [FUNC: push]
+    def push(self, cwd, remote, branch):
+        return self._run(["push", remote, branch], cwd, locked=False)
+
+    # [END: push]
+
+    # [FUNC: status]
+    def status(self, cwd):
+        # één proces voor de hele repo, ongeacht het aantal bestanden; zonder
+        # optionele locks schrijft status de index niet bij (geen index.lock,
+        # en de index-stamp van de statuscache blijft geldig)
+        # de uitvoer komt in één keer terug; geparsed wordt res.data (bytes),
+        # niet res.stdout: die is met "replace" gedecodeerd en gestript
+        res = self._run(["--no-optional-locks", "status", "--porcelain=v2", "-z", "--branch"], cwd)
+        return parse_porcelain_v2(res.data) if res.ok else None
+
+    # [END: status]
+
+
+# [END: SubprocessBackend]
+
+
+# [CLASS: DulwichBackend]
+class DulwichBackend(GitBackend):
+    """
+    add/commit/rm/status in-process via dulwich: geen proces per bewerking,
+    de index en objecten worden rechtstreeks gelezen en geschreven.
+    push blijft bij de git-executable: die kent de credential helpers
+    (Git Credential Manager, ssh-agent) waar een GUI-app op rekent.
+    """
+
+    name = "dulwich"
+    in_process = True
+
+    # [FUNC: __init__]
+    def __init__(self, fallback: Optional[GitBackend] = None):
+        if porcelain is None:
+            raise RuntimeError("dulwich is niet geïnstalleerd")
+        self._fallback = fallback or SubprocessBackend()
+
+    # [END: __init__]
+
+    # [FUNC: _abs]
+    @staticmethod
+    def _abs(paths: Iterable[str | Path], cwd: str | Path) -> list[str]:
+        # git interpreteert paden relatief t.o.v. cwd; dulwich krijgt absolute paden
+        return [os.path.join(os.fspath(cwd), os.fspath(p)) for p in paths]
+
+    # [END: _abs]
+
+    # [FUNC: add]
+    def add(self, paths, cwd):
+        paths = list(paths)
+        args = ("add", "--", *(os.fspath(p) for p in paths))
+        root = find_repo_root(cwd)
+        if root is None:
+            return _not_a_repo(args, cwd)
+        try:
+            with Repo(str(root)) as r:
+                porcelain.add(r, self._abs(paths, cwd))
+        except Exception as ex:
+            return GitResult(args, 1, "", f"dulwich add: {ex}")
+        return GitResult(args, 0)
+
+    # [END: add]
+
+    # [FUNC: commit]
+    def commit(self, message, cwd):
+        args = ("commit", "-m", message)
+        root = find_repo_root(cwd)
+        if root is None:
+            return _not_a_repo(args, cwd)
+        try:
+            with Repo(str(root)) as r:
+                # dulwich commit ook een ongewijzigde index; git niet → zelf vergelijken
+                tree = r.open_index().commit(r.object_store)
+                try:
+                    head_tree = r[r.head()].tree
+                except KeyError:  # nog geen commits
+                    head_tree = None
+                if tree == head_tree or (head_tree is None and not len(r.open_index())):
+                    return GitResult(args, 1, NOTHING_TO_COMMIT)
+                sha = porcelain.commit(r, message=message.encode("utf-8"))
+        except Exception as ex:
+            return GitResult(args, 1, "", f"dulwich commit: {ex}")
+        return GitResult(args, 0, sha.decode("ascii")[:7])
+
+    # [END: commit]
+
+    # [FUNC: rm]
+    def rm(self, paths, cwd, cached=False):
+        paths = list(paths)
+        args = ("rm", *(["--cached"] if cached else []), "--", *(os.fspath(p) for p in paths))
+        root = find_repo_root(cwd)
+        if root is None:
+            return _not_a_repo(args, cwd)
+        try:
+            with Repo(str(root)) as r:
+                porcelain.rm(r, self._abs(paths, cwd), cached=cached)
+        except Exception as ex:
+            return GitResult(args, 1, "", f"dulwich rm: {ex}")
+        return GitResult(args, 0)
+
+    # [END: rm]
+
+    # [FUNC: push]
+    def push(self, cwd, remote, branch):
+        return self._fallback.push(cwd, remote, branch)
+
+    # [END: push]
+
+    # [FUNC: status]
+    def status(self, cwd):
+        root = find_repo_root(cwd)
+        if root is None:
+            return None
+        # fouten gaan naar de aanroeper (git_ops.status valt dan terug op git):
+        # hier zelf git starten kan niet, dit loopt binnen de repo-wachtrij
+        with Repo(str(root)) as r:
+            raw = porcelain.status(r, untracked_files="normal")
+            st = RepoStatus(branch=current_branch(root) or "")
+            try:
+                st.oid = r.head().decode("ascii")
+            except KeyError:  # nog geen commits
+                pass
+            xy: dict[str, list[str]] = {}
+            for code, key in (("A", "add"), ("D", "delete"), ("M", "modify")):
+                for p in raw.staged.get(key, ()):
+                    xy.setdefault(_posix(p), [".", "."])[0] = code
+            for p in raw.unstaged:
+                path = _posix(p)
+                code = "M" if os.path.lexists(os.path.join(root, path)) else "D"
+                xy.setdefault(path, [".", "."])[1] = code
+            for path, (x, y) in xy.items():
+                st.files[path] = FileStatus(path, "1", x + y)
+            for p in raw.untracked:
+                path = _posix(p)
+                st.files[path] = FileStatus(path, "?")
+            self._tracking(r, st)
+        return st
+
+    # [END: status]
+
+    # [FUNC: _tracking]
+    @staticmethod
+    def _tracking(r, st: RepoStatus) -> None:
+        # upstream uit branch.<naam>.remote/merge; ahead/behind door de historie te lopen
+        branch = st.branch
+        if not branch or branch == "HEAD":
+            return
+        cfg = r.get_config()
+        section = (b"branch", branch.encode("utf-8"))
+        try:
+            remote = cfg.get(section, b"remote").decode("utf-8")
+            merge = cfg.get(section, b"merge").decode("utf-8")
+        except KeyError:
+            return
+        name = merge[len("refs/heads/") :] if merge.startswith("refs/heads/") else merge
+        st.upstream = f"{remote}/{name}"
+        refs = r.refs.as_dict()
+        local = refs.get(f"refs/heads/{branch}".encode("utf-8"))
+        upstream = refs.get(f"refs/remotes/{remote}/{name}".encode("utf-8"))
+        if local is None or upstream is None or local == upstream:
+            return
+        st.ahead = sum(1 for _ in r.get_walker(include=[local], exclude=[upstream]))
+        st.behind = sum(1 for _ in r.get_walker(include=[upstream], exclude=[local]))
+
+    # [END: _tracking]
+
+
+# [END: DulwichBackend]
+
+_BACKEND: Optional[GitBackend] = None
+_BACKEND_LOCK = threading.Lock()
+
+
+# [FUNC: get_backend]
+def get_backend() -> GitBackend:
+    """Gedeelde backend: de git-executable, dulwich enkel op aanvraag (BACKEND_ENV)."""
+    global _BACKEND
+    with _BACKEND_LOCK:
+        if _BACKEND is None:
+            wanted = os.environ.get(BACKEND_ENV, "").strip().lower()
+            if wanted == DulwichBackend.name and porcelain is None:
+                logger.warning("%s=%s maar dulwich is niet geïnstalleerd", BACKEND_ENV, wanted)
+            if wanted == DulwichBackend.name and porcelain is not None:
+                _BACKEND = DulwichBackend()
+            else:
+                _BACKEND = SubprocessBackend()
+            logger.debug("git-backend: %s", _BACKEND.name)
+        return _BACKEND
+
+# [END: get_backend]
+
+
+# [FUNC: set_backend]
+def set_backend(backend: Optional[GitBackend]) -> None:
+    """Backend vastleggen (tests, instellingen); None → opnieuw automatisch kiezen."""
+    global _BACKEND
+    with _BACKEND_LOCK:
+        _BACKEND = backend
+
+# [END: set_backend]
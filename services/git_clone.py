@@ -0,0 +1,170 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+import math
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from services.config_model import ConfigError, load_config
+from services.git_repo import find_repo_root
+from services.git_service import get_git_service
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+PROJECT_FILE = ".projassist.json"
+# clone en sparse-checkout halen objecten over het netwerk: geen vaste limiet
+# (de 120 s van de GitService zou grote repo's halverwege afbreken)
+CLONE_TIMEOUT = math.inf
+
+
+# [CLASS: CloneResult]
+@dataclass
+class CloneResult:
+    url: str
+    dest: Path
+    status: str = "—"
+    sparse: List[str] = field(default_factory=list)  # cone-mappen; leeg = volledige checkout
+    error: str = ""
+    seconds: float = 0.0
+
+    # [FUNC: ok]
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+    # [END: ok]
+
+
+# [END: CloneResult]
+
+
+# [FUNC: repo_name]
+def repo_name(source: str) -> str:
+    """Mapnaam voor een clone-bron: laatste padstuk zonder .git (zoals git clone)."""
+    tail = source.rstrip("/\\").replace("\\", "/").rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+    return tail[:-4] if tail.endswith(".git") else tail
+
+# [END: repo_name]
+
+
+# [FUNC: clone_url]
+def clone_url(source: str) -> str:
+    """
+    Lokale paden (bv. een bare repo op een share) als file://-URL: bij een
+    gewoon pad kopieert git lokaal en negeert het --filter/--depth.
+    """
+    if "://" not in source and os.path.isdir(source):
+        return Path(source).resolve().as_uri()
+    return source
+
+# [END: clone_url]
+
+
+# [FUNC: sparse_dirs]
+def sparse_dirs(script_paths: Iterable[str]) -> List[str]:
+    """
+    Cone-mappen voor de sparse checkout: de mappen van de scripts, zonder
+    mappen die al onder een andere vallen (een cone neemt submappen mee).
+    Bestanden in de root staan in cone-modus altijd in de checkout.
+    """
+    norm = (p.replace("\\", "/") for p in script_paths)
+    dirs = sorted({p.rsplit("/", 1)[0] for p in norm if "/" in p})
+    kept: List[str] = []
+    for d in dirs:
+        if not any(d.startswith(k + "/") for k in kept):
+            kept.append(d)
+    return kept
+
+# [END: sparse_dirs]
+
+
+# [FUNC: fast_clone]
+def fast_clone(
+    source: str,
+    dest: str | Path,
+    sparse: bool = True,
+    depth: Optional[int] = None,
+    branch: Optional[str] = None,
+) -> CloneResult:
+    """
+    Snelle clone van een bestaand project (blokkerend; buiten de GUI-thread):
+    - partial clone (--filter=blob:none): alle commits, blobs pas bij checkout
+      of `git show` (de historiek blijft dus volledig bruikbaar)
+    - sparse=True: eerst enkel de rootbestanden (--sparse), dan de mappen uit
+      scripts[] van .projassist.json; staan die allemaal in de root, dan blijft
+      het daarbij; zonder scripts[] (of .projassist.json) volledige checkout
+    - depth: optioneel ook shallow (enkel de laatste `depth` commits)
+    Een bestaande repo in dest wordt niet aangeraakt.
+    """
+    dest = Path(dest)
+    res = CloneResult(url=source, dest=dest)
+    t0 = time.perf_counter()
+    try:
+        if dest.exists() and any(dest.iterdir()):
+            root = find_repo_root(dest)
+            if root is not None and os.path.samefile(root, dest):
+                res.status = "bestaat al"
+            else:
+                res.error = "map bestaat en is niet leeg"
+            return res
+        created = not dest.exists()
+        dest.mkdir(parents=True, exist_ok=True)
+
+        svc = get_git_service()
+        args = ["clone", "--filter=blob:none"]
+        if sparse:
+            args.append("--sparse")
+        if depth:
+            args += ["--depth", str(depth)]
+        if branch:
+            args += ["--branch", branch]
+        # clone naar "." met dest als cwd; het slot op dest zelf (niet op een repo
+        # waar de werkmap in ligt): elke clone een eigen slot → parallel
+        clone = svc.run_sync(
+            [*args, "--", clone_url(source), "."],
+            dest,
+            timeout=CLONE_TIMEOUT,
+            lock_key=dest,
+        )
+        if not clone.ok:
+            res.error = clone.output or f"git clone faalde ({clone.returncode})"
+            if created:
+                shutil.rmtree(dest, ignore_errors=True)
+            return res
+        res.status = "gekloond"
+        if not sparse:
+            return res
+
+        try:
+            scripts = load_config(dest / PROJECT_FILE).script_paths()
+        except ConfigError as ex:
+            logger.debug("%s: %s onleesbaar (%s)", dest.name, PROJECT_FILE, ex)
+            scripts = []
+        if not scripts:
+            step = svc.run_sync(["sparse-checkout", "disable"], dest, timeout=CLONE_TIMEOUT)
+        else:
+            res.sparse = sparse_dirs(scripts)
+            if not res.sparse:
+                res.status = "sparse (root)"
+                return res
+            step = svc.run_sync(
+                ["sparse-checkout", "set", "--cone", *res.sparse], dest, timeout=CLONE_TIMEOUT
+            )
+        if not step.ok:
+            res.error = f"sparse-checkout: {step.output}"
+        elif res.sparse:
+            res.status = f"sparse ({len(res.sparse)} map(pen))"
+        return res
+    except OSError as ex:
+        res.error = str(ex)
+        return res
+    finally:
+        res.seconds = time.perf_counter() - t0
+
+# [END: fast_clone]
@@ -0,0 +1,146 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from services.git_repo import find_repo_root
+from services.git_service import get_git_service
+from services.git_status import iter_records
+from services.paths import rel_posix
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+PAGE_SIZE = 50
+_FORMAT = "%H%x1f%h%x1f%aI%x1f%an%x1f%s"
+BLOB_CACHE_MAX = 64
+
+
+# [CLASS: Revision]
+@dataclass(frozen=True)
+class Revision:
+    sha: str
+    short: str
+    date: str  # ISO 8601 (auteursdatum)
+    author: str
+    subject: str
+    path: str  # repo-relatief pad in deze commit (volgt hernoemingen)
+
+    # [FUNC: label]
+    def label(self) -> str:
+        return f"{self.short}  {self.date[:16].replace('T', ' ')}  {self.subject}"
+
+    # [END: label]
+
+
+# [END: Revision]
+
+
+# [FUNC: parse_log]
+def parse_log(out: str) -> List[Revision]:
+    """
+    Uitvoer van `git log --follow -z --name-only --format=<_FORMAT>`: per
+    commit een header-record en een record met het pad ("\\n" vooraan).
+    """
+    revs: List[Revision] = []
+    head: Optional[List[str]] = None
+    for rec in iter_records([out]):
+        if "\x1f" in rec:
+            head = rec.lstrip("\n").split("\x1f", 4)
+        elif head is not None and rec.strip("\n"):
+            revs.append(Revision(*head, path=rec.strip("\n")))
+            head = None
+    return revs
+
+# [END: parse_log]
+
+
+# [CLASS: FileHistory]
+class FileHistory:
+    """
+    Historiek van één bestand, pagina per pagina opgehaald: de eerste pagina
+    is één korte `git log --follow -n <page>`; elke volgende pagina start bij
+    de laatst geziene commit en zijn toenmalige pad (--skip werkt niet samen
+    met --follow). Niet thread-safe voor gelijktijdige load_more-aanroepen;
+    blob-lezingen zijn gecachet (commits zijn onveranderlijk).
+    """
+
+    # [FUNC: __init__]
+    def __init__(self, path: str | Path, page_size: int = PAGE_SIZE):
+        self.file = Path(path)
+        root = find_repo_root(self.file)
+        if root is None:
+            raise ValueError(f"Niet in een Git-repo: {self.file}")
+        self.root = root
+        self.rel = rel_posix(root, self.file) or self.file.name
+        self.page_size = page_size
+        self.revisions: List[Revision] = []
+        self.exhausted = False
+        self._blobs: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # [END: __init__]
+
+    # [FUNC: load_more]
+    def load_more(self) -> List[Revision]:
+        """Volgende pagina (blokkerend; buiten de GUI-thread aanroepen)."""
+        if self.exhausted:
+            return []
+        args = ["log", "--follow", "-z", "--name-only", f"--format={_FORMAT}"]
+        if self.revisions:
+            last = self.revisions[-1]
+            args += [f"-n{self.page_size + 1}", last.sha, "--", last.path]
+        else:
+            args += [f"-n{self.page_size}", "HEAD", "--", self.rel]
+        res = get_git_service().run_sync(args, self.root)
+        if not res.ok:
+            # lege repo of onbekend pad: geen historiek
+            logger.debug("git log faalde: %s", res.output)
+            self.exhausted = True
+            return []
+        page = parse_log(res.stdout)
+        if self.revisions and page and page[0].sha == self.revisions[-1].sha:
+            page = page[1:]
+        if len(page) < self.page_size:
+            self.exhausted = True
+        self.revisions.extend(page)
+        return page
+
+    # [END: load_more]
+
+    # [FUNC: read]
+    def read(self, rev: Revision) -> bytes:
+        """Inhoud van het bestand in `rev` (`git show <sha>:<pad>`), gecachet."""
+        key = (rev.sha, rev.path)
+        with self._lock:
+            hit = self._blobs.get(key)
+            if hit is not None:
+                self._blobs.move_to_end(key)
+                return hit
+        res = get_git_service().run_sync(["show", f"{rev.sha}:{rev.path}"], self.root)
+        if not res.ok:
+            raise OSError(f"git show {rev.short}:{rev.path} faalde: {res.output}")
+        with self._lock:
+            self._blobs[key] = res.data
+            while len(self._blobs) > BLOB_CACHE_MAX:
+                self._blobs.popitem(last=False)
+        return res.data
+
+    # [END: read]
+
+    # [FUNC: restore]
+    def restore(self, rev: Revision) -> Path:
+        """Schrijf de inhoud uit `rev` terug naar het huidige bestand (byte-exact)."""
+        data = self.read(rev)
+        self.file.write_bytes(data)
+        return self.file
+
+    # [END: restore]
+
+
+# [END: FileHistory]
@@ -0,0 +1,248 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from services.git_repo import find_repo_root, git_dir
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+LOCK_FILE = "projassist.lock"  # in de git-map, naast index.lock
+FILE_LOCK_TIMEOUT = 30.0
+# wachttijden tussen pogingen als git/dulwich op een *.lock botst (≈5 s in totaal)
+RETRY_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.5, 2.0)
+_POLL_MAX = 0.25
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+# [CLASS: GitLockTimeout]
+class GitLockTimeout(TimeoutError):
+    """Een ander proces houdt het repo-slot langer vast dan de timeout."""
+
+
+# [END: GitLockTimeout]
+
+
+# [FUNC: is_lock_contention]
+def is_lock_contention(stderr: str) -> bool:
+    """
+    Mislukte git-/dulwich-stap door een bestaand lock-bestand? git meldt
+    "Unable to create '.../index.lock': File exists", dulwich geeft het pad
+    van het lock-bestand mee (FileLocked).
+    """
+    text = stderr.lower()
+    return ".lock" in text and ("file exists" in text or "dulwich" in text or "locked" in text)
+
+# [END: is_lock_contention]
+
+
+# [CLASS: RepoFileLock]
+class RepoFileLock:
+    """
+    Exclusief slot op <git-map>/projassist.lock voor alle ProjAssist-processen
+    op dezelfde repo (fcntl/msvcrt: het OS geeft het vrij als een proces sterft).
+    Externe git-aanroepen kennen dit slot niet; die vangt de index.lock-retry op.
+    """
+
+    # [FUNC: __init__]
+    def __init__(self, root: str | Path):
+        gd = git_dir(root) or Path(root) / ".git"
+        self.path = gd / LOCK_FILE
+        self._fd: Optional[int] = None
+
+    # [END: __init__]
+
+    # [FUNC: try_acquire]
+    def try_acquire(self) -> bool:
+        """Eén niet-blokkerende poging."""
+        if self._fd is not None:
+            return True
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as ex:
+            # geen schrijfbare git-map (bv. read-only checkout): niets te beschermen
+            logger.debug("Repo-slot niet aan te maken: %s (%s)", self.path, ex)
+            return True
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    # [END: try_acquire]
+
+    # [FUNC: acquire]
+    def acquire(self, timeout: float = FILE_LOCK_TIMEOUT) -> None:
+        """Blokkerend wachten (met oplopende pauzes) tot het slot vrij is."""
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while not self.try_acquire():
+            if time.monotonic() >= deadline:
+                raise GitLockTimeout(f"Repo bezet door een ander proces: {self.path}")
+            time.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX)
+
+    # [END: acquire]
+
+    # [FUNC: release]
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            if os.name == "nt":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    # [END: release]
+
+    # [FUNC: __enter__]
+    def __enter__(self) -> "RepoFileLock":
+        self.acquire()
+        return self
+
+    # [END: __enter__]
+
+    # [FUNC: __exit__]
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    # [END: __exit__]
+
+
+# [END: RepoFileLock]
+
+
+# [CLASS: RepoLocks]
+class RepoLocks:
+    """
+    Per repo één slot voor alle git-bewerkingen van de app:
+    - in het proces: een FIFO asyncio.Lock op de loop van de GitService
+      (hoofdvenster, Codewijziger en achtergrondtaken delen die wachtrij)
+    - tussen processen: RepoFileLock, zolang de bewerking loopt
+    - wachtrijdiepte per repo (wachtend + bezig) voor de statusbalk en
+      batchcode die wil doseren; listeners krijgen (root, diepte)
+    """
+
+    # [FUNC: __init__]
+    def __init__(self, file_lock_timeout: float = FILE_LOCK_TIMEOUT):
+        self.file_lock_timeout = file_lock_timeout
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._depth: Dict[str, int] = {}
+        self._listeners: List[Callable[[Path, int], None]] = []
+        self._mutex = threading.Lock()
+
+    # [END: __init__]
+
+    # [FUNC: key]
+    @staticmethod
+    def key(cwd: str | Path) -> str:
+        # sleutel = repo-root, zodat submappen van één repo dezelfde wachtrij delen
+        return os.path.normcase(os.fspath(find_repo_root(cwd) or os.path.abspath(cwd)))
+
+    # [END: key]
+
+    # [FUNC: add_listener]
+    def add_listener(self, callback: Callable[[Path, int], None]) -> None:
+        with self._mutex:
+            self._listeners.append(callback)
+
+    # [END: add_listener]
+
+    # [FUNC: remove_listener]
+    def remove_listener(self, callback: Callable[[Path, int], None]) -> None:
+        with self._mutex:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    # [END: remove_listener]
+
+    # [FUNC: depth]
+    def depth(self, cwd: Optional[str | Path] = None) -> int:
+        """Bewerkingen in de wachtrij (incl. de lopende) voor één repo, of in totaal."""
+        with self._mutex:
+            if cwd is None:
+                return sum(self._depth.values())
+            return self._depth.get(self.key(cwd), 0)
+
+    # [END: depth]
+
+    # [FUNC: _bump]
+    def _bump(self, key: str, delta: int) -> None:
+        with self._mutex:
+            n = self._depth.get(key, 0) + delta
+            if n:
+                self._depth[key] = n
+            else:
+                self._depth.pop(key, None)
+            listeners = list(self._listeners)
+        for cb in listeners:
+            try:
+                cb(Path(key), n)
+            except Exception:
+                logger.exception("Wachtrij-listener faalde")
+
+    # [END: _bump]
+
+    # [FUNC: slot]
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, cwd: str | Path, key: Optional[str | Path] = None
+    ) -> AsyncIterator[None]:
+        """
+        Exclusief repo-slot; enkel op de loop-thread van de GitService gebruiken.
+        key: expliciete map i.p.v. de repo-root van cwd (bv. een clone-doel
+        dat binnen een andere repo ligt).
+        """
+        key = os.path.normcase(os.path.abspath(key)) if key is not None else self.key(cwd)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._bump(key, +1)
+        try:
+            async with lock:
+                flock = RepoFileLock(key)
+                if not flock.try_acquire():
+                    logger.debug("Repo %s bezet door een ander proces; wachten", key)
+                    await asyncio.get_running_loop().run_in_executor(
+                        None, flock.acquire, self.file_lock_timeout
+                    )
+                try:
+                    yield
+                finally:
+                    flock.release()
+        finally:
+            self._bump(key, -1)
+
+    # [END: slot]
+
+    # [FUNC: clear]
+    def clear(self) -> None:
+        """Na het stoppen van de loop: asyncio-locks horen bij die loop."""
+        self._locks.clear()
+
+    # [END: clear]
+
+
+# [END: RepoLocks]
@@ -1,44 +1,57 @@
 # [SECTION: Imports]
 import logging
-import subprocess
+import hashlib
+import os
+import threading
 from pathlib import Path
-logger = logging.getLogger(__name__)
+from typing import Callable, Iterable
 
+from services.git_backend import GitBackend, SubprocessBackend, get_backend
+from services.git_repo import find_repo_root, git_dir
+from services.git_service import GitResult, get_git_service
+from services.git_status import CLEAN, RepoStatus
+from services.paths import rel_posix
 
+logger = logging.getLogger(__name__)
 
 # [END: Imports]
+
+
 # [FUNC: _run_git]
 def _run_git(args: list[str], cwd: str | Path) -> tuple[bool, str]:
     """
-    Voer een git-commando uit in `cwd`.
+    Voer een git-commando uit in `cwd` via de gedeelde GitService (zelfde
+    repo-wachtrij als de GUI). Blokkerend: niet vanuit de GUI-thread gebruiken;
+    daar get_git_service().run()/save() met een callback.
     Retourneert (ok, gecombineerd stdout/stderr).
-logger.debug("_run_git() called")
     """
-    try:
-        result = subprocess.run(
-            ["git", *args],
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            shell=False,
-            check=False,
-        )
-        ok = result.returncode == 0
-        output = (result.stdout or "") + (result.stderr or "")
-        return ok, output.strip()
-    except Exception as ex:
-        return False, f"git error: {ex}"
+    res = get_git_service().run_sync(args, cwd)
+    return res.ok, res.output
 
 # [END: _run_git]
 
 
 
+# [FUNC: _call]
+def _call(cwd: str | Path, op: Callable[[GitBackend], object]):
+    """
+    op(backend) op de actieve backend (services.git_backend). In-process
+    backends lopen via GitService.call, zodat ze de repo-wachtrij delen met
+    de git-processen; de subprocess-backend zit daar zelf al in.
+    """
+    backend = get_backend()
+    if backend.in_process:
+        return get_git_service().call(lambda: op(backend), cwd).result()
+    return op(backend)
+
+# [END: _call]
+
+
+
 # [FUNC: is_repo]
-logger.debug("is_repo() called")
 def is_repo(folder: str | Path) -> bool:
-    """True als `folder` zich binnen een git repository bevindt."""
-    ok, _ = _run_git(["rev-parse", "--is-inside-work-tree"], cwd=folder)
-    return ok
+    """True als `folder` zich binnen een git repository bevindt (zonder git-proces)."""
+    return get_backend().is_repo(folder)
 
 # [END: is_repo]
 
@@ -46,12 +59,11 @@ def is_repo(folder: str | Path) -> bool:
 
 # [FUNC: add]
 def add(paths: list[str | Path], cwd: str | Path) -> tuple[bool, str]:
-logger.debug("add() called")
     """
     `git add -- <paths>`
     """
-    args = ["add", "--"] + [str(p) for p in paths]
-    return _run_git(args, cwd=cwd)
+    res = _call(cwd, lambda b: b.add([str(p) for p in paths], cwd))
+    return res.ok, res.output
 
 # [END: add]
 
@@ -59,33 +71,33 @@ logger.debug("add() called")
 
 # [FUNC: commit]
 def commit(message: str, cwd: str | Path) -> tuple[bool, str]:
-logger.debug("commit() called")
     """
     `git commit -m <message>`
     Geeft (True, "Nothing to commit") terug als er niets te committen is.
     """
-    ok, out = _run_git(["commit", "-m", message], cwd=cwd)
+    res = _call(cwd, lambda b: b.commit(message, cwd))
+    ok, out = res.ok, res.output
     if not ok and "nothing to commit" in out.lower():
         return True, "Nothing to commit"
     return ok, out
 
 # [END: commit]
 
-logger.debug("_current_branch() called")
 
 
 # [FUNC: _current_branch]
 def _current_branch(cwd: str | Path) -> tuple[bool, str]:
-    """Haal huidige branchnaam op."""
-    ok, out = _run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd)
-    return ok, out
+    """Haal huidige branchnaam op (uit .git/HEAD, zonder git-proces)."""
+    branch = get_backend().current_branch(cwd)
+    if branch is None:
+        return False, f"Geen git-repo: {cwd}"
+    return True, branch
 
 # [END: _current_branch]
 
 
 
 # [FUNC: push]
-    logger.debug("push() called")
 def push(
     cwd: str | Path, remote: str = "origin", branch: str | None = None
 ) -> tuple[bool, str]:
@@ -97,14 +109,15 @@ def push(
         if not ok:
             return False, out
         branch = out.strip()
-    return _run_git(["push", remote, branch], cwd=cwd)
+    # push altijd rechtstreeks: ook de in-process backend pusht via git zelf
+    res = get_backend().push(cwd, remote, branch)
+    return res.ok, res.output
 
 # [END: push]
 
 
 
 # [FUNC: rm]
-        logger.debug("rm() called")
 def rm(
     paths: list[str | Path], cwd: str | Path, cached: bool = False
 ) -> tuple[bool, str]:
@@ -112,11 +125,155 @@ def rm(
     `git rm [--cached] -- <paths>`
     Handig wanneer je ook uit git-index wil verwijderen bij het wissen van bestanden.
     """
-    args = ["rm"]
-    if cached:
-        args.append("--cached")
-    args += ["--"] + [str(p) for p in paths]
-    return _run_git(args, cwd=cwd)
+    res = _call(cwd, lambda b: b.rm([str(p) for p in paths], cwd, cached=cached))
+    return res.ok, res.output
 
 # [END: rm]
 
+
+
+
+# [FUNC: blob_sha1]
+def blob_sha1(data: bytes) -> str:
+    """Git blob-id van `data` (zelfde als `git hash-object`), zonder subprocess."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+# [END: blob_sha1]
+
+
+
+# [FUNC: index_blobs]
+def index_blobs(paths: list[str], cwd: str | Path) -> dict[str, str]:
+    """
+    Blob-id's uit de git-index voor `paths` (ook als ze al van schijf verdwenen).
+    Niet-getrackte paden ontbreken in het resultaat; geen repo → {}.
+    """
+    if not paths:
+        return {}
+    ok, out = _run_git(["ls-files", "-s", "-z", "--", *paths], cwd=cwd)
+    if not ok:
+        return {}
+    blobs: dict[str, str] = {}
+    for rec in out.split("\0"):
+        meta, sep, path = rec.partition("\t")
+        parts = meta.split()
+        if sep and len(parts) == 3:
+            blobs[path] = parts[1]
+    return blobs
+
+# [END: index_blobs]
+
+
+
+
+# [FUNC: _stamp]
+def _stamp(root: Path, paths: Iterable[str | Path]) -> tuple:
+    # git-gebeurtenissen (add/commit/checkout/fetch) raken index, HEAD of refs;
+    # wijzigingen in de werkmap zien we via de stat van de opgegeven paden
+    gd = git_dir(root) or (root / ".git")
+    head = gd / "HEAD"
+    try:
+        ref = head.read_text(encoding="utf-8").strip()
+    except OSError:
+        ref = ""
+    files = [gd / "index", head, gd / "packed-refs", gd / "FETCH_HEAD"]
+    if ref.startswith("ref:"):
+        files.append(gd / ref[4:].strip())
+    files += [root / p for p in paths]
+    out = []
+    for f in files:
+        try:
+            st = os.stat(f)
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append(None)
+    return tuple(out)
+
+# [END: _stamp]
+
+
+_STATUS_CACHE: dict[str, tuple[tuple, RepoStatus]] = {}
+_STATUS_LOCK = threading.Lock()
+
+
+# [FUNC: status]
+def status(cwd: str | Path, paths: Iterable[str | Path] = ()) -> RepoStatus | None:
+    """
+    Status van de hele repo in één bewerking (`git status --porcelain=v2 -z`
+    of dulwich); None als geen repo. Met `paths` (relatief t.o.v. de
+    repo-root) gecachet per repo tot de volgende git-gebeurtenis, een
+    wijziging aan één van die paden of invalidate_status() (bv. vanuit een
+    bestandswatcher). Zonder `paths` altijd vers: voor andere bestanden in de
+    werkmap bestaat geen goedkoop signaal.
+    """
+    root = find_repo_root(cwd)
+    if root is None:
+        return None
+    paths = list(paths)
+    key = os.path.normcase(os.fspath(root))
+    stamp = _stamp(root, paths)
+    with _STATUS_LOCK:
+        hit = _STATUS_CACHE.get(key)
+    if paths and hit is not None and hit[0] == stamp:
+        return hit[1]
+    try:
+        st = _call(root, lambda b: b.status(root))
+    except Exception as ex:
+        logger.debug("status via %s faalde (%s); val terug op git", get_backend().name, ex)
+        st = SubprocessBackend().status(root)
+    if isinstance(st, GitResult):
+        # repo bleef bezet (GitService.call): laatst bekende status, niet cachen
+        logger.debug("status %s: %s", root, st.output)
+        return hit[1] if hit is not None else None
+    if st is not None:
+        with _STATUS_LOCK:
+            _STATUS_CACHE[key] = (stamp, st)
+    return st
+
+# [END: status]
+
+
+# [FUNC: invalidate_status]
+def invalidate_status(cwd: str | Path | None = None) -> None:
+    """Gecachete status vergeten: voor de repo van `cwd`, of alles (None)."""
+    with _STATUS_LOCK:
+        if cwd is None:
+            _STATUS_CACHE.clear()
+            return
+        root = find_repo_root(cwd)
+        if root is not None:
+            _STATUS_CACHE.pop(os.path.normcase(os.fspath(root)), None)
+
+# [END: invalidate_status]
+
+
+# [FUNC: status_summary]
+def status_summary(cwd: str | Path) -> dict | None:
+    """
+    Compacte status: {"branch", "upstream", "ahead", "behind", "changed",
+    "untracked"}; None als geen repo.
+    """
+    st = status(cwd)
+    return st.summary() if st is not None else None
+
+# [END: status_summary]
+
+
+# [FUNC: script_states]
+def script_states(project_root: str | Path, scripts: Iterable[str]) -> dict[str, str] | None:
+    """
+    Git-toestand per script (paden uit scripts[] van .projassist.json,
+    relatief t.o.v. de projectroot) → {pad: state uit services.git_status}.
+    Eén statusaanroep voor alle scripts; None als het project geen repo is.
+    """
+    root = find_repo_root(project_root)
+    if root is None:
+        return None
+    scripts = list(scripts)
+    rels = {s: rel_posix(root, Path(project_root) / s) for s in scripts}
+    st = status(root, [r for r in rels.values() if r])
+    if st is None:
+        return None
+    return {s: (st.state_of(r) if r else CLEAN) for s, r in rels.items()}
+
+# [END: script_states]
@@ -0,0 +1,125 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+# Repo-ontdekking zonder git-proces: ouders aflopen op zoek naar `.git`.
+# Resultaat gecachet per startmap, samen met de mtime van elke bekeken map:
+# een `.git` aanmaken of verwijderen wijzigt de mtime van die map, dus één
+# stat per map volstaat om te weten of het resultaat nog klopt.
+_Chain = Tuple[Tuple[str, int], ...]
+_CACHE: Dict[str, Tuple[Optional[str], _Chain]] = {}
+_LOCK = threading.Lock()
+
+
+# [FUNC: _ceilings]
+def _ceilings() -> set[str]:
+    raw = os.environ.get("GIT_CEILING_DIRECTORIES", "")
+    return {os.path.normcase(os.path.abspath(p)) for p in raw.split(os.pathsep) if p}
+
+# [END: _ceilings]
+
+
+# [FUNC: _mtime]
+def _mtime(d: str) -> int:
+    try:
+        return os.stat(d).st_mtime_ns
+    except OSError:
+        return -1
+
+# [END: _mtime]
+
+
+# [FUNC: _walk]
+def _walk(start: str) -> Tuple[Optional[str], _Chain]:
+    ceilings = _ceilings()
+    chain: List[Tuple[str, int]] = []
+    d = start
+    while True:
+        chain.append((d, _mtime(d)))
+        if os.path.exists(os.path.join(d, ".git")):
+            return d, tuple(chain)
+        parent = os.path.dirname(d)
+        if parent == d or os.path.normcase(parent) in ceilings:
+            return None, tuple(chain)
+        d = parent
+
+# [END: _walk]
+
+
+# [FUNC: find_repo_root]
+def find_repo_root(path: str | Path) -> Optional[Path]:
+    """
+    Werkmap-root van de git-repo waar `path` in ligt (map met `.git`, ook een
+    `.git`-bestand van worktrees/submodules), of None. Geen subprocess.
+    """
+    p = os.path.abspath(os.fspath(path))
+    start = p if os.path.isdir(p) else os.path.dirname(p)
+    with _LOCK:
+        hit = _CACHE.get(start)
+    if hit is not None:
+        root, chain = hit
+        if all(_mtime(d) == m for d, m in chain):
+            return Path(root) if root else None
+    root, chain = _walk(start)
+    with _LOCK:
+        _CACHE[start] = (root, chain)
+    return Path(root) if root else None
+
+# [END: find_repo_root]
+
+
+# [FUNC: clear_cache]
+def clear_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+
+# [END: clear_cache]
+
+
+# [FUNC: git_dir]
+def git_dir(root: str | Path) -> Optional[Path]:
+    """De echte git-map: `.git` zelf, of het doel van `gitdir: ...` in een `.git`-bestand."""
+    dot = Path(root) / ".git"
+    if dot.is_dir():
+        return dot
+    try:
+        text = dot.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not text.startswith("gitdir:"):
+        return None
+    target = Path(text[len("gitdir:") :].strip())
+    return target if target.is_absolute() else (Path(root) / target)
+
+# [END: git_dir]
+
+
+# [FUNC: current_branch]
+def current_branch(path: str | Path) -> Optional[str]:
+    """
+    Huidige branch uit `.git/HEAD` (zoals `git rev-parse --abbrev-ref HEAD`):
+    branchnaam, "HEAD" bij een detached HEAD, None buiten een repo.
+    """
+    root = find_repo_root(path)
+    gd = git_dir(root) if root else None
+    if gd is None:
+        return None
+    try:
+        head = (gd / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError as ex:
+        logger.debug("HEAD niet leesbaar in %s (%s)", gd, ex)
+        return None
+    if head.startswith("ref:"):
+        ref = head[4:].strip()
+        return ref[len("refs/heads/") :] if ref.startswith("refs/heads/") else ref
+    return "HEAD"
+
+# [END: current_branch]
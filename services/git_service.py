@@ -0,0 +1,441 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import math
+import os
+import subprocess
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from services.git_lock import RETRY_DELAYS, GitLockTimeout, RepoLocks, is_lock_contention
+from services.git_repo import find_repo_root
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+DEFAULT_TIMEOUT = 120.0
+# git mag nooit interactief op credentials wachten (geen console in de GUI)
+_GIT_ENV = {"GIT_TERMINAL_PROMPT": "0", "GCM_INTERACTIVE": "never"}
+
+
+# [CLASS: GitResult]
+@dataclass(frozen=True)
+class GitResult:
+    args: Tuple[str, ...]
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+    data: bytes = field(default=b"", repr=False)  # stdout onbewerkt (bv. blob-inhoud)
+
+    # [FUNC: ok]
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+    # [END: ok]
+
+    # [FUNC: output]
+    @property
+    def output(self) -> str:
+        """Gecombineerd stdout/stderr (zoals git_ops._run_git het altijd gaf)."""
+        return "\n".join(s for s in (self.stdout, self.stderr) if s).strip()
+
+    # [END: output]
+
+    # [FUNC: not_a_repo]
+    @property
+    def not_a_repo(self) -> bool:
+        return "not a git repository" in self.stderr.lower()
+
+    # [END: not_a_repo]
+
+
+# [END: GitResult]
+
+
+# [CLASS: GitSaveResult]
+@dataclass
+class GitSaveResult:
+    """Resultaat van add → commit; stopt bij de eerste mislukte stap."""
+
+    steps: List[GitResult] = field(default_factory=list)
+    push_queued: bool = False  # push aangemeld bij de PushQueue
+    skipped: str = ""  # wat de stage-filter tegenhield of naar LFS stuurde
+
+    # [FUNC: failed]
+    @property
+    def failed(self) -> Optional[GitResult]:
+        return next((s for s in self.steps if not s.ok), None)
+
+    # [END: failed]
+
+    # [FUNC: ok]
+    @property
+    def ok(self) -> bool:
+        return bool(self.steps) and self.failed is None
+
+    # [END: ok]
+
+    # [FUNC: no_repo]
+    @property
+    def no_repo(self) -> bool:
+        return self.failed is not None and self.failed.not_a_repo
+
+    # [END: no_repo]
+
+    # [FUNC: nothing_to_commit]
+    @property
+    def nothing_to_commit(self) -> bool:
+        f = self.failed
+        return f is not None and f.args[:1] == ("commit",) and "nothing to commit" in f.output.lower()
+
+    # [END: nothing_to_commit]
+
+    # [FUNC: summary]
+    def summary(self) -> str:
+        f = self.failed
+        note = f"\n{self.skipped}" if self.skipped else ""
+        if not self.steps:
+            return f"Niets gecommit.{note}"
+        if f is None:
+            if self.push_queued:
+                return f"Wijzigingen gecommit; push volgt op de achtergrond.{note}"
+            return f"Wijzigingen gecommit.{note}"
+        if self.no_repo:
+            return "Niet in een Git-repo; commit/push overgeslagen."
+        if self.nothing_to_commit:
+            return "git commit: niets te committen"
+        return f"git {f.args[0]} faalde:\n{f.output}"
+
+    # [END: summary]
+
+
+# [END: GitSaveResult]
+
+
+# [CLASS: GitService]
+class GitService:
+    """
+    Eén plek voor alle git-aanroepen, op een asyncio-loop in een achtergrondthread.
+
+    - elke aanroep geeft een concurrent.futures.Future terug (add_done_callback,
+      of .result() vanuit niet-UI-code); de GUI-thread wacht nooit
+    - per repository een FIFO-slot (services.git_lock.RepoLocks, ook over
+      processen heen): bewerkingen op dezelfde repo lopen strikt na elkaar in
+      volgorde van indienen; verschillende repo's lopen parallel
+    - netwerkbewerkingen (push) lopen buiten het slot (locked=False): een
+      trage remote houdt lokale commits en status niet op
+    - botst een stap toch op een *.lock (externe git, editor), dan volgt een
+      nieuwe poging met oplopende pauzes (RETRY_DELAYS)
+    - processen via asyncio.create_subprocess_exec, met timeout en zonder
+      interactieve prompts
+    """
+
+    # [FUNC: __init__]
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.locks = RepoLocks()
+        self.push_queue = None  # standaard: services.push_queue.get_push_queue()
+        self.backend = None  # standaard: services.git_backend.get_backend()
+
+    # [END: __init__]
+
+    # [FUNC: get_push_queue]
+    def get_push_queue(self):
+        if self.push_queue is None:
+            from services.push_queue import get_push_queue
+
+            self.push_queue = get_push_queue()
+        return self.push_queue
+
+    # [END: get_push_queue]
+
+    # [FUNC: get_backend]
+    def get_backend(self):
+        if self.backend is None:
+            from services.git_backend import get_backend
+
+            self.backend = get_backend()
+        return self.backend
+
+    # [END: get_backend]
+
+    # [FUNC: _ensure_loop]
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or self._loop.is_closed():
+                # op Windows is de standaardloop (Proactor) nodig voor subprocessen
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_serve, name="git-service", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    # [END: _ensure_loop]
+
+    # [FUNC: shutdown]
+    def shutdown(self) -> None:
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            loop.close()
+        self.locks.clear()
+
+    # [END: shutdown]
+
+    # [FUNC: _exec]
+    async def _exec(
+        self,
+        args: Sequence[str],
+        cwd: str,
+        input: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ) -> GitResult:
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                *args,
+                cwd=cwd,
+                stdin=asyncio.subprocess.DEVNULL if input is None else asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ, **_GIT_ENV},
+                **kwargs,
+            )
+        except (OSError, ValueError) as ex:
+            return GitResult(tuple(args), -1, "", f"git error: {ex}")
+        limit = self.timeout if timeout is None else timeout
+        try:
+            out, err = await asyncio.wait_for(
+                proc.communicate(input), None if limit == math.inf else limit
+            )
+        except asyncio.TimeoutError:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass  # net zelf afgesloten
+            await proc.wait()
+            return GitResult(tuple(args), -1, "", f"git {args[0]}: timeout na {limit:.0f}s")
+        return GitResult(
+            tuple(args),
+            proc.returncode if proc.returncode is not None else -1,
+            out.decode("utf-8", "replace").strip(),
+            err.decode("utf-8", "replace").strip(),
+            out,
+        )
+
+    # [END: _exec]
+
+    # [FUNC: _retrying]
+    async def _retrying(self, attempt: Callable[[], Awaitable[GitResult]]) -> GitResult:
+        res = await attempt()
+        for delay in RETRY_DELAYS:
+            if res.ok or not is_lock_contention(res.stderr):
+                break
+            logger.debug("git %s: lock bezet, nieuwe poging over %.2fs", res.args[:1], delay)
+            await asyncio.sleep(delay)
+            res = await attempt()
+        return res
+
+    # [END: _retrying]
+
+    # [FUNC: queue_depth]
+    def queue_depth(self, cwd: Optional[str | Path] = None) -> int:
+        """Git-bewerkingen die wachten of lopen (voor één repo, of in totaal)."""
+        return self.locks.depth(cwd)
+
+    # [END: queue_depth]
+
+    # [FUNC: _submit]
+    def _submit(self, coro_factory: Callable[[], "asyncio.Future"]) -> concurrent.futures.Future:
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro_factory(), loop)
+
+    # [END: _submit]
+
+    # [FUNC: run]
+    def run(
+        self,
+        args: Sequence[str],
+        cwd: str | Path,
+        input: Optional[bytes] = None,
+        locked: bool = True,
+        timeout: Optional[float] = None,
+        lock_key: Optional[str | Path] = None,
+    ) -> concurrent.futures.Future:
+        """
+        `git <args>` in cwd (optioneel met stdin, bv. --stdin -z) → Future[GitResult].
+        locked=False: buiten het repo-slot en de bestandslock (enkel voor git
+        dat zelf zijn refs locket en lang op het netwerk wacht, zoals push).
+        timeout: eigen limiet i.p.v. self.timeout; math.inf = onbeperkt.
+        lock_key: slot op deze map i.p.v. op de repo-root van cwd.
+        """
+        cwd_s = os.fspath(cwd)
+        args = list(args)
+
+        async def _one() -> GitResult:
+            if not locked:
+                return await self._retrying(lambda: self._exec(args, cwd_s, input, timeout))
+            try:
+                async with self.locks.slot(cwd_s, lock_key):
+                    return await self._retrying(lambda: self._exec(args, cwd_s, input, timeout))
+            except GitLockTimeout as ex:
+                return GitResult(tuple(args), -1, "", str(ex))
+
+        return self._submit(_one)
+
+    # [END: run]
+
+    # [FUNC: call]
+    def call(self, fn: Callable[[], object], cwd: str | Path) -> concurrent.futures.Future:
+        """
+        fn() (in-process git, bv. dulwich) in een workerthread, in dezelfde
+        repo-wachtrij als de git-processen → Future met het resultaat van fn.
+        Blijft de repo bezet (GitLockTimeout), dan is het resultaat een
+        mislukt GitResult, zoals bij run/save.
+        """
+        cwd_s = os.fspath(cwd)
+
+        async def _call():
+            try:
+                async with self.locks.slot(cwd_s):
+                    return await asyncio.get_running_loop().run_in_executor(None, fn)
+            except GitLockTimeout as ex:
+                return GitResult(("call",), -1, "", str(ex))
+
+        return self._submit(_call)
+
+    # [END: call]
+
+    # [FUNC: run_sync]
+    def run_sync(
+        self,
+        args: Sequence[str],
+        cwd: str | Path,
+        input: Optional[bytes] = None,
+        locked: bool = True,
+        timeout: Optional[float] = None,
+        lock_key: Optional[str | Path] = None,
+    ) -> GitResult:
+        """Blokkerend, voor CLI/achtergrondcode; niet vanuit de GUI-thread gebruiken."""
+        return self.run(args, cwd, input, locked, timeout, lock_key).result()
+
+    # [END: run_sync]
+
+    # [FUNC: save]
+    def save(
+        self,
+        cwd: str | Path,
+        paths: Iterable[str | Path],
+        message: str,
+        push: bool = True,
+    ) -> concurrent.futures.Future:
+        """
+        add → commit als één eenheid in de repo-wachtrij → Future[GitSaveResult].
+        Met een in-process backend (dulwich) zonder git-proces, anders via git.
+        De commit is lokaal en meteen klaar; met push=True wordt de repo bij de
+        PushQueue aangemeld (gebundelde push op de achtergrond).
+        Geen rev-parse-calls: de repo wordt in Python gevonden (services.git_repo).
+        """
+        cwd_s = os.fspath(cwd)
+        root = find_repo_root(cwd_s)
+        if root is None:
+            # geen repo: meteen klaar, zonder één proces te starten
+            done: concurrent.futures.Future = concurrent.futures.Future()
+            done.set_result(
+                GitSaveResult([GitResult(("add",), 128, "", "fatal: not a git repository")])
+            )
+            return done
+        paths = [os.fspath(p) for p in paths]
+        backend = self.get_backend()
+
+        def _filter() -> Tuple[List[str], str]:
+            # stat-filter vóór de add (buildmappen, te grote bestanden → LFS of weg);
+            # .gitignore laat git/dulwich zelf toepassen, zonder extra proces
+            from services.stage_filter import plan_stage, track_lfs
+
+            plan = plan_stage(root, paths, cwd=cwd_s, check_ignore=False)
+            staged = list(plan.stage)
+            if plan.lfs:
+                attrs = track_lfs(root, plan.lfs)
+                if attrs is not None:
+                    staged.append(os.path.relpath(attrs, cwd_s))
+            return staged, plan.summary()
+
+        async def _steps(staged: List[str]) -> List[GitResult]:
+            loop = asyncio.get_running_loop()
+            if backend.in_process:
+                calls = [lambda: backend.add(staged, cwd_s), lambda: backend.commit(message, cwd_s)]
+            else:
+                calls = [("add", "--", *staged), ("commit", "-m", message)]
+            results: List[GitResult] = []
+            for step in calls:
+                if callable(step):
+                    res = await self._retrying(lambda: loop.run_in_executor(None, step))
+                else:
+                    res = await self._retrying(lambda: self._exec(step, cwd_s))
+                results.append(res)
+                if not res.ok:
+                    break
+            return results
+
+        async def _save() -> GitSaveResult:
+            # filter, add en commit samen onder het repo-slot: saves blijven in volgorde
+            try:
+                async with self.locks.slot(cwd_s):
+                    staged, skipped = await asyncio.get_running_loop().run_in_executor(None, _filter)
+                    if skipped:
+                        logger.warning("git save in %s: %s", root, skipped)
+                    if not staged:
+                        return GitSaveResult([], skipped=skipped)
+                    res = GitSaveResult(await _steps(staged), skipped=skipped)
+            except GitLockTimeout as ex:
+                return GitSaveResult([GitResult(("add",), -1, "", str(ex))])
+            if push and res.ok:
+                self.get_push_queue().request(root)
+                res.push_queued = True
+            return res
+
+        return self._submit(_save)
+
+    # [END: save]
+
+
+# [END: GitService]
+
+_SERVICE: Optional[GitService] = None
+_SERVICE_LOCK = threading.Lock()
+
+
+# [FUNC: get_git_service]
+def get_git_service() -> GitService:
+    """Gedeelde service voor het hele proces."""
+    global _SERVICE
+    with _SERVICE_LOCK:
+        if _SERVICE is None:
+            _SERVICE = GitService()
+        return _SERVICE
+
+# [END: get_git_service]
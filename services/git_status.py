@@ -0,0 +1,182 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+CLEAN = "clean"
+MODIFIED = "modified"  # werkmap gewijzigd (eventueel ook al deels gestaged)
+STAGED = "staged"  # enkel in de index gewijzigd
+RENAMED = "renamed"
+DELETED = "deleted"
+UNTRACKED = "untracked"
+CONFLICT = "conflict"
+IGNORED = "ignored"
+
+STATE_LABELS = {
+    CLEAN: "ongewijzigd",
+    MODIFIED: "gewijzigd",
+    STAGED: "gestaged",
+    RENAMED: "hernoemd",
+    DELETED: "verwijderd",
+    UNTRACKED: "niet getrackt",
+    CONFLICT: "conflict",
+    IGNORED: "genegeerd",
+}
+
+
+# [CLASS: FileStatus]
+@dataclass(frozen=True, slots=True)
+class FileStatus:
+    path: str  # POSIX, relatief t.o.v. de repo-root; map eindigt op "/"
+    kind: str  # "1" gewoon, "2" hernoemd, "u" conflict, "?" untracked, "!" genegeerd
+    xy: str = ".."  # index + werkmap, zoals git ("." = ongewijzigd)
+    orig_path: Optional[str] = None
+
+    # [FUNC: state]
+    @property
+    def state(self) -> str:
+        if self.kind == "u":
+            return CONFLICT
+        if self.kind == "?":
+            return UNTRACKED
+        if self.kind == "!":
+            return IGNORED
+        if "D" in self.xy:
+            return DELETED
+        if self.xy[1] != ".":
+            return MODIFIED
+        return RENAMED if self.kind == "2" else STAGED
+
+    # [END: state]
+
+
+# [END: FileStatus]
+
+
+# [CLASS: RepoStatus]
+@dataclass
+class RepoStatus:
+    branch: str = ""  # "HEAD" bij een detached HEAD (zoals git_repo.current_branch)
+    oid: str = ""  # "" zolang er nog geen commits zijn
+    upstream: str = ""
+    ahead: int = 0
+    behind: int = 0
+    files: Dict[str, FileStatus] = field(default_factory=dict)
+
+    # [FUNC: state_of]
+    def state_of(self, rel: str) -> str:
+        """Toestand van één pad (POSIX, relatief t.o.v. de repo-root)."""
+        hit = self.files.get(rel)
+        if hit is not None:
+            return hit.state
+        # git toont een nieuwe map als één regel "map/": alles eronder is nieuw
+        parts = rel.split("/")
+        for i in range(len(parts) - 1, 0, -1):
+            hit = self.files.get("/".join(parts[:i]) + "/")
+            if hit is not None:
+                return hit.state
+        return CLEAN
+
+    # [END: state_of]
+
+    # [FUNC: summary]
+    def summary(self) -> dict:
+        """{"branch", "upstream", "ahead", "behind", "changed", "untracked"} (workspace-overzicht)."""
+        untracked = sum(1 for f in self.files.values() if f.kind == "?")
+        changed = sum(1 for f in self.files.values() if f.kind not in ("?", "!"))
+        return {
+            "branch": self.branch,
+            "upstream": self.upstream,
+            "ahead": self.ahead,
+            "behind": self.behind,
+            "changed": changed,
+            "untracked": untracked,
+        }
+
+    # [END: summary]
+
+
+# [END: RepoStatus]
+
+
+# [FUNC: iter_records]
+def iter_records(chunks: Iterable[str]) -> Iterator[str]:
+    """NUL-gescheiden records uit tekst die in stukken binnenkomt (een record mag over stukken lopen)."""
+    rest = ""
+    for chunk in chunks:
+        buf = rest + chunk if rest else chunk
+        start = 0
+        while True:
+            end = buf.find("\0", start)
+            if end < 0:
+                break
+            yield buf[start:end]
+            start = end + 1
+        rest = buf[start:]
+    if rest:
+        yield rest
+
+# [END: iter_records]
+
+
+# [FUNC: _header]
+def _header(st: RepoStatus, rec: str) -> None:
+    key, _, val = rec[2:].partition(" ")
+    if key == "branch.oid":
+        st.oid = "" if val == "(initial)" else val
+    elif key == "branch.head":
+        st.branch = "HEAD" if val == "(detached)" else val
+    elif key == "branch.upstream":
+        st.upstream = val
+    elif key == "branch.ab":
+        a, _, b = val.partition(" ")
+        st.ahead, st.behind = int(a.lstrip("+") or 0), int(b.lstrip("-") or 0)
+
+# [END: _header]
+
+
+# [FUNC: parse_porcelain_v2]
+def parse_porcelain_v2(out: bytes | Iterable[str]) -> RepoStatus:
+    """
+    Uitvoer van `git status --porcelain=v2 -z --branch` → RepoStatus, in één
+    doorloop over de records (ook voor repo's met tienduizenden bestanden).
+    Bij voorkeur stdout onbewerkt (bytes): gesplitst op NUL en per record
+    gedecodeerd (surrogateescape), zodat spaties aan het eind van een pad en
+    niet-UTF-8-namen intact blijven. Tekst in stukken gaat via iter_records.
+    """
+    st = RepoStatus()
+    if isinstance(out, bytes):
+        records = (r.decode("utf-8", "surrogateescape") for r in out.split(b"\0"))
+    else:
+        records = iter_records(out)
+    for rec in records:
+        if not rec:
+            continue
+        kind = rec[0]
+        if kind == "#":
+            _header(st, rec)
+        elif kind == "1":
+            # 1 XY sub mH mI mW hH hI pad
+            f = rec.split(" ", 8)
+            st.files[f[8]] = FileStatus(f[8], "1", f[1])
+        elif kind == "2":
+            # 2 XY sub mH mI mW hH hI Xscore pad \0 oud-pad
+            f = rec.split(" ", 9)
+            st.files[f[9]] = FileStatus(f[9], "2", f[1], next(records, None))
+        elif kind == "u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 pad
+            f = rec.split(" ", 10)
+            st.files[f[10]] = FileStatus(f[10], "u", f[1])
+        elif kind in "?!":
+            path = rec[2:]
+            st.files[path] = FileStatus(path, kind)
+        else:
+            logger.debug("Onbekend status-record: %r", rec[:40])
+    return st
+
+# [END: parse_porcelain_v2]
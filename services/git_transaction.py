@@ -0,0 +1,213 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+# Open transacties per thread: schrijvers melden hun paden via record_path in
+# de thread van de actie (uitgestelde ProjectConfig-writes worden bij het
+# verlaten van het blok in diezelfde thread geflusht). Schrijvers in andere
+# threads (marker-watcher, workspace-batch) komen dus niet in deze commit.
+_LOCAL = threading.local()
+_LOCK = threading.Lock()
+
+
+# [FUNC: _active]
+def _active() -> List["GitTransaction"]:
+    stack = getattr(_LOCAL, "stack", None)
+    if stack is None:
+        stack = _LOCAL.stack = []
+    return stack
+
+# [END: _active]
+
+
+# [CLASS: GitTransaction]
+class GitTransaction:
+    """
+    Verzamelt de paden die één gebruikersactie aanraakt; bij het verlaten van
+    git_transaction() volgt één add + commit (GitService.save) voor allemaal.
+    """
+
+    # [FUNC: __init__]
+    def __init__(self, root: Optional[Path], message: str, push: bool = True):
+        self.root = root
+        self.message = message
+        self.push = push
+        self._paths: dict[str, None] = {}  # geordende set
+        # schrijvers kunnen het opgeloste pad melden (ProjectConfig) → beide vormen
+        self._prefixes: tuple[str, ...] = ()
+        if root is not None:
+            from services.paths import resolved_root
+
+            forms = {os.path.normcase(os.fspath(f)) for f in (root, resolved_root(root))}
+            self._prefixes = tuple(f.rstrip(os.sep) + os.sep for f in forms)
+        self.future: Optional[concurrent.futures.Future] = None
+
+    # [END: __init__]
+
+    # [FUNC: touch]
+    def touch(self, *paths: str | Path) -> None:
+        """Paden expliciet meenemen (ook verwijderde bestanden)."""
+        with _LOCK:
+            for p in paths:
+                self._paths[os.path.abspath(os.fspath(p))] = None
+
+    # [END: touch]
+
+    # [FUNC: paths]
+    @property
+    def paths(self) -> List[str]:
+        with _LOCK:
+            return list(self._paths)
+
+    # [END: paths]
+
+    # [FUNC: _covers]
+    def _covers(self, path: str) -> bool:
+        return os.path.normcase(path).startswith(self._prefixes) if self._prefixes else False
+
+    # [END: _covers]
+
+    # [FUNC: commit]
+    def commit(self) -> Optional[concurrent.futures.Future]:
+        """
+        add + commit van alle verzamelde paden → Future[GitSaveResult]; None als
+        er niets te doen is. Blokkeert niet (ook niet vanuit de GUI-thread): de
+        index-check voor verwijderde paden loopt zelf in de repo-wachtrij.
+        """
+        from services.git_repo import find_repo_root
+        from services.git_service import get_git_service
+        from services.paths import rel_posix
+
+        if self.root is None or not self.paths:
+            return None
+        repo = find_repo_root(self.root)
+        if repo is None:
+            return None
+        rels: dict[str, str] = {}  # repo-relatief → absoluut
+        for p in self.paths:
+            rel = rel_posix(repo, p)
+            if rel:
+                rels.setdefault(rel, p)
+        if not rels:
+            return None
+        svc = get_git_service()
+        missing = {rel for rel, p in rels.items() if not os.path.lexists(p)}
+        if not missing:
+            self.future = svc.save(repo, list(rels), self.message, push=self.push)
+            return self.future
+        # verwijderd: enkel meenemen wat git kent (add van een onbekend pad faalt)
+        self.future = concurrent.futures.Future()
+        check = svc.run(["ls-files", "-z", "--", *sorted(missing)], repo)
+        check.add_done_callback(lambda f: self._save_known(f, repo, list(rels), missing))
+        return self.future
+
+    # [END: commit]
+
+    # [FUNC: _save_known]
+    def _save_known(
+        self,
+        check: concurrent.futures.Future,
+        repo: Path,
+        rels: List[str],
+        missing: set[str],
+    ) -> None:
+        from services.git_service import GitSaveResult, get_git_service
+
+        out = self.future
+        try:
+            res = check.result()
+            tracked = {p for p in res.stdout.split("\0") if p} if res.ok else set()
+            keep = [rel for rel in rels if rel not in missing or rel in tracked]
+            if not keep:
+                out.set_result(GitSaveResult([]))
+                return
+            save = get_git_service().save(repo, keep, self.message, push=self.push)
+        except Exception as ex:
+            out.set_exception(ex)
+            return
+        save.add_done_callback(lambda f: _forward(f, out))
+
+    # [END: _save_known]
+
+
+# [END: GitTransaction]
+
+
+# [FUNC: _forward]
+def _forward(src: concurrent.futures.Future, dst: concurrent.futures.Future) -> None:
+    ex = src.exception()
+    if ex is not None:
+        dst.set_exception(ex)
+    else:
+        dst.set_result(src.result())
+
+# [END: _forward]
+
+
+# [FUNC: record_path]
+def record_path(path: str | Path) -> None:
+    """
+    Door schrijvers (json_store, script_ops, ...) aan te roepen na elke write
+    of delete; telt enkel voor transacties die in deze thread open staan.
+    """
+    active = _active()
+    if not active:
+        return
+    p = os.path.abspath(os.fspath(path))
+    with _LOCK:
+        for tx in active:
+            if tx._covers(p):
+                tx._paths[p] = None
+
+# [END: record_path]
+
+
+# [FUNC: git_transaction]
+@contextmanager
+def git_transaction(
+    project_root: Optional[str | Path], message: str, push: bool = True
+) -> Iterator[GitTransaction]:
+    """
+    `with git_transaction(project_root, msg) as tx:` — alles wat binnen het blok
+    onder project_root geschreven wordt (bronbestanden, .projassist.json,
+    sidecar) gaat in één commit. Een uitzondering in het blok → geen commit.
+    Genest op dezelfde root (in dezelfde thread) → de buitenste transactie
+    neemt alles mee.
+    Zonder project_root (geen project geladen) wordt er niets gecommit.
+    """
+    root = Path(os.path.abspath(os.fspath(project_root))) if project_root else None
+    active = _active()
+    outer = next((t for t in active if root is not None and t.root == root), None)
+    if outer is not None:
+        yield outer
+        return
+    tx = GitTransaction(root, message, push)
+    active.append(tx)
+    try:
+        yield tx
+        _flush_configs()
+    finally:
+        active.remove(tx)
+    tx.commit()
+
+# [END: git_transaction]
+
+
+# [FUNC: _flush_configs]
+def _flush_configs() -> None:
+    # uitgestelde .projassist.json-writes horen bij deze actie → nu schrijven
+    from services.project_config import ProjectConfig
+
+    ProjectConfig.flush_all()
+
+# [END: _flush_configs]
@@ -4,38 +4,75 @@ import json
 import os
 import tempfile
 from pathlib import Path
-logger = logging.getLogger(__name__)
+from typing import Any, Iterable, Iterator, Optional
 
+from services.git_transaction import record_path
+from services.paths import resolved_root
 
+logger = logging.getLogger(__name__)
 
 # [END: Imports]
+# Optionele gesplitste layout: scripts[] (+ script_urls) in een JSON Lines-sidecar.
+# De top-level .projassist.json bevat dan enkel {"scripts_store": "<bestandsnaam>"}
+# (een relatief pad binnen de projectroot). Lezers die het document rechtstreeks
+# als JSON openen zien dan geen scripts[]: lees via load_json()/load_config().
+STORE_KEY = "scripts_store"
+DEFAULT_SIDECAR = ".projassist.scripts.jsonl"
+COMPACT_MIN_RECORDS = 64
+
+
+
+# [FUNC: sidecar_path]
+def sidecar_path(json_path: str | Path, name: Any) -> Path:
+    """
+    Pad van de sidecar uit "scripts_store": relatief t.o.v. de projectroot (map
+    van .projassist.json) en er ook na resolve (.., symlinks) binnen.
+    Raises ValueError bij een absoluut pad, een pad buiten de root of het
+    document zelf.
+    """
+    p = Path(json_path)
+    rel = str(name or "").strip()
+    root = resolved_root(p.parent)
+    if not rel or os.path.isabs(rel) or Path(rel).drive:
+        raise ValueError(f"{STORE_KEY}: ongeldig pad {rel!r} (relatief pad binnen {root} verwacht)")
+    side = (root / rel).resolve()
+    if side == root or side == root / p.name or not side.is_relative_to(root):
+        raise ValueError(f"{STORE_KEY}: {rel!r} ligt buiten de projectroot {root}")
+    return side
+
+# [END: sidecar_path]
+
+
+
 # [FUNC: load_json]
-def load_json(json_path: str | Path) -> dict:
+def load_json(json_path: str | Path, with_scripts: bool = True) -> dict:
     """
     Laad JSON-bestand. Bestaat het bestand niet of is het onleesbaar → {}.
-logger.debug("load_json() called")
+    Bij de gesplitste layout worden scripts/script_urls uit de sidecar
+    ingevoegd (with_scripts=False: niet, dan blijft het laden goedkoop).
     """
     p = Path(json_path)
     if not p.exists():
         return {}
     try:
         with p.open("r", encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except Exception:
         # Veiligheidsnet: niet crashen op corrupte JSON
         return {}
+    if with_scripts and isinstance(data, dict):
+        try:
+            materialize_scripts(p, data)
+        except ValueError as ex:
+            logger.warning("%s: sidecar genegeerd: %s", p, ex)
+    return data
 
 # [END: load_json]
 
 
 
-# [FUNC: save_json]
-def save_json(json_path: str | Path, data: dict) -> None:
-    """
-logger.debug("save_json() called")
-    Schrijf JSON atomisch (tempfile + replace), UTF-8, met nette inspringing.
-    """
-    p = Path(json_path)
+# [FUNC: _write_atomic_json]
+def _write_atomic_json(p: Path, data: Any) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
 
     fd, tmp = tempfile.mkstemp(prefix=p.name, dir=p.parent)
@@ -47,6 +84,7 @@ logger.debug("save_json() called")
             json.dump(data, f, ensure_ascii=False, indent=2)
             f.write("\n")
         os.replace(tmp_path, p)
+        record_path(p)
     finally:
         if tmp_path.exists():
             try:
@@ -54,5 +92,284 @@ logger.debug("save_json() called")
             except Exception:
                 pass
 
+# [END: _write_atomic_json]
+
+
+
+# [FUNC: save_json]
+def save_json(json_path: str | Path, data: dict) -> None:
+    """
+    Schrijf JSON atomisch (tempfile + replace), UTF-8, met nette inspringing.
+    Bij de gesplitste layout gaan scripts/script_urls naar de sidecar (enkel de
+    verschillen worden toegevoegd) en blijft de top-level klein.
+    """
+    p = Path(json_path)
+    if isinstance(data, dict) and data.get(STORE_KEY) and "scripts" in data:
+        store = ScriptStore(p, sidecar_name=str(data[STORE_KEY]))
+        store.replace_all(data.get("scripts") or [], data.get("script_urls"))
+        data = {k: v for k, v in data.items() if k not in ("scripts", "script_urls")}
+    _write_atomic_json(p, data)
+
 # [END: save_json]
 
+
+
+# [FUNC: materialize_scripts]
+def materialize_scripts(json_path: str | Path, data: dict) -> dict:
+    """
+    Vul data["scripts"]/["script_urls"] uit de sidecar (no-op bij de klassieke
+    layout). Raises ValueError bij een "scripts_store" buiten de projectroot.
+    """
+    if not data.get(STORE_KEY):
+        return data
+    store = ScriptStore(Path(json_path), sidecar_name=str(data[STORE_KEY]))
+    data["scripts"] = store.entries()
+    data["script_urls"] = store.urls()
+    return data
+
+# [END: materialize_scripts]
+
+
+
+# [CLASS: ScriptStore]
+class ScriptStore:
+    """
+    scripts[] als sleutel/waarde-store op pad, met twee layouts:
+    - klassiek: inline in .projassist.json (elke wijziging herschrijft het document)
+    - sidecar: append-only JSON Lines ({"op": "put"|"del", "path", "entry"}),
+      lazy ingelezen; laatste record per pad wint; periodiek gecompacteerd.
+    """
+
+    # [FUNC: __init__]
+    def __init__(self, json_path: Path, sidecar_name: Optional[str] = None):
+        self.json_path = Path(json_path)
+        self._sidecar_name = sidecar_name
+        self._index: Optional[dict[str, dict]] = None
+        self._records = 0
+
+    # [END: __init__]
+
+    # [FUNC: sidecar]
+    @property
+    def sidecar(self) -> Optional[Path]:
+        if self._sidecar_name is None:
+            top = load_json(self.json_path, with_scripts=False)
+            self._sidecar_name = str(top.get(STORE_KEY) or "")
+        return sidecar_path(self.json_path, self._sidecar_name) if self._sidecar_name else None
+
+    # [END: sidecar]
+
+    # [FUNC: _load]
+    def _load(self) -> dict[str, dict]:
+        if self._index is not None:
+            return self._index
+        index: dict[str, dict] = {}
+        side = self.sidecar
+        if side is None:
+            from services.script_ops import normalize_script_entry, script_entry_path
+
+            data = load_json(self.json_path, with_scripts=False)
+            for e in data.get("scripts") or []:
+                path = script_entry_path(e)
+                if path:
+                    index[path] = e if isinstance(e, dict) else normalize_script_entry(e)
+        elif side.exists():
+            with side.open("r", encoding="utf-8") as fh:
+                for n, line in enumerate(fh, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        # half geschreven laatste regel (crash) → negeren
+                        logger.warning("%s:%d: ongeldige regel genegeerd", side, n)
+                        continue
+                    self._records += 1
+                    if rec.get("op") == "del":
+                        index.pop(rec.get("path"), None)
+                    elif rec.get("op") == "put" and isinstance(rec.get("entry"), dict):
+                        index[rec["path"]] = rec["entry"]
+        self._index = index
+        return index
+
+    # [END: _load]
+
+    # [FUNC: entries]
+    def entries(self) -> list[dict]:
+        return list(self._load().values())
+
+    # [END: entries]
+
+    # [FUNC: paths]
+    def paths(self) -> list[str]:
+        return list(self._load())
+
+    # [END: paths]
+
+    # [FUNC: get]
+    def get(self, path: str) -> Optional[dict]:
+        return self._load().get(path)
+
+    # [END: get]
+
+    # [FUNC: urls]
+    def urls(self) -> dict[str, str]:
+        return {p: e["github_url"] for p, e in self._load().items() if e.get("github_url")}
+
+    # [END: urls]
+
+    # [FUNC: put]
+    def put(self, entry: dict) -> None:
+        self._apply([("put", entry["path"], entry)])
+
+    # [END: put]
+
+    # [FUNC: remove]
+    def remove(self, path: str) -> bool:
+        if path not in self._load():
+            return False
+        self._apply([("del", path, None)])
+        return True
+
+    # [END: remove]
+
+    # [FUNC: replace_all]
+    def replace_all(
+        self, entries: Iterable[Any], urls: Optional[dict] = None
+    ) -> None:
+        """Zet de volledige lijst; naar de sidecar gaan enkel de verschillen."""
+        from services.script_ops import normalize_script_entry, script_entry_path
+
+        wanted: dict[str, dict] = {}
+        for e in entries:
+            path = script_entry_path(e)
+            if not path:
+                continue
+            entry = normalize_script_entry(e)
+            if urls and urls.get(path) and not entry.get("github_url"):
+                entry["github_url"] = urls[path]
+            wanted[path] = entry
+        current = self._load()
+        ops: list[tuple[str, str, Optional[dict]]] = [
+            ("del", p, None) for p in current if p not in wanted
+        ]
+        ops += [("put", p, e) for p, e in wanted.items() if current.get(p) != e]
+        kept = [p for p in current if p in wanted]
+        if list(wanted) != kept + [p for p in wanted if p not in current]:
+            # volgorde gewijzigd: via compactie, niet via append
+            self._index = wanted
+            self._compact()
+            return
+        if ops:
+            self._apply(ops)
+
+    # [END: replace_all]
+
+    # [FUNC: _apply]
+    def _apply(self, ops: list[tuple[str, str, Optional[dict]]]) -> None:
+        index = self._load()
+        for op, path, entry in ops:
+            if op == "del":
+                index.pop(path, None)
+            else:
+                index[path] = entry
+        side = self.sidecar
+        if side is None:
+            # klassieke layout: document herschrijven (bestaand gedrag)
+            data = load_json(self.json_path, with_scripts=False)
+            data["scripts"] = list(index.values())
+            _write_atomic_json(self.json_path, data)
+            return
+        with side.open("a", encoding="utf-8", newline="\n") as fh:
+            for op, path, entry in ops:
+                rec = {"op": op, "path": path}
+                if entry is not None:
+                    rec["entry"] = entry
+                fh.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+        record_path(side)
+        self._records += len(ops)
+        if self._records > max(COMPACT_MIN_RECORDS, 2 * len(index)):
+            self._compact()
+
+    # [END: _apply]
+
+    # [FUNC: _compact]
+    def _compact(self) -> None:
+        """Herschrijf de sidecar atomisch met één put per levend pad."""
+        side = self.sidecar
+        index = self._load()
+        if side is None:
+            data = load_json(self.json_path, with_scripts=False)
+            data["scripts"] = list(index.values())
+            _write_atomic_json(self.json_path, data)
+            return
+        fd, tmp = tempfile.mkstemp(prefix=side.name, dir=side.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as fh:
+                for path, entry in index.items():
+                    rec = {"op": "put", "path": path, "entry": entry}
+                    fh.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(tmp, side)
+            record_path(side)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._records = len(index)
+
+    # [END: _compact]
+
+    # [FUNC: __iter__]
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.entries())
+
+    # [END: __iter__]
+
+
+# [END: ScriptStore]
+
+
+
+# [FUNC: split_scripts]
+def split_scripts(json_path: str | Path, sidecar_name: str = DEFAULT_SIDECAR) -> Path:
+    """
+    Zet een project om naar de gesplitste layout. Retourneert het sidecar-pad.
+    Let op: .projassist.json bevat daarna geen scripts[] meer; externe tools die
+    het bestand rechtstreeks lezen moeten via load_json() gaan of het project
+    eerst terugzetten met join_scripts().
+    """
+    p = Path(json_path)
+    data = load_json(p)
+    if data.get(STORE_KEY):
+        return sidecar_path(p, data[STORE_KEY])
+    side = sidecar_path(p, sidecar_name)
+    data[STORE_KEY] = sidecar_name
+    data.setdefault("scripts", [])
+    save_json(p, data)
+    return side
+
+# [END: split_scripts]
+
+
+
+# [FUNC: join_scripts]
+def join_scripts(json_path: str | Path) -> None:
+    """
+    Terug naar één document (klassieke layout); de sidecar wordt verwijderd.
+    Een "scripts_store" buiten de projectroot wordt enkel uit het document
+    gehaald, nooit gewist.
+    """
+    p = Path(json_path)
+    data = load_json(p)
+    name = data.pop(STORE_KEY, None)
+    if not name:
+        return
+    try:
+        side: Optional[Path] = sidecar_path(p, name)
+    except ValueError as ex:
+        logger.warning("%s: %s", p, ex)
+        side = None
+    _write_atomic_json(p, data)
+    if side is not None:
+        side.unlink(missing_ok=True)
+
+# [END: join_scripts]
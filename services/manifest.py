@@ -0,0 +1,145 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+try:  # optioneel: sneller dan blake2b, maar geen harde dependency
+    import xxhash  # type: ignore
+except ImportError:  # pragma: no cover - afhankelijk van de omgeving
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+MANIFEST_KEY = "manifest"
+CHUNK = 1 << 20
+
+
+# [FUNC: hash_algo]
+def hash_algo() -> str:
+    return "xxh3_64" if xxhash is not None else "blake2b-128"
+
+# [END: hash_algo]
+
+
+# [FUNC: _new_hasher]
+def _new_hasher(algo: str) -> Callable[[], "hashlib._Hash"]:
+    if algo == "xxh3_64" and xxhash is not None:
+        return xxhash.xxh3_64
+    return lambda: hashlib.blake2b(digest_size=16)
+
+# [END: _new_hasher]
+
+
+# [FUNC: file_hash]
+def file_hash(path: Path, algo: Optional[str] = None) -> str:
+    h = _new_hasher(algo or hash_algo())()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+# [END: file_hash]
+
+
+# [CLASS: ManifestDelta]
+@dataclass
+class ManifestDelta:
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)  # inhoud (hash) gewijzigd
+    touched: list[str] = field(default_factory=list)  # enkel mtime gewijzigd
+    removed: list[str] = field(default_factory=list)
+    hashed: int = 0  # bestanden effectief gelezen
+
+    # [FUNC: dirty]
+    @property
+    def dirty(self) -> bool:
+        return bool(self.added or self.changed or self.touched or self.removed)
+
+    # [END: dirty]
+
+
+# [END: ManifestDelta]
+
+
+# [FUNC: manifest_enabled]
+def manifest_enabled(data: dict) -> bool:
+    """Het manifest is optioneel: actief zodra de sectie in .projassist.json staat."""
+    return isinstance(data.get(MANIFEST_KEY), dict)
+
+# [END: manifest_enabled]
+
+
+# [FUNC: update_manifest]
+def update_manifest(root: Path, data: dict, paths: Iterable[str]) -> ManifestDelta:
+    """
+    Werk data["manifest"] bij voor `paths` (relatief aan root):
+    {"algo": ..., "files": {rel: {"size", "mtime_ns", "hash"}}}.
+    Een bestand met ongewijzigde size+mtime kost enkel een stat; anders wordt
+    het gehasht. Paden die niet meer in `paths` staan verdwijnen.
+    """
+    delta = ManifestDelta()
+    section = data.get(MANIFEST_KEY) if manifest_enabled(data) else {}
+    algo = hash_algo()
+    same_algo = section.get("algo") == algo
+    old_files: dict = section.get("files", {}) if same_algo else {}
+
+    files: dict[str, dict] = {}
+    for rel in paths:
+        try:
+            st = os.stat(root / rel)
+        except OSError:
+            continue
+        old = old_files.get(rel)
+        if old and old.get("size") == st.st_size and old.get("mtime_ns") == st.st_mtime_ns:
+            files[rel] = old
+            continue
+        try:
+            digest = file_hash(root / rel, algo)
+        except OSError as ex:
+            logger.debug("Manifest: %s niet leesbaar (%s)", rel, ex)
+            continue
+        delta.hashed += 1
+        files[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest}
+        if not old:
+            delta.added.append(rel)
+        elif old.get("hash") != digest:
+            delta.changed.append(rel)
+        else:
+            delta.touched.append(rel)
+    # ander hash-algoritme (bv. xxhash hier niet geïnstalleerd): alles opnieuw als "added"
+    delta.removed = [rel for rel in old_files if rel not in files]
+
+    data[MANIFEST_KEY] = {"algo": algo, "files": files}
+    return delta
+
+# [END: update_manifest]
+
+
+# [FUNC: changed_since]
+def changed_since(root: Path, data: dict, paths: Optional[Iterable[str]] = None) -> list[str]:
+    """
+    Welke bestanden wijzigden sinds het manifest werd bijgewerkt — enkel stat-calls.
+    Zonder manifest is alles "gewijzigd".
+    """
+    files = data.get(MANIFEST_KEY, {}).get("files", {}) if manifest_enabled(data) else {}
+    candidates = list(paths) if paths is not None else list(files)
+    out: list[str] = []
+    for rel in candidates:
+        old = files.get(rel)
+        try:
+            st = os.stat(root / rel)
+        except OSError:
+            if old:
+                out.append(rel)
+            continue
+        if not old or old.get("size") != st.st_size or old.get("mtime_ns") != st.st_mtime_ns:
+            out.append(rel)
+    return out
+
+# [END: changed_since]
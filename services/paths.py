@@ -0,0 +1,98 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import logging
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+_SEG_SPLIT = re.compile(r"[\\/]" if os.name == "nt" else "/")
+
+
+# [FUNC: _abs_norm]
+def _abs_norm(p: str) -> str:
+    """Absoluut + genormaliseerd (enkel stringwerk: '.', dubbele separators)."""
+    return os.path.normpath(p if os.path.isabs(p) else os.path.abspath(p))
+
+# [END: _abs_norm]
+
+
+# [FUNC: _resolve_cached]
+@lru_cache(maxsize=256)
+def _resolve_cached(abs_root: str) -> str:
+    return os.fspath(Path(abs_root).resolve())
+
+# [END: _resolve_cached]
+
+
+# [FUNC: resolved_root]
+def resolved_root(root: str | Path) -> Path:
+    """Projectroot met symlinks/junctions opgelost; één resolve() per root per proces."""
+    return Path(_resolve_cached(_abs_norm(os.fspath(root))))
+
+# [END: resolved_root]
+
+
+# [FUNC: clear_cache]
+def clear_cache() -> None:
+    """Vergeet de opgeloste roots (bv. nadat een map verplaatst of gelinkt werd)."""
+    _resolve_cached.cache_clear()
+
+# [END: clear_cache]
+
+
+# [FUNC: _under]
+def _under(path_norm: str, root_norm: str) -> Optional[str]:
+    a, b = os.path.normcase(path_norm), os.path.normcase(root_norm)
+    if a == b:
+        return ""
+    prefix = b if b.endswith(os.sep) else b + os.sep
+    if a.startswith(prefix):
+        return path_norm[len(prefix) :].replace(os.sep, "/")
+    return None
+
+# [END: _under]
+
+
+# [FUNC: rel_posix]
+def rel_posix(root: str | Path, path: str | Path) -> Optional[str]:
+    """
+    Relatief POSIX-pad van `path` t.o.v. `root`, of None als het erbuiten ligt.
+    Relatieve paden gelden t.o.v. root. Zonder '..'-segmenten volstaat pure
+    stringvergelijking (tegen de root zoals opgegeven én opgelost); enkel als
+    dat niet matcht (symlink, junction, '..') wordt het doel zelf geresolved.
+    """
+    abs_root = _abs_norm(os.fspath(root))
+    p = os.fspath(path)
+    if not os.path.isabs(p):
+        p = os.path.join(abs_root, p)
+    real_root = _resolve_cached(abs_root)
+
+    if ".." not in _SEG_SPLIT.split(p):
+        norm = os.path.normpath(p)
+        for r in (abs_root, real_root):
+            rel = _under(norm, r)
+            if rel is not None:
+                return rel
+    try:
+        real = os.fspath(Path(p).resolve())
+    except OSError as ex:
+        logger.debug("resolve() faalde voor %s (%s)", p, ex)
+        return None
+    return _under(real, real_root)
+
+# [END: rel_posix]
+
+
+# [FUNC: to_rel_posix]
+def to_rel_posix(root: str | Path, path: str | Path) -> str:
+    """Zoals rel_posix, maar valt terug op de bestandsnaam als path buiten root ligt."""
+    rel = rel_posix(root, path)
+    return rel if rel is not None else Path(path).name
+
+# [END: to_rel_posix]
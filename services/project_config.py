@@ -0,0 +1,289 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ClassVar, Iterator, Optional
+
+from services.config_model import load_config
+from services.json_store import STORE_KEY, ScriptStore, save_json, sidecar_path
+from services.paths import resolved_root
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+
+
+# [FUNC: _stat_key]
+def _stat_key(path: Path) -> Optional[tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    # inode erbij: save_json schrijft via tempfile + replace
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+# [END: _stat_key]
+
+
+# [CLASS: ProjectConfig]
+class ProjectConfig:
+    """
+    .projassist.json in het geheugen: één keer geladen, scripts[] geïndexeerd op
+    relatief pad. Wijzigingen worden gebundeld tot één atomische write:
+    - binnen `with cfg.batch():` → bij het verlaten van het buitenste blok
+    - anders meteen, of na `flush_delay_ms` (write-behind) als die > 0 is
+    Wordt het bestand extern gewijzigd, dan wordt het herladen; nog niet
+    geschreven wijzigingen worden daarna opnieuw toegepast.
+    """
+
+    _registry: ClassVar[dict[Path, "ProjectConfig"]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # [FUNC: __init__]
+    def __init__(self, json_path: str | Path, flush_delay_ms: int = 0):
+        self.json_path = Path(json_path)
+        self.flush_delay_ms = flush_delay_ms
+        self._lock = threading.RLock()
+        self._data: dict = {}
+        self._scripts: dict[str, dict] = {}
+        self._sig: tuple = ()
+        self._pending: list[tuple] = []
+        self._depth = 0
+        self._timer: Optional[threading.Timer] = None
+        self._reload()
+
+    # [END: __init__]
+
+    # [FUNC: for_path]
+    @classmethod
+    def for_path(cls, json_path: str | Path) -> "ProjectConfig":
+        """Gedeelde instantie per project (zelfde bestand → zelfde object)."""
+        jp = Path(json_path)
+        key = resolved_root(jp.parent) / jp.name
+        with cls._registry_lock:
+            cfg = cls._registry.get(key)
+            if cfg is None:
+                cfg = cls._registry[key] = cls(key)
+        return cfg
+
+    # [END: for_path]
+
+    # [FUNC: flush_all]
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._registry_lock:
+            configs = list(cls._registry.values())
+        for cfg in configs:
+            try:
+                cfg.flush()
+            except Exception as ex:
+                logger.warning("Config niet weggeschreven: %s (%s)", cfg.json_path, ex)
+
+    # [END: flush_all]
+
+    # ---------------------------------------------------------
+    # Laden / externe wijzigingen
+    # ---------------------------------------------------------
+
+    # [FUNC: _signature]
+    def _signature(self) -> tuple:
+        sig: tuple = (_stat_key(self.json_path),)
+        store = self._data.get(STORE_KEY)
+        if store:
+            sig += (_stat_key(sidecar_path(self.json_path, store)),)
+        return sig
+
+    # [END: _signature]
+
+    # [FUNC: _reload]
+    def _reload(self) -> None:
+        from services.script_ops import normalize_script_entry, script_entry_path
+
+        # gevalideerd + gedeeld met de lezers (services.config_model)
+        data = load_config(self.json_path).to_dict()
+        scripts: dict[str, dict] = {}
+        for e in data.pop("scripts", None) or []:
+            path = script_entry_path(e)
+            if path and path not in scripts:
+                scripts[path] = e if isinstance(e, dict) else normalize_script_entry(e)
+        if data.get(STORE_KEY):
+            # afgeleid uit de sidecar (github_url per entry)
+            data.pop("script_urls", None)
+        self._data = data
+        self._scripts = scripts
+        self._sig = self._signature()
+
+    # [END: _reload]
+
+    # [FUNC: _refresh]
+    def _refresh(self) -> None:
+        """Herlaad bij een externe wijziging en pas openstaande wijzigingen opnieuw toe."""
+        if self._signature() == self._sig:
+            return
+        logger.debug("Extern gewijzigd, herladen: %s", self.json_path)
+        self._reload()
+        for op in self._pending:
+            self._mutate(op)
+
+    # [END: _refresh]
+
+    # ---------------------------------------------------------
+    # Lezen
+    # ---------------------------------------------------------
+
+    # [FUNC: get]
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            self._refresh()
+            return self._data.get(key, default)
+
+    # [END: get]
+
+    # [FUNC: script]
+    def script(self, rel_posix: str) -> Optional[dict]:
+        with self._lock:
+            self._refresh()
+            entry = self._scripts.get(rel_posix)
+            return dict(entry) if entry is not None else None
+
+    # [END: script]
+
+    # [FUNC: scripts]
+    def scripts(self) -> list[dict]:
+        with self._lock:
+            self._refresh()
+            return [dict(e) for e in self._scripts.values()]
+
+    # [END: scripts]
+
+    # [FUNC: to_dict]
+    def to_dict(self) -> dict:
+        """Volledig document zoals load_json het teruggeeft."""
+        with self._lock:
+            self._refresh()
+            data = dict(self._data)
+            data["scripts"] = [dict(e) for e in self._scripts.values()]
+            if data.get(STORE_KEY):
+                data["script_urls"] = {
+                    p: e["github_url"] for p, e in self._scripts.items() if e.get("github_url")
+                }
+            return data
+
+    # [END: to_dict]
+
+    # ---------------------------------------------------------
+    # Wijzigen
+    # ---------------------------------------------------------
+
+    # [FUNC: put_script]
+    def put_script(self, entry: dict) -> None:
+        self._submit(("put", dict(entry)))
+
+    # [END: put_script]
+
+    # [FUNC: remove_script]
+    def remove_script(self, rel_posix: str) -> bool:
+        with self._lock:
+            self._refresh()
+            if rel_posix not in self._scripts:
+                return False
+            self._submit(("del", rel_posix))
+            return True
+
+    # [END: remove_script]
+
+    # [FUNC: set]
+    def set(self, key: str, value: Any) -> None:
+        if key in ("scripts", "script_urls", STORE_KEY):
+            raise ValueError(f"'{key}' wordt via de script-methodes beheerd")
+        self._submit(("set", key, value))
+
+    # [END: set]
+
+    # [FUNC: _mutate]
+    def _mutate(self, op: tuple) -> None:
+        if op[0] == "put":
+            self._scripts[op[1]["path"]] = dict(op[1])
+        elif op[0] == "del":
+            self._scripts.pop(op[1], None)
+        else:
+            self._data[op[1]] = op[2]
+
+    # [END: _mutate]
+
+    # [FUNC: _submit]
+    def _submit(self, op: tuple) -> None:
+        with self._lock:
+            self._refresh()
+            self._mutate(op)
+            self._pending.append(op)
+            if self._depth:
+                return
+            if self.flush_delay_ms > 0:
+                self._schedule()
+                return
+        self.flush()
+
+    # [END: _submit]
+
+    # [FUNC: _schedule]
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            return  # er staat al een write gepland; die neemt deze wijziging mee
+        self._timer = threading.Timer(self.flush_delay_ms / 1000.0, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    # [END: _schedule]
+
+    # [FUNC: batch]
+    @contextmanager
+    def batch(self) -> Iterator["ProjectConfig"]:
+        """Alle wijzigingen in het blok (ook genest) → één write bij het verlaten."""
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                outer = self._depth == 0
+            if outer:
+                self.flush()
+
+    # [END: batch]
+
+    # [FUNC: flush]
+    def flush(self) -> bool:
+        """Schrijf openstaande wijzigingen weg. Retourneert True als er geschreven werd."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return False
+            self._refresh()
+            store = self._data.get(STORE_KEY)
+            if store and all(op[0] != "set" for op in self._pending):
+                # gesplitste layout, enkel scripts: de top-level blijft ongemoeid
+                side = ScriptStore(self.json_path, sidecar_name=str(store))
+                side.replace_all(list(self._scripts.values()))
+            else:
+                data = dict(self._data)
+                data["scripts"] = list(self._scripts.values())
+                save_json(self.json_path, data)
+            self._pending.clear()
+            self._sig = self._signature()
+            return True
+
+    # [END: flush]
+
+
+# [END: ProjectConfig]
+
+atexit.register(ProjectConfig.flush_all)
@@ -5,7 +5,7 @@ from shutil import rmtree
 import os
 import stat
 
-
+logger = logging.getLogger(__name__)
 
 # [END: Imports]
 # [FUNC: _on_rm_error]
@@ -14,7 +14,6 @@ def _on_rm_error(func, path, exc_info):
     Helper voor rmtree: maak bestand schrijfbaar en probeer opnieuw.
     Voornamelijk nuttig op Windows bij .git/objects.
     """
-logger.debug("_on_rm_error() called")
     try:
         os.chmod(path, stat.S_IWRITE)
         func(path)
@@ -35,7 +34,6 @@ def delete_project(
     """
     Verwijder projectmap (guardrail: .projassist.json moet bestaan).
     Extra: eerst .git forceren te wissen; optioneel ook de venv: <venv_base>/<project_name>/venv.
-logger.debug("delete_project() called")
     """
     root = Path(project_root).resolve()
 
@@ -48,12 +46,9 @@ logger.debug("delete_project() called")
     # project_name uitlezen vóór verwijderen
     project_name = root.name
     try:
-        import json
+        from services.config_model import load_config
 
-        project_name = str(
-            json.loads(json_file.read_text(encoding="utf-8")).get("project_name")
-            or project_name
-        )
+        project_name = load_config(json_file).project_name
     except Exception:
         pass
 
@@ -112,11 +107,9 @@ logger.debug("delete_project() called")
 # [FUNC: _parse_github_owner_repo]
 def _parse_github_owner_repo(url: str) -> tuple[bool, str, str]:
     """
-logger.debug("_parse_github_owner_repo() called")
     Parse 'https://github.com/<owner>/<repo>[.git]' → (ok, owner, repo)
     """
     from urllib.parse import urlparse
-logger = logging.getLogger(__name__)
 
     try:
         p = urlparse(url.strip())
@@ -140,7 +133,6 @@ logger = logging.getLogger(__name__)
 def delete_github_repo(
     github_repo_url: str, token: str | None = None
 ) -> tuple[bool, str]:
-logger.debug("delete_github_repo() called")
     """
     Verwijder de GitHub-repo via API. Vereist een PAT in env (GITHUB_TOKEN of GH_TOKEN) of meegegeven token.
     Retourneert (ok, message).
@@ -187,7 +179,6 @@ logger.debug("delete_github_repo() called")
 
 
 
-logger.debug("_parse_github_owner_repo() called")
 # [FUNC: _parse_github_owner_repo]
 def _parse_github_owner_repo(url: str) -> tuple[bool, str, str]:
     """
@@ -223,7 +214,6 @@ def delete_github_repo(
     repo_prefix: str = "project_",
 ) -> tuple[bool, str]:
     """
-        logger.debug("delete_github_repo() called")
     Verwijder de GitHub-repo via API.
     - Als URL gegeven → parse owner/repo.
     - Anders: owner uit .env (GH_OWNER/GITHUB_OWNER) of default_owner;
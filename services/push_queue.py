@@ -0,0 +1,252 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+PENDING = "pending"
+PUSHING = "pushing"
+OK = "ok"
+RETRY = "retry"
+FAILED = "failed"
+
+
+# [CLASS: PushStatus]
+@dataclass(frozen=True)
+class PushStatus:
+    root: Path
+    state: str
+    attempt: int = 0
+    detail: str = ""
+    retry_in: float = 0.0
+
+    # [FUNC: text]
+    def text(self) -> str:
+        """Korte statusregel voor de statusbalk."""
+        name = self.root.name
+        if self.state == PENDING:
+            return f"Git: push voor {name} ingepland."
+        if self.state == PUSHING:
+            return f"Git: {name} wordt gepusht…"
+        if self.state == OK:
+            return f"Git: {name} gepusht."
+        if self.state == RETRY:
+            return f"Git: push {name} mislukt (poging {self.attempt}), opnieuw over {self.retry_in:.0f}s."
+        first = self.detail.splitlines()[0] if self.detail else ""
+        return f"Git: push {name} mislukt na {self.attempt} pogingen. {first}".rstrip()
+
+    # [END: text]
+
+
+# [END: PushStatus]
+
+
+# [CLASS: PushQueue]
+class PushQueue:
+    """
+    Pushes los van de commits: een commit markeert zijn repo als "te pushen";
+    de push volgt pas na `delay` seconden zonder nieuwe commits voor die repo
+    (tien registraties na elkaar → één push), op verzoek (flush) of bij het
+    afsluiten. Mislukte pushes worden herhaald met exponentiële backoff.
+    Status gaat naar listeners (PushStatus), nooit naar een dialoog.
+    """
+
+    # [FUNC: __init__]
+    def __init__(
+        self,
+        service=None,
+        delay: float = 5.0,
+        remote: str = "origin",
+        max_attempts: int = 5,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 300.0,
+    ):
+        if service is None:
+            from services.git_service import get_git_service
+
+            service = get_git_service()
+        self._service = service
+        self.delay = delay
+        self.remote = remote
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._attempts: Dict[str, int] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._listeners: List[Callable[[PushStatus], None]] = []
+
+    # [END: __init__]
+
+    # [FUNC: add_listener]
+    def add_listener(self, callback: Callable[[PushStatus], None]) -> None:
+        with self._lock:
+            self._listeners.append(callback)
+
+    # [END: add_listener]
+
+    # [FUNC: remove_listener]
+    def remove_listener(self, callback: Callable[[PushStatus], None]) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    # [END: remove_listener]
+
+    # [FUNC: _emit]
+    def _emit(self, status: PushStatus) -> None:
+        logger.debug(status.text())
+        with self._lock:
+            listeners = list(self._listeners)
+        for cb in listeners:
+            try:
+                cb(status)
+            except Exception:
+                logger.exception("Push-listener faalde")
+
+    # [END: _emit]
+
+    # [FUNC: pending]
+    def pending(self) -> List[Path]:
+        with self._lock:
+            return [Path(k) for k in sorted(self._pending | set(self._inflight))]
+
+    # [END: pending]
+
+    # [FUNC: request]
+    def request(self, root: str | Path) -> None:
+        """Repo heeft nieuwe commits: push na `delay` s inactiviteit (timer herstart)."""
+        key = os.fspath(root)
+        with self._lock:
+            self._pending.add(key)
+            self._attempts.pop(key, None)
+            busy = key in self._inflight
+            if not busy:
+                self._arm(key, self.delay)
+        self._emit(PushStatus(Path(key), PENDING))
+
+    # [END: request]
+
+    # [FUNC: _arm]
+    def _arm(self, key: str, delay: float) -> None:
+        # aanroepen met self._lock vast
+        old = self._timers.pop(key, None)
+        if old is not None:
+            old.cancel()
+        t = threading.Timer(delay, self._fire, (key,))
+        t.daemon = True
+        self._timers[key] = t
+        t.start()
+
+    # [END: _arm]
+
+    # [FUNC: _fire]
+    def _fire(self, key: str) -> Optional[concurrent.futures.Future]:
+        with self._lock:
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            if key not in self._pending or key in self._inflight:
+                return self._inflight.get(key)
+            self._pending.discard(key)
+            attempt = self._attempts.get(key, 0) + 1
+            # buiten het repo-slot: commits/status wachten niet op het netwerk
+            fut = self._service.run(["push", self.remote, "HEAD"], key, locked=False)
+            self._inflight[key] = fut
+        self._emit(PushStatus(Path(key), PUSHING, attempt))
+        fut.add_done_callback(lambda f: self._done(key, attempt, f))
+        return fut
+
+    # [END: _fire]
+
+    # [FUNC: _done]
+    def _done(self, key: str, attempt: int, fut: concurrent.futures.Future) -> None:
+        try:
+            res = fut.result()
+            ok, detail = res.ok, res.output
+        except Exception as ex:
+            ok, detail = False, str(ex)
+        root = Path(key)
+        with self._lock:
+            self._inflight.pop(key, None)
+            again = key in self._pending  # nieuwe commits tijdens de push
+            if ok:
+                self._attempts.pop(key, None)
+                status = PushStatus(root, OK, attempt)
+                if again:
+                    self._arm(key, self.delay)
+            elif attempt >= self.max_attempts:
+                self._attempts.pop(key, None)
+                status = PushStatus(root, FAILED, attempt, detail)
+                if again:
+                    self._arm(key, self.delay)
+            else:
+                self._attempts[key] = attempt
+                self._pending.add(key)
+                wait = min(self.max_retry_delay, self.retry_delay * 2 ** (attempt - 1))
+                status = PushStatus(root, RETRY, attempt, detail, wait)
+                self._arm(key, wait)
+        self._emit(status)
+
+    # [END: _done]
+
+    # [FUNC: flush]
+    def flush(self, wait: bool = False, timeout: Optional[float] = None) -> bool:
+        """
+        Push alle wachtende repo's nu (knop "nu pushen", afsluiten).
+        wait=True: blokkeer tot ze klaar zijn; retourneert False bij timeout.
+        """
+        with self._lock:
+            keys = list(self._pending)
+        futures = [f for f in (self._fire(k) for k in keys) if f is not None]
+        if not wait:
+            return True
+        with self._lock:
+            futures += [f for f in self._inflight.values() if f not in futures]
+        _done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+        return not not_done
+
+    # [END: flush]
+
+    # [FUNC: shutdown]
+    def shutdown(self, timeout: float = 15.0) -> None:
+        """Bij het afsluiten: openstaande pushes nog één keer proberen, zonder retries."""
+        self.max_attempts = 0
+        if not self.flush(wait=True, timeout=timeout):
+            logger.warning("Niet alle pushes voltooid bij afsluiten: %s", self.pending())
+        with self._lock:
+            for t in self._timers.values():
+                t.cancel()
+            self._timers.clear()
+
+    # [END: shutdown]
+
+
+# [END: PushQueue]
+
+_QUEUE: Optional[PushQueue] = None
+_QUEUE_LOCK = threading.Lock()
+
+
+# [FUNC: get_push_queue]
+def get_push_queue() -> PushQueue:
+    """Gedeelde wachtrij; bij het afsluiten van het proces worden openstaande pushes verstuurd."""
+    global _QUEUE
+    with _QUEUE_LOCK:
+        if _QUEUE is None:
+            _QUEUE = PushQueue()
+            atexit.register(_QUEUE.shutdown)
+        return _QUEUE
+
+# [END: get_push_queue]
@@ -1,30 +1,27 @@
 # [SECTION: Imports]
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
 
+from services.git_ops import blob_sha1, index_blobs
+from services.git_transaction import record_path
+from services.paths import resolved_root, to_rel_posix
+from services.project_config import ProjectConfig
 
-from services.json_store import load_json, save_json
 logger = logging.getLogger(__name__)
 
+# [END: Imports]
 
 
-# [END: Imports]
 # [FUNC: _to_rel_posix]
 def _to_rel_posix(json_path: Path | str, any_path: Path | str) -> str:
     """
     Converteer een absoluut/relatief pad naar een RELATIEF POSIX-pad t.o.v. projectroot (map van .projassist.json).
-logger.debug("_to_rel_posix() called")
     """
-    jp = Path(json_path)
-    root = jp.parent.resolve()
-    p = Path(any_path)
-    p = p if p.is_absolute() else (root / p)
-    try:
-        rel = p.resolve().relative_to(root)
-    except Exception:
-        rel = Path(p.name)
-    return rel.as_posix()
+    # root wordt per project één keer geresolved; paden zonder '..'/symlink
+    # worden puur als string vergeleken
+    return to_rel_posix(Path(json_path).parent, any_path)
 
 # [END: _to_rel_posix]
 
@@ -38,25 +35,21 @@ def register_existing_script(
 ) -> dict:
     """
     Registreer een bestaand script in .projassist.json onder key 'scripts'.
-logger.debug("register_existing_script() called")
     Retourneert de (nieuwe of bestaande) entry.
     """
     json_path = Path(projassist_json)
-    data = load_json(json_path)
-    scripts = data.get("scripts", [])
+    cfg = ProjectConfig.for_path(json_path)
 
     rel_posix = _to_rel_posix(json_path, file_path)
     entry_name = name or Path(rel_posix).stem
 
-    # Dubbele entry voorkomen
-    for s in scripts:
-        if str(s.get("path", "")) == rel_posix:
-            return s
+    # Dubbele entry voorkomen (opzoeken op pad, geen lineaire scan)
+    existing = cfg.script(rel_posix)
+    if existing is not None:
+        return existing
 
     entry = {"name": entry_name, "path": rel_posix, "type": "py"}
-    scripts.append(entry)
-    data["scripts"] = scripts
-    save_json(json_path, data)
+    cfg.put_script(entry)
     return entry
 
 # [END: register_existing_script]
@@ -71,12 +64,11 @@ def create_new_script(
     template: Optional[str] = None,
 ) -> dict:
     """
-logger.debug("create_new_script() called")
     Maak nieuw .py-bestand aan in dir_path (aanmaken indien nodig) en registreer het.
     Retourneert de aangemaakte entry.
     """
     json_path = Path(projassist_json)
-    root = json_path.parent.resolve()
+    root = resolved_root(json_path.parent)
 
     d = Path(dir_path)
     d = d if d.is_absolute() else (root / d)
@@ -91,6 +83,7 @@ logger.debug("create_new_script() called")
             else f'# {filename}\n\nif __name__ == "__main__":\n    pass\n'
         )
         new_file.write_text(content, encoding="utf-8")
+        record_path(new_file)
 
     return register_existing_script(json_path, new_file, name=new_file.stem)
 
@@ -105,29 +98,20 @@ def remove_script(
     delete_from_disk: bool = False,
 ) -> bool:
     """
-logger.debug("remove_script() called")
     Verwijder script uit .projassist.json (en optioneel van schijf).
     - script_path mag absoluut of relatief zijn.
     Retourneert True als JSON gewijzigd werd.
     """
     json_path = Path(projassist_json)
-    data = load_json(json_path)
-    scripts = data.get("scripts", [])
-
     rel_posix = _to_rel_posix(json_path, script_path)
-    new_scripts = [s for s in scripts if str(s.get("path", "")) != rel_posix]
-    changed = len(new_scripts) != len(scripts)
-
-    if changed:
-        data["scripts"] = new_scripts
-        save_json(json_path, data)
+    changed = ProjectConfig.for_path(json_path).remove_script(rel_posix)
 
     if delete_from_disk:
-        root = json_path.parent.resolve()
-        abs_path = (root / Path(rel_posix)).resolve()
+        abs_path = resolved_root(json_path.parent) / Path(rel_posix)
         try:
             if abs_path.exists() and abs_path.is_file():
                 abs_path.unlink()
+                record_path(abs_path)
         except Exception:
             # Stil falen: best effort verwijderen
             pass
@@ -135,7 +119,6 @@ logger.debug("remove_script() called")
     return changed
 
 # [END: remove_script]
-logger.debug("_build_github_blob_url() called")
 
 
 
@@ -154,7 +137,6 @@ def _build_github_blob_url(repo_url: str, rel_posix: str, branch: str = "main")
 def set_github_url_for_script(
     projassist_json: str | Path,
     script_path: str | Path,
-    logger.debug("set_github_url_for_script() called")
     branch: str = "main",
 ) -> str | None:
     """
@@ -162,20 +144,221 @@ def set_github_url_for_script(
     Retourneert de URL of None als repo ontbreekt of entry niet gevonden is.
     """
     json_path = Path(projassist_json)
-    data = load_json(json_path)
-    repo = data.get("github_repo")
+    cfg = ProjectConfig.for_path(json_path)
+    repo = cfg.get("github_repo")
     if not repo:
         return None
 
     rel_posix = _to_rel_posix(json_path, script_path)
-    scripts = data.get("scripts", [])
-    for s in scripts:
-        if str(s.get("path", "")) == rel_posix:
-            url = _build_github_blob_url(repo, rel_posix, branch=branch)
-            s["github_url"] = url
-            save_json(json_path, data)
-            return url
-    return None
+    entry = cfg.script(rel_posix)
+    if entry is None:
+        return None
+    url = _build_github_blob_url(repo, rel_posix, branch=branch)
+    entry = normalize_script_entry(entry)
+    entry["github_url"] = url
+    cfg.put_script(entry)
+    return url
 
 # [END: set_github_url_for_script]
 
+
+
+
+# [FUNC: script_entry_path]
+def script_entry_path(entry: Any) -> str:
+    """Pad van een scripts[]-entry; zowel oude string-entries als dicts {path: ...}."""
+    if isinstance(entry, str):
+        raw = entry
+    elif isinstance(entry, dict):
+        raw = str(entry.get("path") or "")
+    else:
+        return ""
+    return raw.strip().replace("\\", "/")
+
+# [END: script_entry_path]
+
+
+
+# [FUNC: script_paths]
+def script_paths(data: dict) -> list[str]:
+    """Alle script-paden uit .projassist.json-data, in volgorde, zonder lege."""
+    scripts = data.get("scripts") if isinstance(data.get("scripts"), list) else []
+    return [p for p in (script_entry_path(e) for e in scripts) if p]
+
+# [END: script_paths]
+
+
+
+# [FUNC: normalize_script_entry]
+def normalize_script_entry(entry: Any, rel_posix: Optional[str] = None) -> dict:
+    """
+    Eén schema: {"name", "path", "type", ...}; extra keys (github_url, ...) blijven.
+    Met rel_posix wordt het pad (bv. na een rename) vervangen.
+    """
+    out = dict(entry) if isinstance(entry, dict) else {}
+    path = rel_posix or script_entry_path(entry)
+    if rel_posix and out.get("name") == Path(script_entry_path(entry)).stem:
+        out.pop("name")  # automatische naam volgt de rename
+    out["path"] = path
+    out.setdefault("name", Path(path).stem)
+    out.setdefault("type", Path(path).suffix.lstrip(".").lower() or "py")
+    return out
+
+# [END: normalize_script_entry]
+
+
+
+# [CLASS: ReconcileReport]
+@dataclass
+class ReconcileReport:
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    renamed: list[tuple[str, str]] = field(default_factory=list)  # (oud, nieuw)
+    normalized: int = 0  # string-entries/dubbels omgezet of opgeruimd
+    urls_changed: bool = False
+    manifest_updates: int = 0  # manifest-entries toegevoegd/gewijzigd/verwijderd
+
+    # [FUNC: changed]
+    @property
+    def changed(self) -> bool:
+        return bool(
+            self.added
+            or self.removed
+            or self.renamed
+            or self.normalized
+            or self.urls_changed
+            or self.manifest_updates
+        )
+
+    # [END: changed]
+
+    # [FUNC: summary]
+    def summary(self) -> str:
+        text = (
+            f"{len(self.added)} toegevoegd, {len(self.removed)} verwijderd, "
+            f"{len(self.renamed)} hernoemd, {self.normalized} entry/entries genormaliseerd."
+        )
+        if self.manifest_updates:
+            text += f" Manifest: {self.manifest_updates} entry/entries bijgewerkt."
+        return text
+
+    # [END: summary]
+
+
+# [END: ReconcileReport]
+
+
+
+# [FUNC: _disk_blob_ids]
+def _disk_blob_ids(path: Path) -> set[str]:
+    """Blob-id's van een bestand op schijf, met en zonder CRLF (autocrlf-index)."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return set()
+    return {blob_sha1(data), blob_sha1(data.replace(b"\r\n", b"\n"))}
+
+# [END: _disk_blob_ids]
+
+
+
+# [FUNC: reconcile_scripts]
+def reconcile_scripts(
+    root: Path,
+    data: dict,
+    on_disk: Iterable[str],
+    url_for: Optional[Callable[[str], str]] = None,
+    prune: bool = False,
+    added: Optional[Iterable[str]] = None,
+    removed: Optional[Iterable[str]] = None,
+) -> ReconcileReport:
+    """
+    Breng data["scripts"] en data["script_urls"] in lijn met de bestanden op schijf
+    (in place, één pass met dict/set-operaties):
+    - alle entries → dict-schema, dubbels en 'backup/' eruit
+    - prune=True (expliciet; standaard blijven entries staan): ontbrekende
+      bestanden eruit — tenzij hernoemd: dezelfde inhoud (git-blob uit de
+      index) onder precies één nieuw pad, en die blob hoort bij precies één
+      verdwenen entry → entry behoudt zijn extra's
+    - nieuwe bestanden achteraan toegevoegd
+    - script_urls opnieuw opgebouwd voor precies de huidige entries
+    added/removed: optionele scan-delta's sinds de vorige sync (ScanResult);
+    renames worden dan enkel onder `added` gezocht en een pad uit `removed`
+    hoeft niet meer gestat te worden.
+    """
+    report = ReconcileReport()
+    scripts = data.get("scripts") if isinstance(data.get("scripts"), list) else []
+    disk = list(dict.fromkeys(on_disk))
+    disk_set = set(disk)
+
+    entries: dict[str, dict] = {}
+    for e in scripts:
+        p = script_entry_path(e)
+        if not p or p.startswith("backup/") or p in entries:
+            report.normalized += 1
+            continue
+        entries[p] = normalize_script_entry(e)
+        if entries[p] != e:
+            report.normalized += 1
+
+    # bestanden buiten de scan (andere extensie/genegeerde map) zelf checken
+    gone = set(removed) if removed is not None else set()
+    missing = {
+        p for p in entries if p not in disk_set and (p in gone or not (root / p).is_file())
+    }
+    new = [p for p in disk if p not in entries]
+    appeared = set(added) if added is not None else None
+
+    renames: dict[str, str] = {}
+    if prune and missing and new:
+        # enkel eenduidige renames: een blob die bij meerdere verdwenen entries
+        # of meerdere nieuwe bestanden hoort (lege/identieke bestanden) telt niet
+        old_by_blob: dict[str, list[str]] = {}
+        for p, sha in index_blobs(sorted(missing), root).items():
+            old_by_blob.setdefault(sha, []).append(p)
+        new_by_blob: dict[str, list[str]] = {}
+        for p in new:
+            if appeared is not None and p not in appeared:
+                continue  # stond er al bij de vorige scan: geen rename-doel
+            for sha in _disk_blob_ids(root / p) & old_by_blob.keys():
+                new_by_blob.setdefault(sha, []).append(p)
+        for sha, olds in old_by_blob.items():
+            news = new_by_blob.get(sha, [])
+            if len(olds) == 1 and len(news) == 1 and news[0] not in renames.values():
+                renames[olds[0]] = news[0]
+    renamed_to = set(renames.values())
+
+    result: list[dict] = []
+    for p, entry in entries.items():
+        if p in renames:
+            result.append(normalize_script_entry(entry, renames[p]))
+            report.renamed.append((p, renames[p]))
+        elif prune and p in missing:
+            report.removed.append(p)
+        else:
+            result.append(entry)
+    for p in new:
+        if p not in renamed_to:
+            result.append(normalize_script_entry(p))
+            report.added.append(p)
+
+    old_urls = data.get("script_urls") if isinstance(data.get("script_urls"), dict) else {}
+    urls: dict[str, str] = {}
+    for entry in result:
+        p = entry["path"]
+        url = url_for(p) if url_for else None
+        if not url and entry["path"] not in renamed_to:
+            url = entry.get("github_url") or old_urls.get(p)
+        if url:
+            entry["github_url"] = url
+            urls[p] = url
+        else:
+            entry.pop("github_url", None)
+
+    data["scripts"] = result
+    if urls or "script_urls" in data:
+        report.urls_changed = urls != old_urls
+        data["script_urls"] = urls
+    return report
+
+# [END: reconcile_scripts]
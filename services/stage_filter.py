@@ -0,0 +1,246 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import functools
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+# Vóór elke `git add`: kandidaten stat'en en wat niet in een commit hoort eruit
+# halen. Instelbaar per project via "git_stage" in .projassist.json:
+#   {"max_file_mb": 10, "lfs": true, "block_dirs": ["dist", "build"]}
+DEFAULT_MAX_MB = 10.0
+BLOCK_DIRS = frozenset(
+    {"dist", "build", "__pycache__", "venv", ".venv", "node_modules", ".pytest_cache", ".mypy_cache"}
+)
+GITATTRIBUTES = ".gitattributes"
+_LFS_ATTRS = "filter=lfs diff=lfs merge=lfs -text"
+
+
+# [CLASS: StagePolicy]
+@dataclass(frozen=True)
+class StagePolicy:
+    max_bytes: int = int(DEFAULT_MAX_MB * 1024 * 1024)
+    lfs: bool = False  # te grote bestanden via Git LFS i.p.v. weigeren
+    block_dirs: frozenset = BLOCK_DIRS
+
+
+# [END: StagePolicy]
+
+
+# [CLASS: StagePlan]
+@dataclass
+class StagePlan:
+    stage: List[str] = field(default_factory=list)  # zoals opgegeven (relatief t.o.v. cwd)
+    lfs: List[str] = field(default_factory=list)  # repo-relatief, via LFS te tracken
+    refused: List[Tuple[str, str]] = field(default_factory=list)  # (pad, reden)
+    ignored: List[str] = field(default_factory=list)  # .gitignore
+
+    # [FUNC: summary]
+    def summary(self) -> str:
+        parts = []
+        if self.lfs:
+            parts.append(f"{len(self.lfs)} groot bestand(en) via Git LFS")
+        if self.refused:
+            shown = ", ".join(f"{p} ({why})" for p, why in self.refused[:5])
+            more = f" en {len(self.refused) - 5} meer" if len(self.refused) > 5 else ""
+            parts.append(f"niet gecommit: {shown}{more}")
+        if self.ignored:
+            parts.append(f"{len(self.ignored)} genegeerd via .gitignore")
+        return "; ".join(parts)
+
+    # [END: summary]
+
+
+# [END: StagePlan]
+
+
+# [FUNC: lfs_available]
+@functools.lru_cache(maxsize=1)
+def lfs_available() -> bool:
+    """
+    `git lfs` geïnstalleerd? (één keer per proces gecontroleerd). Buiten het
+    repo-slot: plan_stage loopt vanuit GitService.save al ín het slot van de
+    repo, en de procesmap kan in diezelfde repo liggen.
+    """
+    from services.git_service import get_git_service
+
+    return get_git_service().run_sync(["lfs", "version"], os.getcwd(), locked=False).ok
+
+# [END: lfs_available]
+
+
+# [FUNC: _uses_lfs]
+def _uses_lfs(root: Path) -> bool:
+    try:
+        return "filter=lfs" in (root / GITATTRIBUTES).read_text(encoding="utf-8")
+    except OSError:
+        return False
+
+# [END: _uses_lfs]
+
+
+# [FUNC: policy_for]
+def policy_for(root: str | Path) -> StagePolicy:
+    """
+    Beleid voor een projectroot: "git_stage" uit .projassist.json, anders de
+    standaard. LFS staat aan als het project het vraagt of de repo het al
+    gebruikt (.gitattributes met filter=lfs); de controle of git-lfs
+    geïnstalleerd is gebeurt pas als er echt een groot bestand is.
+    """
+    from services.config_model import ConfigError, load_config
+
+    root = Path(root)
+    opts: dict = {}
+    try:
+        opts = load_config(root / ".projassist.json").get("git_stage") or {}
+    except ConfigError as ex:
+        logger.debug("git_stage niet leesbaar (%s); standaardbeleid", ex)
+    mb = opts.get("max_file_mb", DEFAULT_MAX_MB)
+    lfs = opts.get("lfs")
+    return StagePolicy(
+        max_bytes=int(float(mb) * 1024 * 1024),
+        lfs=_uses_lfs(root) if lfs is None else bool(lfs),
+        block_dirs=frozenset(opts["block_dirs"]) if "block_dirs" in opts else BLOCK_DIRS,
+    )
+
+# [END: policy_for]
+
+
+# [FUNC: walk_files]
+def walk_files(root: str | Path, policy: StagePolicy) -> Iterator[str]:
+    """Alle bestanden onder root (repo-relatief, POSIX), zonder .git en geblokkeerde mappen."""
+    top = os.fspath(root)
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(top, rel_dir)) as it:
+                for e in it:
+                    rel = f"{rel_dir}/{e.name}" if rel_dir else e.name
+                    if e.is_dir(follow_symlinks=False):
+                        if e.name != ".git" and e.name not in policy.block_dirs:
+                            stack.append(rel)
+                    else:
+                        yield rel
+        except OSError as ex:
+            logger.debug("Map niet leesbaar: %s (%s)", rel_dir, ex)
+
+# [END: walk_files]
+
+
+# [FUNC: ignored_paths]
+def ignored_paths(root: str | Path, rels: List[str]) -> set[str]:
+    """Welke paden .gitignore uitsluit: één `git check-ignore --stdin -z` voor allemaal."""
+    if not rels:
+        return set()
+    from services.git_service import get_git_service
+
+    data = "\0".join(rels).encode("utf-8") + b"\0"
+    res = get_git_service().run_sync(["check-ignore", "--stdin", "-z"], root, input=data)
+    # exit 1 = niets genegeerd; 128 = fout (bv. geen repo) → niets uitsluiten
+    if res.returncode not in (0, 1):
+        logger.debug("check-ignore faalde: %s", res.output)
+        return set()
+    return {p for p in res.stdout.split("\0") if p}
+
+# [END: ignored_paths]
+
+
+# [FUNC: plan_stage]
+def plan_stage(
+    root: str | Path,
+    paths: Optional[Iterable[str | Path]] = None,
+    policy: Optional[StagePolicy] = None,
+    cwd: Optional[str | Path] = None,
+    check_ignore: bool = True,
+) -> StagePlan:
+    """
+    Kandidaten voor `git add` filteren: paths (relatief t.o.v. cwd, standaard
+    root) of, met paths=None, de hele boom (vervanging van `git add .`).
+    - onder een geblokkeerde map (dist/, build/, venv/, ...) → geweigerd
+    - groter dan max_bytes → via LFS (indien aan en beschikbaar) of geweigerd
+    - .gitignore → overgeslagen (check_ignore=False slaat die git-aanroep over)
+    Verwijderde bestanden blijven staan: `git add` registreert dan de delete.
+    """
+    root_s = os.path.abspath(os.fspath(root))
+    base = os.path.abspath(os.fspath(cwd)) if cwd is not None else root_s
+    policy = policy or policy_for(root_s)
+    plan = StagePlan()
+
+    if paths is None:
+        cands = [(rel, rel) for rel in walk_files(root_s, policy)]
+    else:
+        cands = []
+        for p in paths:
+            full = os.path.normpath(os.path.join(base, os.fspath(p)))
+            rel = os.path.relpath(full, root_s).replace(os.sep, "/")
+            cands.append((os.fspath(p), rel))
+
+    kept: List[Tuple[str, str]] = []
+    big: List[Tuple[str, str, int]] = []
+    for given, rel in cands:
+        if any(part in policy.block_dirs for part in rel.split("/")[:-1]):
+            plan.refused.append((rel, "buildmap"))
+            continue
+        try:
+            size = os.stat(os.path.join(root_s, rel)).st_size
+        except OSError:
+            kept.append((given, rel))  # verwijderd
+            continue
+        if size > policy.max_bytes:
+            big.append((given, rel, size))
+        else:
+            kept.append((given, rel))
+
+    if big:
+        if policy.lfs and lfs_available():
+            for given, rel, _size in big:
+                plan.lfs.append(rel)
+                kept.append((given, rel))
+        else:
+            limit = policy.max_bytes / (1024 * 1024)
+            for _given, rel, size in big:
+                plan.refused.append((rel, f"{size / (1024 * 1024):.1f} MB > {limit:g} MB"))
+
+    if check_ignore and kept:
+        ign = ignored_paths(root_s, [rel for _g, rel in kept])
+        plan.ignored = [rel for _g, rel in kept if rel in ign]
+        kept = [(g, rel) for g, rel in kept if rel not in ign]
+    plan.stage = [g for g, _rel in kept]
+    return plan
+
+# [END: plan_stage]
+
+
+# [FUNC: track_lfs]
+def track_lfs(root: str | Path, rels: Iterable[str]) -> Optional[Path]:
+    """
+    Paden via LFS laten lopen (zoals `git lfs track`): regels in .gitattributes.
+    Retourneert .gitattributes als die gewijzigd werd (moet mee gestaged worden).
+    """
+    path = Path(root) / GITATTRIBUTES
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        text = ""
+    lines = text.splitlines()
+    have = {ln.split()[0] for ln in lines if ln.strip() and not ln.startswith("#")}
+    new = []
+    for rel in rels:
+        pattern = "/" + rel.replace(" ", "[[:space:]]")
+        if pattern not in have:
+            new.append(f"{pattern} {_LFS_ATTRS}")
+            have.add(pattern)
+    if not new:
+        return None
+    body = "\n".join(lines + new) + "\n"
+    path.write_text(body, encoding="utf-8", newline="\n")
+    return path
+
+# [END: track_lfs]
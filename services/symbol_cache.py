@@ -0,0 +1,323 @@
+# [SECTION: Imports]
+from __future__ import annotations
+
+import ast
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.paths import rel_posix, resolved_root
+
+logger = logging.getLogger(__name__)
+
+# [END: Imports]
+CACHE_DIRNAME = ".projassist_cache"
+CACHE_FILENAME = "symbols.pickle"
+CACHE_VERSION = 1
+MAX_CONTENT_ENTRIES = 5000
+
+Meta = Dict[str, Any]
+
+
+# =========================================================
+# Python analyse (AST) + main/imports
+# =========================================================
+# [FUNC: _py_node_start_lineno]
+def _py_node_start_lineno(node: ast.AST) -> int:
+    if isinstance(
+        node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+    ) and getattr(node, "decorator_list", None):
+        return min(d.lineno for d in node.decorator_list)  # type: ignore[attr-defined]
+    return getattr(node, "lineno", 1)
+
+# [END: _py_node_start_lineno]
+
+
+# [FUNC: _py_node_end_lineno]
+def _py_node_end_lineno(node: ast.AST) -> int:
+    end_ln = getattr(node, "end_lineno", None)
+    if isinstance(end_ln, int):
+        return end_ln
+
+    def last_line(n: ast.AST) -> int:
+        v = getattr(n, "end_lineno", None)
+        if isinstance(v, int):
+            return v
+        for attr in ("body", "orelse", "finalbody"):
+            seq = getattr(n, attr, None)
+            if isinstance(seq, list) and seq:
+                return last_line(seq[-1])
+        return getattr(n, "lineno", 1)
+
+    return last_line(node)
+
+# [END: _py_node_end_lineno]
+
+
+# [FUNC: _py_find_import_block]
+def _py_find_import_block(lines: List[str]) -> Optional[Tuple[int, int]]:
+    first = last = None
+    paren_depth = 0
+    cont = False
+    in_block = False
+    for i, ln in enumerate(lines):
+        is_import = bool(re.match(r"^\s*(import\s+\w|from\s+\w)", ln))
+        if not in_block:
+            if is_import:
+                first = last = i
+                in_block = True
+                paren_depth = ln.count("(") - ln.count(")")
+                cont = ln.rstrip().endswith("\\")
+            continue
+        if is_import or paren_depth > 0 or cont:
+            last = i
+            paren_depth += ln.count("(") - ln.count(")")
+            cont = ln.rstrip().endswith("\\")
+            continue
+        if ln.strip() == "":
+            last = i
+            cont = False
+            continue
+        break
+    if first is None:
+        return None
+    return (first, last if last is not None else first)
+
+# [END: _py_find_import_block]
+
+
+# [FUNC: _py_find_main_guard]
+def _py_find_main_guard(lines: List[str]) -> Optional[Tuple[int, int]]:
+    start = None
+    for i, ln in enumerate(lines):
+        if re.match(r'^\s*if\s+__name__\s*==\s*[\'"]__main__[\'"]\s*:\s*$', ln):
+            start = i
+            break
+    if start is None:
+        return None
+    end = len(lines) - 1
+    for j in range(start + 1, len(lines)):
+        if re.match(r"^\s*(def|class)\b", lines[j]):
+            end = j - 1
+            break
+    return (start, end)
+
+# [END: _py_find_main_guard]
+
+
+# [FUNC: collect_python]
+def collect_python(lines: List[str]) -> Meta:
+    """
+    Symbolen van een Python-bestand: functions/classes (1-based, incl. decorators),
+    methods per class, import-blok en main-guard (0-based regelindexen).
+    """
+    # de join leeft alleen tijdens het parsen; daarna werken we op `lines`
+    tree = ast.parse("".join(lines))
+    functions: List[Tuple[str, int, int]] = []
+    classes: List[Tuple[str, int, int, List[Tuple[str, int, int]]]] = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            s = _py_node_start_lineno(node)
+            e = _py_node_end_lineno(node)
+            functions.append((node.name, s, e))
+        elif isinstance(node, ast.ClassDef):
+            cs = _py_node_start_lineno(node)
+            ce = _py_node_end_lineno(node)
+            methods: List[Tuple[str, int, int]] = []
+            for sub in node.body:
+                if isinstance(sub, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    ms = _py_node_start_lineno(sub)
+                    me = _py_node_end_lineno(sub)
+                    methods.append((sub.name, ms, me))
+            classes.append((node.name, cs, ce, methods))
+
+    return {
+        "imports": _py_find_import_block(lines),
+        "functions": functions,
+        "classes": classes,
+        "main_guard": _py_find_main_guard(lines),
+    }
+
+# [END: collect_python]
+
+
+# [FUNC: find_symbol]
+def find_symbol(meta: Meta, name: str) -> Optional[Tuple[int, int]]:
+    """(start, end) 1-based incl. van een functie, class of methode; None als onbekend."""
+    for fname, s, e in meta.get("functions", []):
+        if fname == name:
+            return (s, e)
+    for cname, cs, ce, methods in meta.get("classes", []):
+        if cname == name:
+            return (cs, ce)
+        for mname, ms, me in methods:
+            if mname == name:
+                return (ms, me)
+    return None
+
+# [END: find_symbol]
+
+
+# [FUNC: find_project_root]
+def find_project_root(path: Path) -> Path:
+    """Eerste map (vanaf `path` omhoog) met een .projassist.json; anders de map van `path`."""
+    p = Path(path).resolve()
+    start = p if p.is_dir() else p.parent
+    for d in (start, *start.parents):
+        if (d / ".projassist.json").exists():
+            return d
+    return start
+
+# [END: find_project_root]
+
+
+# =========================================================
+# Cache
+# =========================================================
+# [CLASS: SymbolCache]
+@dataclass
+class SymbolCache:
+    """
+    Projectbrede symbooltabel, bewaard in <root>/.projassist_cache/symbols.pickle.
+
+    - per inhoud: (ext, sha1 van de tekst) → meta; gedeeld door alle tools
+    - per bestand: pad → (mtime_ns, size, sha1); een ongewijzigd bestand kost
+      zo enkel een stat-call
+    """
+
+    project_root: Path
+    _content: Dict[Tuple[str, str], Meta] = field(default_factory=dict, repr=False)
+    _files: Dict[str, Tuple[int, int, str]] = field(default_factory=dict, repr=False)
+    _dirty: bool = field(default=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    # [FUNC: path]
+    @property
+    def path(self) -> Path:
+        return Path(self.project_root) / CACHE_DIRNAME / CACHE_FILENAME
+
+    # [END: path]
+
+    # [FUNC: load]
+    def load(self) -> "SymbolCache":
+        try:
+            with self.path.open("rb") as fh:
+                data = pickle.load(fh)
+        except FileNotFoundError:
+            return self
+        except Exception as ex:
+            logger.warning("Symboolcache onleesbaar, opnieuw opbouwen: %s", ex)
+            return self
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._content = data.get("content", {})
+            self._files = data.get("files", {})
+        return self
+
+    # [END: load]
+
+    # [FUNC: save]
+    def save(self) -> None:
+        """Atomisch wegschrijven (tempfile + replace), enkel als er iets wijzigde."""
+        with self._lock:
+            if not self._dirty:
+                return
+            if len(self._content) > MAX_CONTENT_ENTRIES:
+                live = {(Path(p).suffix.lower(), h) for p, (_, _, h) in self._files.items()}
+                self._content = {k: v for k, v in self._content.items() if k in live}
+            data = {
+                "version": CACHE_VERSION,
+                "content": dict(self._content),
+                "files": dict(self._files),
+            }
+            self._dirty = False
+        target = self.path
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=target.name, dir=target.parent)
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, target)
+        except OSError as ex:
+            logger.warning("Symboolcache niet opgeslagen: %s", ex)
+
+    # [END: save]
+
+    # [FUNC: for_lines]
+    def for_lines(
+        self,
+        lines: List[str],
+        ext: str = ".py",
+        collect: Callable[[List[str]], Meta] = collect_python,
+    ) -> Meta:
+        """Meta voor deze inhoud; parse enkel bij een onbekende hash."""
+        key = (ext.lower(), hashlib.sha1("".join(lines).encode("utf-8")).hexdigest())
+        meta = self._content.get(key)
+        if meta is None:
+            meta = collect(lines)
+            with self._lock:
+                self._content[key] = meta
+                self._dirty = True
+        return meta
+
+    # [END: for_lines]
+
+    # [FUNC: for_file]
+    def for_file(
+        self, file_path: Path, collect: Callable[[List[str]], Meta] = collect_python
+    ) -> Meta:
+        """Meta van het bestand zoals het op schijf staat (regelnummers = ruwe regels)."""
+        p = Path(os.path.abspath(file_path))
+        st = p.stat()
+        ext = p.suffix.lower()
+        rel = self._rel(p)
+        hit = self._files.get(rel)
+        if hit and hit[:2] == (st.st_mtime_ns, st.st_size):
+            meta = self._content.get((ext, hit[2]))
+            if meta is not None:
+                return meta
+        text = p.read_text(encoding="utf-8-sig", errors="replace")
+        lines = text.splitlines(keepends=True)
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        meta = self._content.get((ext, digest))
+        if meta is None:
+            meta = collect(lines)
+        with self._lock:
+            self._content[(ext, digest)] = meta
+            self._files[rel] = (st.st_mtime_ns, st.st_size, digest)
+            self._dirty = True
+        return meta
+
+    # [END: for_file]
+
+    # [FUNC: _rel]
+    def _rel(self, p: Path) -> str:
+        rel = rel_posix(self.project_root, p)
+        return rel if rel is not None else p.as_posix()
+
+    # [END: _rel]
+
+
+# [END: SymbolCache]
+
+_CACHES: Dict[Path, SymbolCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+# [FUNC: get_cache]
+def get_cache(project_root: Path) -> SymbolCache:
+    """Eén (lazy geladen) cache per projectroot, gedeeld binnen het proces."""
+    root = resolved_root(project_root)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(root)
+        if cache is None:
+            cache = _CACHES[root] = SymbolCache(root).load()
+        return cache
+
+# [END: get_cache]
@@ -13,9 +13,6 @@ for sub in ("", "gui", "handlers", "resources"):
     if sp not in sys.path and p.exists():
         sys.path.append(sp)
 
-from gui.codewijziger import Ui_CodeWijzigerWindow
-from handlers.codewijziger_controller import CodeWijzigerController
-
 DUMMY_BASE = """\
 from typing import Iterable, List
 logger = logging.getLogger(__name__)
@@ -36,7 +33,6 @@ def dangerous_op(path):
 
 
 # [FUNC: make_multimatch_content]
-logger.debug("make_multimatch_content() called")
 def make_multimatch_content() -> str:
     return DUMMY_BASE.replace(
         "# [FUNC: process_items]", "# [FUNC: process_items]\n# variant A"
@@ -52,7 +48,6 @@ def make_multimatch_content() -> str:
 
 # [FUNC: tmp_target]
 @pytest.fixture
-logger.debug("tmp_target() called")
 def tmp_target(tmp_path: Path):
     """Maakt een tijdelijk doelbestand met de dummy-inhoud."""
     tgt = tmp_path / "dummy_target.py"
@@ -61,7 +56,6 @@ def tmp_target(tmp_path: Path):
 
 # [END: tmp_target]
 
-logger.debug("tmp_target_multimatch() called")
 # [FUNC: tmp_target_multimatch]
 @pytest.fixture
 def tmp_target_multimatch(tmp_path: Path):
@@ -71,11 +65,14 @@ def tmp_target_multimatch(tmp_path: Path):
 
 # [END: tmp_target_multimatch]
 
-    logger.debug("ui_env() called")
 # [FUNC: ui_env]
 @pytest.fixture
 def ui_env(qtbot, tmp_path: Path):
     """Start het Codewijziger-venster + controller."""
+    # pas hier importeren: tests zonder venster hebben de controller niet nodig
+    from gui.codewijziger import Ui_CodeWijzigerWindow
+    from handlers.codewijziger_controller import CodeWijzigerController
+
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
     win = QtWidgets.QMainWindow()
     ui = Ui_CodeWijzigerWindow()
@@ -86,7 +83,6 @@ def ui_env(qtbot, tmp_path: Path):
     win.show()
     qtbot.addWidget(win)
     return ui, win, ctrl
-    logger.debug("paste_form_and_analyse() called")
 
 # [END: ui_env]
 
@@ -0,0 +1,89 @@
+# [SECTION: Imports]
+import subprocess
+
+import pytest
+from PyQt6 import QtWidgets
+
+from handlers.codewijziger_controller import _find_symbol_range
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: repo]
+@pytest.fixture
+def repo(tmp_path):
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    f = tmp_path / "mod.py"
+    for i in range(2):
+        f.write_text(f"# [FUNC: f]\ndef f():\n    return {i}\n# [END: f]\n", encoding="utf-8")
+        _git(["add", "."], tmp_path)
+        _git(["commit", "-qm", f"v{i}"], tmp_path)
+    return tmp_path
+
+# [END: repo]
+
+
+# [FUNC: test_restore_revision_writes_and_commits]
+def test_restore_revision_writes_and_commits(ui_env, qtbot, repo, monkeypatch):
+    ui, win, ctrl = ui_env
+    for box in ("critical", "information"):
+        monkeypatch.setattr(QtWidgets.QMessageBox, box, lambda *a, **k: None)
+    target = repo / "mod.py"
+    ctrl.state.bestand = target
+
+    ctrl._on_restore()
+    dlg = ctrl._history_dlg
+    qtbot.addWidget(dlg)
+    qtbot.waitUntil(lambda: dlg.list.count() == 2, timeout=10000)
+    oud = dlg.history.revisions[-1]
+
+    ctrl._show_revision_diff(oud)
+    qtbot.waitUntil(lambda: "return 0" in ui.txtVoorstel.toPlainText(), timeout=10000)
+    assert "return 1" in ui.txtHuidig.toPlainText()
+
+    ctrl._restore_revision(oud)
+    qtbot.waitUntil(
+        lambda: _git(["log", "-1", "--format=%s"], repo).startswith("Codewijziger: herstel"),
+        timeout=15000,
+    )
+    assert "return 0" in target.read_text(encoding="utf-8")
+    assert _git(["status", "--porcelain"], repo) == ""
+
+# [END: test_restore_revision_writes_and_commits]
+
+
+# [FUNC: test_restore_without_repo_falls_back_to_bak]
+def test_restore_without_repo_falls_back_to_bak(ui_env, tmp_path, monkeypatch):
+    ui, win, ctrl = ui_env
+    monkeypatch.setattr(QtWidgets.QMessageBox, "information", lambda *a, **k: None)
+    target = tmp_path / "los.py"
+    target.write_text("nieuw\n", encoding="utf-8")
+    (tmp_path / "los.py.bak").write_text("oud\n", encoding="utf-8")
+    ctrl.state.bestand = target
+
+    ctrl._on_restore()
+    assert ctrl._history_dlg is None
+    assert target.read_text(encoding="utf-8") == "oud\n"
+
+# [END: test_restore_without_repo_falls_back_to_bak]
+
+
+# [FUNC: test_find_symbol_range_without_markers]
+def test_find_symbol_range_without_markers(tmp_path):
+    (tmp_path / ".git").mkdir()
+    f = tmp_path / "m.py"
+    f.write_text("x = 1\n\n\ndef doel(a):\n    return a\n\n\ndef ander():\n    pass\n", encoding="utf-8")
+    assert _find_symbol_range(f, "# [FUNC: doel]") == (3, 4)
+    assert _find_symbol_range(f, "# [FUNC: weg]") == (-1, -1)
+    assert _find_symbol_range(f, "geen marker") == (-1, -1)
+
+# [END: test_find_symbol_range_without_markers]
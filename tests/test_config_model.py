@@ -0,0 +1,80 @@
+# [SECTION: Imports]
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from services.config_model import ConfigError, ProjAssistConfig, load_config
+from services.json_store import split_scripts
+
+# [END: Imports]
+
+
+# [FUNC: test_repo_config_is_valid]
+def test_repo_config_is_valid():
+    cfg = load_config(Path(__file__).resolve().parents[1] / ".projassist.json")
+    assert cfg.project_name
+    assert "main.py" in cfg.script_paths()
+    assert not hasattr(cfg, "__dict__")  # slots
+
+# [END: test_repo_config_is_valid]
+
+
+# [FUNC: test_cached_per_mtime_and_reloaded_after_change]
+def test_cached_per_mtime_and_reloaded_after_change(tmp_path):
+    jp = tmp_path / ".projassist.json"
+    jp.write_text(
+        json.dumps({"project_name": "p", "scripts": ["a.py", {"path": "b\\c.py"}]}),
+        encoding="utf-8",
+    )
+    first = load_config(jp)
+    assert load_config(jp) is first
+    assert [(s.path, s.name, s.type) for s in first.scripts] == [
+        ("a.py", "a", "py"),
+        ("b/c.py", "c", "py"),
+    ]
+
+    jp.write_text(json.dumps({"project_name": "q", "extra": [1]}), encoding="utf-8")
+    st = os.stat(jp)
+    os.utime(jp, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = load_config(jp)
+    assert second is not first and second.project_name == "q"
+    # to_dict is een eigen kopie: de gedeelde config blijft ongewijzigd
+    second.to_dict()["extra"].append(2)
+    assert second.get("extra") == [1]
+
+# [END: test_cached_per_mtime_and_reloaded_after_change]
+
+
+# [FUNC: test_malformed_entries_are_rejected]
+@pytest.mark.parametrize(
+    "doc, where",
+    [
+        ({"scripts": ["a.py", 3]}, "scripts[1]"),
+        ({"scripts": [{"name": "x"}]}, "scripts[0]: 'path' ontbreekt"),
+        ({"scripts": [{"path": ""}]}, "scripts[0].path"),
+        ({"github_repo": ["x"]}, "github_repo"),
+        ({"script_urls": {"a.py": 1}}, "script_urls.a.py"),
+        ([], "document"),
+    ],
+)
+def test_malformed_entries_are_rejected(tmp_path, doc, where):
+    with pytest.raises(ConfigError, match=__import__("re").escape(where)):
+        ProjAssistConfig.from_dict(tmp_path / ".projassist.json", doc)
+
+# [END: test_malformed_entries_are_rejected]
+
+
+# [FUNC: test_invalid_json_and_split_layout]
+def test_invalid_json_and_split_layout(tmp_path):
+    jp = tmp_path / ".projassist.json"
+    jp.write_text("{kapot", encoding="utf-8")
+    with pytest.raises(ConfigError):
+        load_config(jp)
+
+    jp.write_text(json.dumps({"scripts": ["a.py"]}), encoding="utf-8")
+    split_scripts(jp)
+    assert load_config(jp).script_paths() == ["a.py"]
+
+# [END: test_invalid_json_and_split_layout]
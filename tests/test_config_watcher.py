@@ -0,0 +1,49 @@
+# [SECTION: Imports]
+import json
+
+from handlers.config_watcher import ConfigWatcher
+from services.config_model import diff_configs, load_config
+from services.json_store import save_json
+
+# [END: Imports]
+
+
+# [FUNC: test_diff_configs]
+def test_diff_configs(tmp_path):
+    jp = tmp_path / ".projassist.json"
+    jp.write_text(json.dumps({"project_name": "a", "scripts": ["x.py", "y.py"]}))
+    old = load_config(jp)
+    save_json(jp, {"project_name": "b", "scripts": ["y.py", {"path": "z.py"}]})
+    diff = diff_configs(old, load_config(jp))
+    assert diff.keys == ("project_name",)
+    assert diff.scripts_added == ("z.py",) and diff.scripts_removed == ("x.py",)
+    assert not diff.empty and "1 script(s) toegevoegd" in diff.summary()
+
+# [END: test_diff_configs]
+
+
+# [FUNC: test_watcher_emits_diff_after_atomic_save]
+def test_watcher_emits_diff_after_atomic_save(qtbot, tmp_path):
+    jp = tmp_path / ".projassist.json"
+    jp.write_text(json.dumps({"project_name": "a", "scripts": ["x.py"]}))
+    watcher = ConfigWatcher()
+    watcher.watch(jp)
+    try:
+        with qtbot.waitSignal(watcher.changed, timeout=5000) as blocker:
+            save_json(jp, {"project_name": "a", "scripts": ["x.py", "n.py"]})
+        cfg, diff = blocker.args
+        assert diff.scripts_added == ("n.py",)
+        assert watcher.config is cfg and watcher.data()["scripts"][1] == "n.py"
+
+        # tweede wijziging: bestand werd vervangen, watcher volgt nog steeds
+        with qtbot.waitSignal(watcher.changed, timeout=5000) as blocker:
+            save_json(jp, {"project_name": "b", "scripts": ["x.py", "n.py"]})
+        assert blocker.args[1].keys == ("project_name",)
+
+        with qtbot.waitSignal(watcher.failed, timeout=5000):
+            jp.write_text("{kapot")
+        assert watcher.config.project_name == "b"
+    finally:
+        watcher.stop()
+
+# [END: test_watcher_emits_diff_after_atomic_save]
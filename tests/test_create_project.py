@@ -0,0 +1,42 @@
+# [SECTION: Imports]
+import subprocess
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("requests")
+
+from create_project import git_init_and_push  # noqa: E402
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: test_git_init_and_push_filters_the_first_commit]
+def test_git_init_and_push_filters_the_first_commit(tmp_path, monkeypatch):
+    for key in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{key}_NAME", "t")
+        monkeypatch.setenv(f"GIT_{key}_EMAIL", "t@example.com")
+    remote = tmp_path / "remote.git"
+    _git(["init", "-q", "--bare", str(remote)], tmp_path)
+    proj = tmp_path / "project_x"
+    (proj / "gui").mkdir(parents=True)
+    (proj / "dist").mkdir()
+    (proj / "main.py").write_text("print('x')\n", encoding="utf-8")
+    (proj / "gui" / "MainWindow.ui").write_text("<ui/>\n", encoding="utf-8")
+    (proj / "dist" / "app.exe").write_bytes(b"\0" * 10)
+    (proj / "debug.log").write_text("log\n", encoding="utf-8")
+    (proj / ".gitignore").write_text("*.log\n", encoding="utf-8")
+
+    git_init_and_push(str(proj), str(remote))
+
+    pushed = _git(["ls-tree", "-r", "--name-only", "main"], remote).split()
+    assert pushed == [".gitignore", "gui/MainWindow.ui", "main.py"]
+
+# [END: test_git_init_and_push_filters_the_first_commit]
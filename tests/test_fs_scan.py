@@ -0,0 +1,93 @@
+# [SECTION: Imports]
+import os
+
+from services.fs_scan import IgnoreMatcher, matcher_from_config, scan_files
+
+# [END: Imports]
+
+
+# [FUNC: _touch]
+def _touch(root, *rels):
+    for rel in rels:
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("", encoding="utf-8")
+
+# [END: _touch]
+
+
+# [FUNC: test_ignore_patterns_gitignore_style]
+def test_ignore_patterns_gitignore_style():
+    m = IgnoreMatcher.from_patterns(
+        ["# commentaar", "*.tmp", "/build/", "docs/**/gen_*.py", "!keep.tmp", "cache/"]
+    )
+    assert m.ignored("a/b/x.tmp", False)
+    assert not m.ignored("keep.tmp", False)
+    assert m.ignored("build", True)
+    assert not m.ignored("src/build", True)  # verankerd aan de root
+    assert m.ignored("docs/gen_a.py", False)
+    assert m.ignored("docs/x/y/gen_a.py", False)
+    assert not m.ignored("docs/x/main.py", False)
+    assert m.ignored("src/cache", True)
+    assert not m.ignored("src/cache", False)  # enkel mappen
+
+# [END: test_ignore_patterns_gitignore_style]
+
+
+# [FUNC: test_scan_prunes_before_descending]
+def test_scan_prunes_before_descending(tmp_path, monkeypatch):
+    _touch(
+        tmp_path,
+        "main.py",
+        "gui/ui.ui",
+        "gui/old_ui.py",
+        "backup/2024/main.py",
+        ".git/hooks/x.py",
+        "venv/lib/site.py",
+        "sub/backup/keep.py",
+        "sub/__pycache__/x.py",
+    )
+    seen = []
+    real = os.scandir
+
+    def spy(path):
+        seen.append(os.path.relpath(path, tmp_path).replace(os.sep, "/"))
+        return real(path)
+
+    monkeypatch.setattr(os, "scandir", spy)
+    m = matcher_from_config({"scan_ignore": ["old_*.py"]})
+    out = sorted(scan_files(tmp_path, (".py", ".ui"), m))
+
+    assert out == ["gui/ui.ui", "main.py", "sub/backup/keep.py"]
+    assert not any(s.split("/")[0] in {"backup", ".git", "venv"} for s in seen)
+    assert "sub/__pycache__" not in seen
+
+# [END: test_scan_prunes_before_descending]
+
+
+# [FUNC: test_incremental_scan_relists_only_changed_dirs]
+def test_incremental_scan_relists_only_changed_dirs(tmp_path, monkeypatch):
+    from services import fs_scan
+    from services.fs_scan import incremental_scan
+
+    _touch(tmp_path, "a.py", "pkg/b.py", "pkg/sub/c.py", "other/d.py")
+    snap = tmp_path / ".projassist_cache" / "scan.pickle"
+    snap.parent.mkdir()  # anders wijzigt de eerste save de mtime van de root
+    monkeypatch.setattr(fs_scan, "RACY_NS", 0)  # testmappen zijn net aangemaakt
+
+    first = incremental_scan(tmp_path, snapshot_path=snap)
+    assert first.files == {"a.py", "pkg/b.py", "pkg/sub/c.py", "other/d.py"}
+    assert first.added == first.files and not first.removed
+
+    again = incremental_scan(tmp_path, snapshot_path=snap)
+    assert again.relisted == 0 and not again.added and not again.removed
+
+    (tmp_path / "pkg" / "sub" / "c.py").unlink()
+    _touch(tmp_path, "pkg/sub/e.py")
+    os.utime(tmp_path / "pkg" / "sub", ns=(1, 10**18))  # mtime gegarandeerd anders (2001)
+    delta = incremental_scan(tmp_path, snapshot_path=snap)
+    assert delta.added == {"pkg/sub/e.py"}
+    assert delta.removed == {"pkg/sub/c.py"}
+    assert delta.relisted == 1
+
+# [END: test_incremental_scan_relists_only_changed_dirs]
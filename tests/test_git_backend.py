@@ -0,0 +1,136 @@
+# [SECTION: Imports]
+import os
+import subprocess
+import sys
+
+import pytest
+
+from services import git_backend
+from services.git_backend import DulwichBackend, SubprocessBackend
+from services.git_service import GitService
+from services.git_status import MODIFIED, UNTRACKED
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: service]
+@pytest.fixture
+def service():
+    svc = GitService(timeout=30)
+    yield svc
+    svc.shutdown()
+
+# [END: service]
+
+
+# [FUNC: backend]
+@pytest.fixture(params=["subprocess", "dulwich"])
+def backend(request, service):
+    if request.param == "dulwich":
+        if git_backend.porcelain is None:
+            pytest.skip("dulwich niet geïnstalleerd")
+        return DulwichBackend(fallback=SubprocessBackend(service))
+    return SubprocessBackend(service)
+
+# [END: backend]
+
+
+# [FUNC: repo]
+@pytest.fixture
+def repo(tmp_path):
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    return tmp_path
+
+# [END: repo]
+
+
+# [FUNC: test_add_commit_status_rm]
+def test_add_commit_status_rm(backend, repo):
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "a.py").write_text("A = 1\n", encoding="utf-8")
+
+    assert backend.add(["a.py"], repo / "pkg").ok  # relatief t.o.v. cwd, zoals git
+    assert backend.commit("eerste", repo).ok
+    assert _git(["log", "--format=%s"], repo).strip() == "eerste"
+    assert _git(["ls-files"], repo).split() == ["pkg/a.py"]
+
+    again = backend.commit("niets", repo)
+    assert not again.ok and "nothing to commit" in again.output
+
+    (repo / "pkg" / "a.py").write_text("A = 2\n", encoding="utf-8")
+    (repo / "los.txt").write_text("x", encoding="utf-8")
+    st = backend.status(repo).summary()
+    assert (st["branch"], st["changed"], st["untracked"]) == ("main", 1, 1)
+
+    assert backend.rm(["pkg/a.py"], repo, cached=True).ok
+    assert backend.commit("weg", repo).ok
+    assert _git(["ls-files"], repo).strip() == ""
+    assert (repo / "pkg" / "a.py").exists()
+
+# [END: test_add_commit_status_rm]
+
+
+# [FUNC: test_subprocess_status_keeps_raw_paths]
+@pytest.mark.skipif(sys.platform == "win32", reason="niet-UTF-8-bestandsnamen")
+def test_subprocess_status_keeps_raw_paths(service, repo):
+    (repo / "spatie ").write_text("x", encoding="utf-8")
+    _git(["add", "."], repo)
+    _git(["commit", "-qm", "start"], repo)
+    (repo / "spatie ").write_text("y", encoding="utf-8")
+    raw = os.fsdecode(b"oud-\xe9.py")  # latin-1, geen geldige UTF-8
+    (repo / raw).write_text("z", encoding="utf-8")
+
+    st = SubprocessBackend(service).status(repo)
+
+    assert st.state_of("spatie ") == MODIFIED
+    assert st.state_of(raw) == UNTRACKED
+    assert sorted(st.files) == sorted(["spatie ", raw])
+
+# [END: test_subprocess_status_keeps_raw_paths]
+
+
+# [FUNC: test_outside_repo]
+def test_outside_repo(backend, tmp_path, monkeypatch):
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    assert not backend.is_repo(tmp_path)
+    assert backend.status(tmp_path) is None
+    assert backend.add(["x"], tmp_path).not_a_repo
+
+# [END: test_outside_repo]
+
+
+# [FUNC: test_service_save_uses_backend]
+def test_service_save_uses_backend(backend, service, repo):
+    service.backend = backend
+    (repo / "a.txt").write_text("a", encoding="utf-8")
+    res = service.save(repo, ["a.txt"], "via backend", push=False).result(timeout=30)
+    assert res.ok and [s.args[0] for s in res.steps] == ["add", "commit"]
+    assert _git(["log", "--format=%s"], repo).strip() == "via backend"
+    assert service.save(repo, ["a.txt"], "niets", push=False).result(timeout=30).nothing_to_commit
+
+# [END: test_service_save_uses_backend]
+
+
+# [FUNC: test_subprocess_is_default_dulwich_opt_in]
+def test_subprocess_is_default_dulwich_opt_in(monkeypatch):
+    monkeypatch.delenv(git_backend.BACKEND_ENV, raising=False)
+    git_backend.set_backend(None)
+    try:
+        assert git_backend.get_backend().name == "subprocess"
+        monkeypatch.setenv(git_backend.BACKEND_ENV, "dulwich")
+        git_backend.set_backend(None)
+        wanted = "subprocess" if git_backend.porcelain is None else "dulwich"
+        assert git_backend.get_backend().name == wanted
+    finally:
+        git_backend.set_backend(None)
+
+# [END: test_subprocess_is_default_dulwich_opt_in]
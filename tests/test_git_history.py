@@ -0,0 +1,77 @@
+# [SECTION: Imports]
+import subprocess
+
+import pytest
+
+from services import git_history
+from services.git_history import FileHistory
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: repo]
+@pytest.fixture
+def repo(tmp_path):
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    f = tmp_path / "oud.py"
+    for i in range(3):
+        f.write_bytes(f"X = {i}\r\n".encode("utf-8"))
+        _git(["add", "."], tmp_path)
+        _git(["commit", "-qm", f"v{i}"], tmp_path)
+    _git(["mv", "oud.py", "nieuw.py"], tmp_path)
+    _git(["commit", "-qm", "hernoem"], tmp_path)
+    return tmp_path
+
+# [END: repo]
+
+
+# [FUNC: test_pages_follow_rename]
+def test_pages_follow_rename(repo):
+    hist = FileHistory(repo / "nieuw.py", page_size=2)
+    first = hist.load_more()
+    assert [r.subject for r in first] == ["hernoem", "v2"]
+    assert not hist.exhausted
+    while not hist.exhausted:
+        hist.load_more()
+    assert [r.subject for r in hist.revisions] == ["hernoem", "v2", "v1", "v0"]
+    assert [r.path for r in hist.revisions] == ["nieuw.py", "oud.py", "oud.py", "oud.py"]
+    assert hist.load_more() == []
+
+# [END: test_pages_follow_rename]
+
+
+# [FUNC: test_read_cached_and_restore]
+def test_read_cached_and_restore(repo, monkeypatch):
+    hist = FileHistory(repo / "nieuw.py")
+    hist.load_more()
+    v0 = hist.revisions[-1]
+
+    calls = []
+    svc = git_history.get_git_service()
+    real = svc.run_sync
+    monkeypatch.setattr(svc, "run_sync", lambda args, cwd, **kw: calls.append(args) or real(args, cwd, **kw))
+    assert hist.read(v0) == b"X = 0\r\n"
+    assert hist.read(v0) == b"X = 0\r\n"
+    assert len(calls) == 1
+
+    hist.restore(v0)
+    assert (repo / "nieuw.py").read_bytes() == b"X = 0\r\n"
+
+# [END: test_read_cached_and_restore]
+
+
+# [FUNC: test_outside_repo]
+def test_outside_repo(tmp_path):
+    with pytest.raises(ValueError):
+        FileHistory(tmp_path / "los.py")
+
+# [END: test_outside_repo]
@@ -0,0 +1,131 @@
+# [SECTION: Imports]
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from services.git_lock import RepoLocks, is_lock_contention
+from services.git_service import GitService
+
+# [END: Imports]
+_PKG = Path(__file__).resolve().parents[1]
+
+
+# [FUNC: service]
+@pytest.fixture
+def service():
+    svc = GitService(timeout=30)
+    yield svc
+    svc.shutdown()
+
+# [END: service]
+
+
+# [FUNC: repo]
+@pytest.fixture
+def repo(tmp_path):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        subprocess.run(["git", "config", key, val], cwd=tmp_path, check=True)
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    return tmp_path
+
+# [END: repo]
+
+
+# [FUNC: _hold_in_other_process]
+def _hold_in_other_process(repo, seconds):
+    code = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {str(_PKG)!r})\n"
+        "from services.git_lock import RepoFileLock\n"
+        f"with RepoFileLock({str(repo)!r}):\n"
+        "    print('held', flush=True)\n"
+        f"    time.sleep({seconds})\n"
+    )
+    proc = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True)
+    assert proc.stdout.readline().strip() == "held"
+    return proc
+
+# [END: _hold_in_other_process]
+
+
+# [FUNC: test_contention_messages]
+def test_contention_messages():
+    assert is_lock_contention(
+        "fatal: Unable to create '/r/.git/index.lock': File exists.\n\nAnother git process seems"
+    )
+    assert is_lock_contention("dulwich add: ('/r/.git/index', '/r/.git/index.lock')")
+    assert not is_lock_contention("fatal: not a git repository")
+
+# [END: test_contention_messages]
+
+
+# [FUNC: test_save_waits_for_index_lock]
+def test_save_waits_for_index_lock(service, repo):
+    stale = repo / ".git" / "index.lock"
+    stale.write_text("", encoding="utf-8")
+    threading.Timer(0.3, stale.unlink).start()
+    start = time.monotonic()
+    res = service.save(repo, ["a.txt"], "na wachten", push=False).result(timeout=30)
+    assert res.ok, res.summary()
+    assert time.monotonic() - start >= 0.25
+
+# [END: test_save_waits_for_index_lock]
+
+
+# [FUNC: test_other_process_holds_repo]
+def test_other_process_holds_repo(service, repo):
+    proc = _hold_in_other_process(repo, 0.6)
+    start = time.monotonic()
+    res = service.run_sync(["commit", "--allow-empty", "-qm", "x"], repo)
+    assert res.ok and time.monotonic() - start >= 0.3
+    proc.wait(timeout=10)
+
+    service.locks = RepoLocks(file_lock_timeout=0.2)
+    proc = _hold_in_other_process(repo, 2)
+    try:
+        res = service.run_sync(["commit", "--allow-empty", "-qm", "y"], repo)
+        assert not res.ok and "bezet" in res.stderr
+    finally:
+        proc.kill()
+        proc.wait()
+
+# [END: test_other_process_holds_repo]
+
+
+# [FUNC: test_queue_depth]
+def test_queue_depth(service, repo):
+    seen = []
+    service.locks.add_listener(lambda root, depth: seen.append(depth))
+    futures = [service.run(["status", "--porcelain"], repo) for _ in range(4)]
+    assert all(f.result(timeout=30).ok for f in futures)
+    assert max(seen) >= 2 and seen[-1] == 0
+    assert service.queue_depth(repo) == 0 and service.queue_depth() == 0
+
+# [END: test_queue_depth]
+
+
+# [FUNC: test_push_runs_outside_the_repo_slot]
+def test_push_runs_outside_the_repo_slot(service, repo, tmp_path_factory):
+    remote = tmp_path_factory.mktemp("remote")
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    subprocess.run(["git", "remote", "add", "origin", str(remote)], cwd=repo, check=True)
+    assert service.run_sync(["commit", "--allow-empty", "-qm", "x"], repo).ok
+
+    service.locks = RepoLocks(file_lock_timeout=0.2)
+    proc = _hold_in_other_process(repo, 5)
+    try:
+        res = service.run_sync(["push", "-q", "origin", "HEAD"], repo, locked=False)
+        assert res.ok, res.output
+        # in-process bewerking in de repo-wachtrij: bezet → mislukt resultaat
+        busy = service.call(lambda: "niet uitgevoerd", repo).result(timeout=30)
+        assert not busy.ok and "bezet" in busy.stderr
+    finally:
+        proc.kill()
+        proc.wait()
+
+# [END: test_push_runs_outside_the_repo_slot]
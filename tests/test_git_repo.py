@@ -0,0 +1,47 @@
+# [SECTION: Imports]
+import shutil
+import subprocess
+
+from services import git_repo
+from services.git_repo import current_branch, find_repo_root
+
+# [END: Imports]
+
+
+# [FUNC: test_discovery_is_cached_and_invalidated]
+def test_discovery_is_cached_and_invalidated(tmp_path, monkeypatch):
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    sub = tmp_path / "a" / "b"
+    sub.mkdir(parents=True)
+    assert find_repo_root(sub) is None
+
+    subprocess.run(["git", "init", "-q", "-b", "dev"], cwd=tmp_path, check=True)
+    assert find_repo_root(sub / "x.py") == tmp_path
+    assert current_branch(sub) == "dev"
+
+    # tweede aanroep: enkel stats, geen nieuwe walk
+    calls = []
+    real = git_repo._walk
+    monkeypatch.setattr(git_repo, "_walk", lambda s: calls.append(s) or real(s))
+    assert find_repo_root(sub) == tmp_path
+    assert calls == []
+
+    shutil.rmtree(tmp_path / ".git")
+    assert find_repo_root(sub) is None
+    assert current_branch(sub) is None
+
+# [END: test_discovery_is_cached_and_invalidated]
+
+
+# [FUNC: test_detached_head_and_gitdir_file]
+def test_detached_head_and_gitdir_file(tmp_path):
+    real = tmp_path / "store"
+    real.mkdir()
+    (real / "HEAD").write_text("0123456789abcdef0123456789abcdef01234567\n", encoding="utf-8")
+    wt = tmp_path / "wt"
+    wt.mkdir()
+    (wt / ".git").write_text("gitdir: ../store\n", encoding="utf-8")
+    assert find_repo_root(wt) == wt
+    assert current_branch(wt) == "HEAD"
+
+# [END: test_detached_head_and_gitdir_file]
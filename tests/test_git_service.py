@@ -0,0 +1,97 @@
+# [SECTION: Imports]
+import math
+import subprocess
+
+import pytest
+
+from services.git_service import GitService
+
+# [END: Imports]
+
+
+# [FUNC: service]
+@pytest.fixture
+def service():
+    svc = GitService(timeout=30)
+    yield svc
+    svc.shutdown()
+
+# [END: service]
+
+
+# [FUNC: _repo]
+def _repo(path):
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        subprocess.run(["git", "config", key, val], cwd=path, check=True)
+    return path
+
+# [END: _repo]
+
+
+# [CLASS: _RecordingQueue]
+class _RecordingQueue:
+    def __init__(self):
+        self.roots = []
+
+    def request(self, root):
+        self.roots.append(root)
+
+# [END: _RecordingQueue]
+
+
+# [FUNC: test_save_commits_and_queues_push]
+def test_save_commits_and_queues_push(service, tmp_path):
+    repo = _repo(tmp_path)
+    service.push_queue = queue = _RecordingQueue()
+    (repo / "a.py").write_text("A = 1\n", encoding="utf-8")
+
+    res = service.save(repo, ["a.py"], "eerste").result(timeout=30)
+    # enkel add + commit; de push gaat naar de wachtrij
+    assert [s.args[0] for s in res.steps] == ["add", "commit"]
+    assert res.ok and res.push_queued and "achtergrond" in res.summary()
+    assert queue.roots == [repo]
+    log = service.run_sync(["log", "--format=%s"], repo)
+    assert log.ok and log.stdout == "eerste"
+
+    again = service.save(repo, ["a.py"], "niets").result(timeout=30)
+    assert again.nothing_to_commit and "niets te committen" in again.summary()
+    assert queue.roots == [repo]
+
+# [END: test_save_commits_and_queues_push]
+
+
+# [FUNC: test_operations_on_one_repo_run_in_order]
+def test_operations_on_one_repo_run_in_order(service, tmp_path):
+    repo = _repo(tmp_path)
+    futures = []
+    for i in range(5):
+        (repo / f"f{i}.txt").write_text(str(i), encoding="utf-8")
+        futures.append(service.save(repo, [f"f{i}.txt"], f"c{i}", push=False))
+    assert all(f.result(timeout=30).ok for f in futures)
+    log = service.run_sync(["log", "--reverse", "--format=%s"], repo)
+    assert log.stdout.splitlines() == [f"c{i}" for i in range(5)]
+
+# [END: test_operations_on_one_repo_run_in_order]
+
+
+# [FUNC: test_outside_repo]
+def test_outside_repo(service, tmp_path, monkeypatch):
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    (tmp_path / "x.txt").write_text("x", encoding="utf-8")
+    res = service.save(tmp_path, ["x.txt"], "m").result(timeout=30)
+    assert res.no_repo and len(res.steps) == 1
+
+# [END: test_outside_repo]
+
+
+# [FUNC: test_timeout_per_call]
+def test_timeout_per_call(tmp_path):
+    svc = GitService(timeout=1e-6)
+    try:
+        assert "timeout" in svc.run_sync(["--version"], tmp_path).stderr
+        assert svc.run_sync(["--version"], tmp_path, timeout=math.inf).ok
+    finally:
+        svc.shutdown()
+
+# [END: test_timeout_per_call]
@@ -0,0 +1,121 @@
+# [SECTION: Imports]
+import subprocess
+
+from services import git_ops
+from services.git_status import (
+    CLEAN,
+    CONFLICT,
+    DELETED,
+    MODIFIED,
+    RENAMED,
+    STAGED,
+    UNTRACKED,
+    iter_records,
+    parse_porcelain_v2,
+)
+
+# [END: Imports]
+
+SAMPLE = "\0".join(
+    [
+        "# branch.oid 1234567890abcdef1234567890abcdef12345678",
+        "# branch.head main",
+        "# branch.upstream origin/main",
+        "# branch.ab +2 -1",
+        "1 .M N... 100644 100644 100644 aaaa bbbb src/a b.py",
+        "1 A. N... 000000 100644 100644 0000 cccc src/new.py",
+        "1 .D N... 100644 100644 000000 dddd dddd src/gone.py",
+        "2 R. N... 100644 100644 100644 eeee eeee R100 src/renamed.py",
+        "src/old.py",
+        "u UU N... 100644 100644 100644 100644 f1 f2 f3 src/conflict.py",
+        "? nieuw/",
+        "? los.py",
+        "",
+    ]
+)
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: test_iter_records_across_chunks]
+def test_iter_records_across_chunks():
+    chunks = [SAMPLE[i : i + 7] for i in range(0, len(SAMPLE), 7)]
+    assert list(iter_records(chunks)) == SAMPLE.split("\0")[:-1]
+
+# [END: test_iter_records_across_chunks]
+
+
+# [FUNC: test_parse_porcelain_v2]
+def test_parse_porcelain_v2():
+    st = parse_porcelain_v2([SAMPLE])
+    assert (st.branch, st.upstream, st.ahead, st.behind) == ("main", "origin/main", 2, 1)
+    assert st.state_of("src/a b.py") == MODIFIED
+    assert st.state_of("src/new.py") == STAGED
+    assert st.state_of("src/gone.py") == DELETED
+    assert st.state_of("src/renamed.py") == RENAMED
+    assert st.files["src/renamed.py"].orig_path == "src/old.py"
+    assert st.state_of("src/conflict.py") == CONFLICT
+    assert st.state_of("nieuw/diep/x.py") == UNTRACKED
+    assert st.state_of("src/ongemoeid.py") == CLEAN
+    assert st.summary()["changed"] == 5 and st.summary()["untracked"] == 2
+
+# [END: test_parse_porcelain_v2]
+
+
+# [FUNC: test_script_states_and_cache]
+def test_script_states_and_cache(tmp_path, monkeypatch):
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    proj = tmp_path / "proj"
+    (proj / "pkg").mkdir(parents=True)
+    for name in ("a.py", "b.py"):
+        (proj / name).write_text("x = 1\n", encoding="utf-8")
+    _git(["add", "."], tmp_path)
+    _git(["commit", "-qm", "init"], tmp_path)
+    (proj / "pkg" / "c.py").write_text("c\n", encoding="utf-8")
+
+    scripts = ["a.py", "b.py", "pkg/c.py"]
+    assert git_ops.script_states(proj, scripts) == {
+        "a.py": CLEAN,
+        "b.py": CLEAN,
+        "pkg/c.py": UNTRACKED,
+    }
+
+    calls = []
+    real = git_ops._call
+    monkeypatch.setattr(git_ops, "_call", lambda *a: calls.append(a) or real(*a))
+    git_ops.script_states(proj, scripts)
+    assert calls == []  # niets veranderd → uit de cache
+
+    (proj / "a.py").write_text("x = 22\n", encoding="utf-8")
+    assert git_ops.script_states(proj, scripts)["a.py"] == MODIFIED
+    _git(["add", "proj/b.py", "proj/a.py"], tmp_path)
+    assert git_ops.script_states(proj, scripts)["a.py"] == STAGED
+    assert len(calls) == 2
+
+# [END: test_script_states_and_cache]
+
+
+# [FUNC: test_status_summary_sees_working_tree_edits]
+def test_status_summary_sees_working_tree_edits(tmp_path):
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+    _git(["add", "."], tmp_path)
+    _git(["commit", "-qm", "init"], tmp_path)
+
+    assert git_ops.status_summary(tmp_path)["changed"] == 0
+    # geen git-gebeurtenis, enkel een edit in de werkmap
+    (tmp_path / "a.py").write_text("x = 2\n", encoding="utf-8")
+    assert git_ops.status_summary(tmp_path)["changed"] == 1
+    (tmp_path / "nieuw.py").write_text("y = 1\n", encoding="utf-8")
+    assert git_ops.status_summary(tmp_path)["untracked"] == 1
+
+# [END: test_status_summary_sees_working_tree_edits]
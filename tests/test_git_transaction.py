@@ -0,0 +1,132 @@
+# [SECTION: Imports]
+import json
+import subprocess
+import threading
+
+import pytest
+
+from services.git_service import GitService
+from services.git_transaction import git_transaction, record_path
+from services.project_config import ProjectConfig
+from services.script_ops import create_new_script, remove_script, set_github_url_for_script
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: project]
+@pytest.fixture
+def project(tmp_path):
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    jp = tmp_path / ".projassist.json"
+    jp.write_text(
+        json.dumps({"project_name": "p", "github_repo": "https://github.com/o/p", "scripts": []}),
+        encoding="utf-8",
+    )
+    _git(["add", "."], tmp_path)
+    _git(["commit", "-qm", "init"], tmp_path)
+    return tmp_path, jp
+
+# [END: project]
+
+
+# [FUNC: _wait]
+def _wait(tx):
+    assert tx.future is not None
+    res = tx.future.result(timeout=30)
+    assert res.ok, res.summary()
+
+# [END: _wait]
+
+
+# [FUNC: test_create_and_url_in_one_commit]
+def test_create_and_url_in_one_commit(project):
+    root, jp = project
+    with git_transaction(root, "Add script", push=False) as tx:
+        with ProjectConfig.for_path(jp).batch():
+            create_new_script(jp, "tools", "a")
+            set_github_url_for_script(jp, root / "tools" / "a.py", branch="main")
+    _wait(tx)
+
+    assert _git(["log", "--format=%s"], root).splitlines() == ["Add script", "init"]
+    shown = _git(["show", "--name-only", "--format=", "HEAD"], root).split()
+    assert sorted(shown) == [".projassist.json", "tools/a.py"]
+    assert "github_url" in _git(["show", "HEAD:.projassist.json"], root)
+    assert _git(["status", "--porcelain"], root) == ""
+
+# [END: test_create_and_url_in_one_commit]
+
+
+# [FUNC: test_delete_and_json_in_one_commit]
+def test_delete_and_json_in_one_commit(project):
+    root, jp = project
+    with git_transaction(root, "Add", push=False) as tx:
+        create_new_script(jp, ".", "b")
+    _wait(tx)
+
+    with git_transaction(root, "Remove", push=False) as tx:
+        (root / "b.py").unlink()
+        tx.touch(root / "b.py")
+        tx.touch(root / "nooit-getrackt.py")  # bestaat niet, nooit in git: genegeerd
+        with git_transaction(root, "genest") as inner:
+            assert inner is tx
+            remove_script(jp, "b.py")
+    _wait(tx)
+
+    assert _git(["log", "--format=%s"], root).splitlines()[0] == "Remove"
+    assert _git(["ls-files"], root).split() == [".projassist.json"]
+    assert _git(["status", "--porcelain"], root) == ""
+
+# [END: test_delete_and_json_in_one_commit]
+
+
+# [FUNC: test_exception_means_no_commit]
+def test_exception_means_no_commit(project):
+    root, jp = project
+    with pytest.raises(RuntimeError):
+        with git_transaction(root, "half", push=False) as tx:
+            create_new_script(jp, ".", "c")
+            raise RuntimeError("stop")
+    assert tx.future is None
+    assert _git(["log", "--format=%s"], root).splitlines() == ["init"]
+
+# [END: test_exception_means_no_commit]
+
+
+# [FUNC: test_commit_is_non_blocking_and_per_thread]
+def test_commit_is_non_blocking_and_per_thread(project, monkeypatch):
+    root, jp = project
+    with git_transaction(root, "Add", push=False) as tx:
+        create_new_script(jp, ".", "b")
+    _wait(tx)
+
+    def _blocking(*_a, **_k):
+        raise AssertionError("blokkerende git-aanroep vanuit commit()")
+
+    monkeypatch.setattr(GitService, "run_sync", _blocking)
+    other = root / "ander.py"
+
+    def _writer():
+        other.write_text("x = 1\n", encoding="utf-8")
+        record_path(other)
+
+    with git_transaction(root, "Remove", push=False) as tx:
+        (root / "b.py").unlink()
+        tx.touch(root / "b.py")
+        t = threading.Thread(target=_writer)  # andere thread: niet in deze commit
+        t.start()
+        t.join()
+    _wait(tx)
+
+    assert _git(["show", "--name-only", "--format=", "HEAD"], root).split() == ["b.py"]
+    assert _git(["status", "--porcelain"], root) == "?? ander.py\n"
+
+# [END: test_commit_is_non_blocking_and_per_thread]
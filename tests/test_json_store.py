@@ -0,0 +1,123 @@
+# [SECTION: Imports]
+import json
+
+import pytest
+
+from services.config_model import ConfigError, load_config
+from services.json_store import (
+    ScriptStore,
+    join_scripts,
+    load_json,
+    save_json,
+    split_scripts,
+)
+from services.script_ops import register_existing_script, remove_script
+
+# [END: Imports]
+
+
+# [FUNC: _project]
+def _project(tmp_path, n=3):
+    jp = tmp_path / ".projassist.json"
+    scripts = [{"name": f"s{i}", "path": f"s{i}.py", "type": "py"} for i in range(n)]
+    jp.write_text(
+        json.dumps({"project_name": "demo", "scripts": scripts}), encoding="utf-8"
+    )
+    for i in range(n + 2):
+        (tmp_path / f"s{i}.py").write_text("X = 1\n", encoding="utf-8")
+    return jp
+
+# [END: _project]
+
+
+# [FUNC: test_split_layout_keeps_top_level_small_and_compatible]
+def test_split_layout_keeps_top_level_small_and_compatible(tmp_path):
+    jp = _project(tmp_path)
+    side = split_scripts(jp)
+
+    top = json.loads(jp.read_text(encoding="utf-8"))
+    assert "scripts" not in top and top["scripts_store"] == side.name
+    assert len(side.read_text(encoding="utf-8").splitlines()) == 3
+
+    # bestaande lezers krijgen scripts[] gewoon terug
+    data = load_json(jp)
+    assert [e["path"] for e in data["scripts"]] == ["s0.py", "s1.py", "s2.py"]
+
+    # keyed updates: één regel per wijziging, document blijft ongemoeid
+    before = jp.read_text(encoding="utf-8")
+    register_existing_script(jp, tmp_path / "s3.py")
+    assert remove_script(jp, tmp_path / "s0.py")
+    assert not remove_script(jp, tmp_path / "s0.py")
+    assert jp.read_text(encoding="utf-8") == before
+    assert len(side.read_text(encoding="utf-8").splitlines()) == 5
+    assert ScriptStore(jp).paths() == ["s1.py", "s2.py", "s3.py"]
+
+# [END: test_split_layout_keeps_top_level_small_and_compatible]
+
+
+# [FUNC: test_save_json_appends_only_differences]
+def test_save_json_appends_only_differences(tmp_path):
+    jp = _project(tmp_path)
+    side = split_scripts(jp)
+
+    data = load_json(jp)
+    data["scripts"][1]["note"] = "bijgewerkt"
+    data["project_name"] = "hernoemd"
+    save_json(jp, data)
+
+    lines = side.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4 and json.loads(lines[-1])["path"] == "s1.py"
+    assert "scripts" not in json.loads(jp.read_text(encoding="utf-8"))
+    again = load_json(jp)
+    assert again["project_name"] == "hernoemd"
+    assert again["scripts"][1]["note"] == "bijgewerkt"
+
+# [END: test_save_json_appends_only_differences]
+
+
+# [FUNC: test_compaction_and_join]
+def test_compaction_and_join(tmp_path):
+    jp = _project(tmp_path, n=2)
+    side = split_scripts(jp)
+
+    store = ScriptStore(jp)
+    for i in range(100):
+        store.put({"name": "s0", "path": "s0.py", "type": "py", "rev": i})
+    # compactie houdt het logbestand begrensd; laatste waarde wint
+    assert len(side.read_text(encoding="utf-8").splitlines()) <= 64
+    assert ScriptStore(jp).get("s0.py")["rev"] == 99
+
+    # half geschreven laatste regel (crash) wordt genegeerd
+    with side.open("a", encoding="utf-8") as fh:
+        fh.write('{"op": "put", "path": "s9')
+    assert ScriptStore(jp).paths() == ["s0.py", "s1.py"]
+
+    join_scripts(jp)
+    assert not side.exists()
+    data = json.loads(jp.read_text(encoding="utf-8"))
+    assert [e["path"] for e in data["scripts"]] == ["s0.py", "s1.py"]
+
+# [END: test_compaction_and_join]
+
+
+# [FUNC: test_sidecar_must_stay_in_project_root]
+@pytest.mark.parametrize("name", ["../buiten.jsonl", "sub/../../buiten.jsonl", ".projassist.json"])
+def test_sidecar_must_stay_in_project_root(tmp_path, name):
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    jp = _project(proj)
+    data = json.loads(jp.read_text(encoding="utf-8"))
+    data["scripts_store"] = name
+    del data["scripts"]
+    jp.write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        save_json(jp, dict(data, scripts=[{"path": "x.py"}]))
+    assert "scripts" not in load_json(jp)  # genegeerd, geen crash
+    with pytest.raises(ConfigError):
+        load_config(jp)
+    join_scripts(jp)  # haalt de key weg zonder iets buiten de root te wissen
+    assert "scripts_store" not in json.loads(jp.read_text(encoding="utf-8"))
+    assert not (tmp_path / "buiten.jsonl").exists() and jp.exists()
+
+# [END: test_sidecar_must_stay_in_project_root]
@@ -0,0 +1,42 @@
+# [SECTION: Imports]
+import os
+
+from services import manifest
+from services.manifest import changed_since, update_manifest
+
+# [END: Imports]
+
+
+# [FUNC: test_manifest_stat_fast_path_and_deltas]
+def test_manifest_stat_fast_path_and_deltas(tmp_path, monkeypatch):
+    (tmp_path / "a.py").write_text("A = 1\n", encoding="utf-8")
+    (tmp_path / "b.py").write_text("B = 2\n", encoding="utf-8")
+    data = {"manifest": {}}
+
+    first = update_manifest(tmp_path, data, ["a.py", "b.py"])
+    assert first.added == ["a.py", "b.py"] and first.hashed == 2
+    entry = data["manifest"]["files"]["a.py"]
+    assert set(entry) == {"size", "mtime_ns", "hash"}
+    assert changed_since(tmp_path, data) == []
+
+    # ongewijzigd: geen enkel bestand gelezen
+    def boom(*_a, **_k):
+        raise AssertionError("onverwachte hash")
+
+    monkeypatch.setattr(manifest, "file_hash", boom)
+    again = update_manifest(tmp_path, data, ["a.py", "b.py"])
+    assert not again.dirty
+    monkeypatch.undo()
+
+    (tmp_path / "a.py").write_text("A = 10\n", encoding="utf-8")
+    st = (tmp_path / "b.py").stat()
+    os.utime(tmp_path / "b.py", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert sorted(changed_since(tmp_path, data)) == ["a.py", "b.py"]
+
+    delta = update_manifest(tmp_path, data, ["a.py", "b.py"])
+    assert delta.changed == ["a.py"] and delta.touched == ["b.py"]
+
+    gone = update_manifest(tmp_path, data, ["b.py"])
+    assert gone.removed == ["a.py"]
+
+# [END: test_manifest_stat_fast_path_and_deltas]
@@ -0,0 +1,372 @@
+# [SECTION: Imports]
+import sys
+
+import pytest
+
+from handlers.marker_normalizer import _c_collect, _ps_collect, _sh_collect
+
+# [END: Imports]
+JS_SRC = """\
+import { a } from "./a";
+
+// function fake() { in commentaar
+const tpl = `x ${ {a: 1}.a } }`;
+
+export function load(path) {
+    const s = "}";
+    /* } */
+    return s;
+}
+
+class Store {
+    constructor(x) {
+        this.x = { y: '{' };
+    }
+
+    async get(key) {
+        return this.x[key];
+    }
+}
+
+const handler = async (req) => {
+    return req;
+};
+"""
+
+JAVA_SRC = """\
+package demo;
+
+import java.util.List;
+
+public class Greeter {
+    private final char open = '{';
+
+    @Override
+    public String toString() {
+        return "}";
+    }
+
+    public abstract void later();
+
+    void hello(String name)
+    {
+        System.out.println("{" + name);
+    }
+}
+"""
+
+CS_SRC = """\
+using System;
+
+namespace Demo.App
+{
+    public class Service
+    {
+        public void Run()
+        {
+            var s = @"verbatim "" } string";
+        }
+    }
+}
+"""
+
+
+# [FUNC: test_js_functions_classes_and_methods]
+def test_js_functions_classes_and_methods():
+    meta = _c_collect(JS_SRC.splitlines(keepends=True), ".js")
+    assert meta["imports"] == (0, 1)
+    assert meta["functions"] == [("load", 6, 10), ("handler", 22, 24)]
+    (cname, cstart, cend, methods) = meta["classes"][0]
+    assert (cname, cstart, cend) == ("Store", 12, 20)
+    assert [m[0] for m in methods] == ["constructor", "get"]
+
+# [END: test_js_functions_classes_and_methods]
+
+
+# [FUNC: test_java_annotations_char_literals_and_allman]
+def test_java_annotations_char_literals_and_allman():
+    meta = _c_collect(JAVA_SRC.splitlines(keepends=True), ".java")
+    (cname, cstart, cend, methods) = meta["classes"][0]
+    assert (cname, cstart, cend) == ("Greeter", 5, 19)
+    # abstracte methode zonder body krijgt geen marker
+    assert methods == [("toString", 8, 11), ("hello", 15, 18)]
+
+# [END: test_java_annotations_char_literals_and_allman]
+
+
+# [FUNC: test_cs_namespace_is_transparent]
+def test_cs_namespace_is_transparent():
+    meta = _c_collect(CS_SRC.splitlines(keepends=True), ".cs")
+    (cname, cstart, cend, methods) = meta["classes"][0]
+    assert cname == "Service"
+    assert (cstart, cend) == (5, 11)
+    assert methods == [("Run", 7, 10)]
+
+# [END: test_cs_namespace_is_transparent]
+
+
+# [FUNC: test_js_regex_literals_with_braces]
+def test_js_regex_literals_with_braces():
+    src = """\
+function esc(s) {
+    const re = /\\{[^}/]*\\}/g;
+    return s.replace(/\\{/, "").split(/[{}]/);
+}
+
+class Late {
+    run(a, b) {
+        return a / b / 2;
+    }
+}
+"""
+    meta = _c_collect(src.splitlines(keepends=True), ".ts")
+    assert meta["functions"] == [("esc", 1, 4)]
+    (cname, cstart, cend, methods) = meta["classes"][0]
+    assert (cname, cstart, cend) == ("Late", 6, 10)
+    assert methods == [("run", 7, 9)]
+
+# [END: test_js_regex_literals_with_braces]
+
+
+# [FUNC: test_one_line_bodies]
+def test_one_line_bodies():
+    src = """\
+public class A
+{
+    public A() { }
+    public int Size() { return 0; }
+    public void Later();
+}
+"""
+    (_name, _s, _e, methods) = _c_collect(src.splitlines(keepends=True), ".cs")["classes"][0]
+    assert methods == [("A", 3, 3), ("Size", 4, 4)]
+
+# [END: test_one_line_bodies]
+
+
+# [FUNC: test_sh_heredoc_and_strings]
+def test_sh_heredoc_and_strings():
+    src = (
+        "greet() {\n"
+        "    cat <<EOF\n"
+        "}\n"
+        "EOF\n"
+        '    echo "}" \'{\'  # }\n'
+        "}\n"
+        "\n"
+        "function other {\n"
+        "    :\n"
+        "}\n"
+    )
+    meta = _sh_collect(src.splitlines(keepends=True))
+    assert meta["functions"] == [("greet", 1, 6), ("other", 8, 10)]
+
+# [END: test_sh_heredoc_and_strings]
+
+
+# [FUNC: test_ps_here_string_and_block_comment]
+def test_ps_here_string_and_block_comment():
+    src = (
+        "function Get-Data {\n"
+        '    $t = @"\n'
+        "function Fake {\n"
+        '"@\n'
+        "    <# } #>\n"
+        "    return $t\n"
+        "}\n"
+    )
+    meta = _ps_collect(src.splitlines(keepends=True))
+    assert meta["functions"] == [("Get-Data", 1, 7)]
+
+# [END: test_ps_here_string_and_block_comment]
+
+
+# [FUNC: test_preview_keeps_crlf_file_unchanged]
+@pytest.mark.parametrize("newline", ["\r\n", "\n"])
+def test_preview_keeps_crlf_file_unchanged(tmp_path, monkeypatch, newline):
+    from handlers import marker_normalizer as mn
+
+    monkeypatch.setattr(mn, "_NEWLINE", newline)  # zoals op Windows resp. Linux
+    src = tmp_path / "mod.py"
+    src.write_bytes(b"import os\r\n\r\ndef f():\r\n    return os.sep\r\n")
+    assert mn.preview_markers(src).changed
+
+    mn.normalize_markers(src, backup=False)
+    raw = src.read_bytes()
+    assert (b"\r\n" in raw) == (newline == "\r\n")
+    rep = mn.preview_markers(src)
+    assert not rep.changed, rep
+    assert rep.bytes_delta == 0
+
+# [END: test_preview_keeps_crlf_file_unchanged]
+
+
+# [FUNC: test_normalize_markers_merge_is_stable]
+def test_normalize_markers_merge_is_stable(tmp_path):
+    from handlers.marker_normalizer import normalize_markers
+
+    src = tmp_path / "mod.py"
+    src.write_text(
+        "import os\n\n"
+        "class A:\n"
+        "    def m(self):\n"
+        "        return os.sep\n"
+        "\n"
+        "def f():\n"
+        "    return 1",
+        encoding="utf-8",
+    )
+    normalize_markers(src, project_root=tmp_path)
+    first = src.read_text(encoding="utf-8")
+    assert first == (
+        "# [SECTION: Imports]\n"
+        "import os\n\n"
+        "# [END: Imports]\n"
+        "# [CLASS: A]\n"
+        "class A:\n"
+        "# [FUNC: m]\n"
+        "    def m(self):\n"
+        "        return os.sep\n"
+        "\n"
+        "# [END: m]\n"
+        "# [END: A]\n"
+        "# [FUNC: f]\n"
+        "def f():\n"
+        "    return 1\n"
+        "# [END: f]\n"
+    )
+    # tweede run: oude markers eruit, dezelfde markers terug
+    normalize_markers(src, project_root=tmp_path)
+    assert src.read_text(encoding="utf-8") == first
+    assert not list(tmp_path.glob("*.tmp"))
+
+# [END: test_normalize_markers_merge_is_stable]
+
+
+# [FUNC: test_normalize_project_dry_run_writes_nothing]
+def test_normalize_project_dry_run_writes_nothing(tmp_path):
+    import json
+
+    from handlers.marker_normalizer import normalize_project
+
+    (tmp_path / "a.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    done = "# [FUNC: g]\ndef g():\n    return 2\n# [END: g]\n"
+    (tmp_path / "b.py").write_text(done, encoding="utf-8")
+    cfg = tmp_path / ".projassist.json"
+    cfg.write_text(json.dumps({"scripts": ["a.py", "b.py", "weg.py"]}), encoding="utf-8")
+
+    report = normalize_project(tmp_path, cfg, dry_run=True, with_diff=True)
+
+    by_path = {f.path: f for f in report.files}
+    assert by_path["a.py"].markers_added == 2
+    assert by_path["a.py"].line_delta == 2
+    assert "+# [FUNC: f]" in report.diff
+    assert not by_path["b.py"].changed
+    assert by_path["weg.py"].error
+    assert (tmp_path / "a.py").read_text(encoding="utf-8") == "def f():\n    return 1\n"
+    assert not (tmp_path / "backup").exists()
+
+# [END: test_normalize_project_dry_run_writes_nothing]
+
+
+# [FUNC: test_marker_watcher_remarks_saved_file]
+@pytest.mark.parametrize("use_polling", [True, False])
+def test_marker_watcher_remarks_saved_file(tmp_path, use_polling):
+    import time
+
+    from handlers.marker_watcher import MarkerWatcher, _is_candidate
+
+    root = tmp_path.resolve()
+    assert not _is_candidate(root, root / "backup" / "x.py")
+    assert not _is_candidate(root, root / "x.py.tmp")
+
+    w = MarkerWatcher(
+        root, debounce=0.1, min_interval=0.0, use_polling=use_polling, poll_interval=0.1
+    )
+    w.start()
+    try:
+        time.sleep(0.2)
+        target = root / "mod.py"
+        target.write_text("def f():\n    return 1\n", encoding="utf-8")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if "# [FUNC: f]" in target.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.05)
+        first = target.read_text(encoding="utf-8")
+        assert first.startswith("# [FUNC: f]\n")
+        # eigen write triggert geen nieuwe ronde
+        time.sleep(0.5)
+        assert target.read_text(encoding="utf-8") == first
+    finally:
+        w.stop()
+    assert not (root / "backup").exists()
+
+# [END: test_marker_watcher_remarks_saved_file]
+
+
+# [FUNC: test_marker_watcher_survives_errors_and_expires_own_writes]
+def test_marker_watcher_survives_errors_and_expires_own_writes(tmp_path, monkeypatch):
+    import time
+
+    from handlers import marker_watcher
+    from handlers.marker_watcher import MarkerWatcher
+
+    root = tmp_path.resolve()
+    w = MarkerWatcher(root, debounce=0.1, min_interval=0.0, use_polling=True, poll_interval=0.1)
+    real = w._on_event
+    calls = []
+
+    def flaky(path):
+        calls.append(path)
+        if len(calls) == 1:
+            raise RuntimeError("eenmalig")
+        real(path)
+
+    monkeypatch.setattr(w, "_on_event", flaky)
+    w.start()
+    try:
+        time.sleep(0.2)
+        target = root / "mod.py"
+        target.write_text("def f():\n    return 1\n", encoding="utf-8")
+        time.sleep(0.3)
+        target.write_text("def g():\n    return 2\n", encoding="utf-8")
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and "# [FUNC: g]" not in target.read_text("utf-8"):
+            time.sleep(0.05)
+        assert w.running and "# [FUNC: g]" in target.read_text(encoding="utf-8")
+    finally:
+        w.stop()
+
+    assert w._self_writes
+    monkeypatch.setattr(marker_watcher, "SELF_WRITE_TTL", 0.0)
+    w._process_due()
+    assert not w._self_writes
+
+# [END: test_marker_watcher_survives_errors_and_expires_own_writes]
+
+
+# [FUNC: test_proc_writers_is_cached_and_scoped]
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc enkel op Linux")
+def test_proc_writers_is_cached_and_scoped(tmp_path):
+    import subprocess
+
+    from handlers.marker_watcher import _proc_writers
+
+    root = tmp_path.resolve()
+    target = root / "open.py"
+    target.write_text("", encoding="utf-8")
+    code = f"import time\nf = open({str(target)!r}, 'a')\nprint('open', flush=True)\ntime.sleep(5)\n"
+    proc = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True)
+    try:
+        assert proc.stdout.readline().strip() == "open"
+        found = _proc_writers(str(root))
+        assert str(target) in found
+        assert _proc_writers(str(root)) is found  # binnen de TTL: geen nieuwe scan
+        assert str(target) not in _proc_writers(str(root / "ander"))
+    finally:
+        proc.kill()
+        proc.wait()
+
+# [END: test_proc_writers_is_cached_and_scoped]
+
@@ -0,0 +1,57 @@
+# [SECTION: Imports]
+import os
+from pathlib import Path
+
+import pytest
+
+from services import paths
+from services.paths import rel_posix, resolved_root, to_rel_posix
+
+# [END: Imports]
+
+
+# [FUNC: test_pure_string_path_needs_no_resolve]
+def test_pure_string_path_needs_no_resolve(tmp_path, monkeypatch):
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    resolved_root(root)  # root één keer opgelost en gecachet
+
+    def boom(self, *a, **k):
+        raise AssertionError("resolve() niet verwacht")
+
+    monkeypatch.setattr(Path, "resolve", boom)
+    assert rel_posix(root, root / "pkg" / "a.py") == "pkg/a.py"
+    assert rel_posix(root, "pkg/./b.py") == "pkg/b.py"
+    assert rel_posix(root, str(root) + "//pkg//c.py") == "pkg/c.py"
+
+# [END: test_pure_string_path_needs_no_resolve]
+
+
+# [FUNC: test_dotdot_and_outside_fall_back]
+def test_dotdot_and_outside_fall_back(tmp_path):
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    assert rel_posix(root, root / "pkg" / ".." / "x.py") == "x.py"
+    assert rel_posix(root, tmp_path / "elders.py") is None
+    assert to_rel_posix(root, tmp_path / "elders.py") == "elders.py"
+
+# [END: test_dotdot_and_outside_fall_back]
+
+
+# [FUNC: test_symlinked_root]
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="geen symlinks")
+def test_symlinked_root(tmp_path):
+    real = tmp_path / "echt"
+    (real / "pkg").mkdir(parents=True)
+    link = tmp_path / "link"
+    try:
+        link.symlink_to(real, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlink niet toegestaan")
+    paths.clear_cache()
+
+    # via de link of via het echte pad: zelfde relatieve pad
+    assert rel_posix(link, real / "pkg" / "a.py") == "pkg/a.py"
+    assert rel_posix(real, link / "pkg" / "a.py") == "pkg/a.py"
+
+# [END: test_symlinked_root]
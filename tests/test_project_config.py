@@ -0,0 +1,98 @@
+# [SECTION: Imports]
+import json
+import time
+
+from services import project_config
+from services.project_config import ProjectConfig
+from services.script_ops import (
+    create_new_script,
+    register_existing_script,
+    set_github_url_for_script,
+)
+
+# [END: Imports]
+
+
+# [FUNC: _project]
+def _project(tmp_path):
+    jp = tmp_path / ".projassist.json"
+    jp.write_text(
+        json.dumps({"github_repo": "https://github.com/o/r.git", "scripts": ["a.py"]}),
+        encoding="utf-8",
+    )
+    (tmp_path / "a.py").write_text("A = 1\n", encoding="utf-8")
+    return jp
+
+# [END: _project]
+
+
+# [FUNC: _count_writes]
+def _count_writes(monkeypatch):
+    calls = []
+    real = project_config.save_json
+    monkeypatch.setattr(
+        project_config, "save_json", lambda p, d: (real(p, d), calls.append(p))
+    )
+    return calls
+
+# [END: _count_writes]
+
+
+# [FUNC: test_batch_bundles_user_action_into_one_write]
+def test_batch_bundles_user_action_into_one_write(tmp_path, monkeypatch):
+    jp = _project(tmp_path)
+    writes = _count_writes(monkeypatch)
+
+    with ProjectConfig.for_path(jp).batch():
+        entry = create_new_script(jp, tmp_path / "pkg", "nieuw")
+        url = set_github_url_for_script(jp, tmp_path / "pkg" / "nieuw.py")
+        assert register_existing_script(jp, tmp_path / "a.py")["path"] == "a.py"
+        assert writes == []
+
+    assert len(writes) == 1
+    assert url == "https://github.com/o/r/blob/main/pkg/nieuw.py"
+    data = json.loads(jp.read_text(encoding="utf-8"))
+    assert [e["path"] for e in data["scripts"]] == ["a.py", entry["path"]]
+    assert data["scripts"][1]["github_url"] == url
+
+# [END: test_batch_bundles_user_action_into_one_write]
+
+
+# [FUNC: test_external_edit_is_reloaded_and_pending_changes_replayed]
+def test_external_edit_is_reloaded_and_pending_changes_replayed(tmp_path):
+    jp = _project(tmp_path)
+    cfg = ProjectConfig.for_path(jp)
+    assert cfg.script("a.py")["name"] == "a"
+
+    with cfg.batch():
+        cfg.put_script({"name": "b", "path": "b.py", "type": "py"})
+        # iemand anders past het bestand aan terwijl de batch openstaat
+        ext = json.loads(jp.read_text(encoding="utf-8"))
+        ext["project_name"] = "extern"
+        jp.write_text(json.dumps(ext), encoding="utf-8")
+
+    data = json.loads(jp.read_text(encoding="utf-8"))
+    assert data["project_name"] == "extern"
+    assert [e["path"] for e in data["scripts"]] == ["a.py", "b.py"]
+
+# [END: test_external_edit_is_reloaded_and_pending_changes_replayed]
+
+
+# [FUNC: test_write_behind_coalesces_changes]
+def test_write_behind_coalesces_changes(tmp_path, monkeypatch):
+    jp = _project(tmp_path)
+    writes = _count_writes(monkeypatch)
+    cfg = ProjectConfig(jp, flush_delay_ms=50)
+
+    cfg.set("project_name", "x")
+    cfg.put_script({"name": "c", "path": "c.py", "type": "py"})
+    assert writes == []
+
+    deadline = time.monotonic() + 5
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(writes) == 1
+    assert json.loads(jp.read_text(encoding="utf-8"))["project_name"] == "x"
+    assert not cfg.flush()
+
+# [END: test_write_behind_coalesces_changes]
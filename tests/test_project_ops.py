@@ -0,0 +1,60 @@
+# [SECTION: Imports]
+import json
+
+from services.project_ops import delete_project
+
+# [END: Imports]
+
+
+# [FUNC: _project]
+def _project(tmp_path, doc):
+    root = tmp_path / "map"
+    root.mkdir()
+    (root / ".projassist.json").write_text(doc, encoding="utf-8")
+    (root / "main.py").write_text("X = 1\n", encoding="utf-8")
+    return root
+
+# [END: _project]
+
+
+# [FUNC: test_delete_project_uses_project_name_from_config]
+def test_delete_project_uses_project_name_from_config(tmp_path):
+    root = _project(tmp_path, json.dumps({"project_name": "demo", "scripts": ["main.py"]}))
+    venv = tmp_path / "venvs" / "demo" / "venv"
+    venv.mkdir(parents=True)
+
+    ok, msg = delete_project(root, venv_base=tmp_path / "venvs")
+
+    assert ok, msg
+    assert not root.exists()
+    assert not venv.exists()
+    assert "Venv verwijderd" in msg
+
+# [END: test_delete_project_uses_project_name_from_config]
+
+
+# [FUNC: test_delete_project_invalid_config_falls_back_to_folder_name]
+def test_delete_project_invalid_config_falls_back_to_folder_name(tmp_path):
+    root = _project(tmp_path, json.dumps({"project_name": "demo", "scripts": [3]}))
+    (tmp_path / "venvs" / "demo" / "venv").mkdir(parents=True)
+
+    ok, msg = delete_project(root, venv_base=tmp_path / "venvs")
+
+    assert ok, msg
+    assert not root.exists()
+    # ongeldige config → mapnaam, de venv van "demo" blijft staan
+    assert (tmp_path / "venvs" / "demo" / "venv").exists()
+    assert f"Geen venv gevonden op: {tmp_path / 'venvs' / 'map' / 'venv'}" in msg
+
+# [END: test_delete_project_invalid_config_falls_back_to_folder_name]
+
+
+# [FUNC: test_delete_project_requires_config]
+def test_delete_project_requires_config(tmp_path):
+    (tmp_path / "los").mkdir()
+    ok, msg = delete_project(tmp_path / "los", delete_venv=False)
+    assert not ok
+    assert "geen .projassist.json" in msg
+    assert (tmp_path / "los").exists()
+
+# [END: test_delete_project_requires_config]
@@ -0,0 +1,88 @@
+# [SECTION: Imports]
+import subprocess
+import threading
+
+import pytest
+
+from services.git_service import GitService
+from services.push_queue import FAILED, OK, RETRY, PushQueue
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: setup]
+@pytest.fixture
+def setup(tmp_path):
+    remote = tmp_path / "remote.git"
+    repo = tmp_path / "work"
+    repo.mkdir()
+    _git(["init", "-q", "--bare", str(remote)], tmp_path)
+    _git(["init", "-q"], repo)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], repo)
+    _git(["remote", "add", "origin", str(remote)], repo)
+
+    svc = GitService(timeout=30)
+    statuses = []
+    done = threading.Event()
+    queue = PushQueue(svc, delay=0.2, max_attempts=3, retry_delay=0.05)
+    queue.add_listener(statuses.append)
+    queue.add_listener(lambda st: st.state in (OK, FAILED) and done.set())
+    svc.push_queue = queue
+    yield svc, queue, repo, remote, statuses, done
+    queue.shutdown(timeout=5)
+    svc.shutdown()
+
+# [END: setup]
+
+
+# [FUNC: test_saves_are_coalesced_into_one_push]
+def test_saves_are_coalesced_into_one_push(setup):
+    svc, queue, repo, remote, statuses, done = setup
+    for i in range(3):
+        (repo / f"f{i}.txt").write_text(str(i), encoding="utf-8")
+        assert svc.save(repo, [f"f{i}.txt"], f"c{i}").result(timeout=30).ok
+
+    assert done.wait(10)
+    pushes = [s for s in statuses if s.state == OK]
+    assert len(pushes) == 1 and queue.pending() == []
+    log = _git(["log", "--reverse", "--format=%s", "HEAD"], remote)
+    assert log.splitlines() == ["c0", "c1", "c2"]
+
+# [END: test_saves_are_coalesced_into_one_push]
+
+
+# [FUNC: test_failing_push_retries_then_gives_up]
+def test_failing_push_retries_then_gives_up(setup, tmp_path):
+    svc, queue, repo, _remote, statuses, done = setup
+    _git(["remote", "set-url", "origin", str(tmp_path / "bestaat-niet.git")], repo)
+    (repo / "a.txt").write_text("a", encoding="utf-8")
+    assert svc.save(repo, ["a.txt"], "a").result(timeout=30).ok
+
+    assert done.wait(10)
+    states = [s.state for s in statuses]
+    assert states.count(RETRY) == 2 and states[-1] == FAILED
+    assert "mislukt na 3 pogingen" in statuses[-1].text()
+
+# [END: test_failing_push_retries_then_gives_up]
+
+
+# [FUNC: test_flush_pushes_immediately]
+def test_flush_pushes_immediately(setup):
+    svc, queue, repo, remote, statuses, _done = setup
+    queue.delay = 3600
+    (repo / "a.txt").write_text("a", encoding="utf-8")
+    assert svc.save(repo, ["a.txt"], "nu").result(timeout=30).ok
+
+    assert queue.flush(wait=True, timeout=30)
+    assert _git(["log", "--format=%s", "HEAD"], remote).strip() == "nu"
+    assert [s.state for s in statuses][-1] == OK
+
+# [END: test_flush_pushes_immediately]
@@ -0,0 +1,110 @@
+# [SECTION: Imports]
+import subprocess
+
+from services.script_ops import reconcile_scripts, script_paths
+
+# [END: Imports]
+
+
+# [FUNC: test_reconcile_prunes_renames_and_rebuilds_urls]
+def test_reconcile_prunes_renames_and_rebuilds_urls(tmp_path):
+    for name, body in (("a.py", "A = 1\n"), ("b.py", "def b():\n    return 2\n")):
+        (tmp_path / name).write_text(body, encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "a.py", "b.py"], cwd=tmp_path, check=True)
+
+    data = {
+        "scripts": [
+            "a.py",
+            {"path": "b.py", "name": "b", "note": "eigen veld"},
+            "a.py",
+            "backup/old.py",
+        ],
+        "script_urls": {"a.py": "u/a.py", "b.py": "u/b.py", "weg.py": "u/weg.py"},
+    }
+    (tmp_path / "b.py").rename(tmp_path / "c.py")  # rename buiten git om
+    (tmp_path / "a.py").unlink()
+    (tmp_path / "d.py").write_text("D = 4\n", encoding="utf-8")
+
+    rep = reconcile_scripts(
+        tmp_path,
+        data,
+        ["c.py", "d.py"],
+        url_for=lambda rel: f"https://x/blob/main/{rel}",
+        prune=True,
+    )
+
+    assert rep.added == ["d.py"]
+    assert rep.removed == ["a.py"]
+    assert rep.renamed == [("b.py", "c.py")]
+    assert rep.changed
+    assert script_paths(data) == ["c.py", "d.py"]
+    c_entry = data["scripts"][0]
+    assert c_entry["name"] == "c" and c_entry["note"] == "eigen veld"
+    assert data["script_urls"] == {
+        "c.py": "https://x/blob/main/c.py",
+        "d.py": "https://x/blob/main/d.py",
+    }
+
+    # tweede pass: niets meer te doen
+    assert not reconcile_scripts(
+        tmp_path,
+        data,
+        ["c.py", "d.py"],
+        url_for=lambda rel: f"https://x/blob/main/{rel}",
+        prune=True,
+    ).changed
+
+# [END: test_reconcile_prunes_renames_and_rebuilds_urls]
+
+
+# [FUNC: test_reconcile_only_unique_renames]
+def test_reconcile_only_unique_renames(tmp_path):
+    for name in ("a.py", "b.py", "u.py"):
+        body = "U = 1\n" if name == "u.py" else ""  # a.py en b.py: zelfde (lege) blob
+        (tmp_path / name).write_text(body, encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    for name in ("a.py", "b.py", "u.py"):
+        (tmp_path / name).unlink()
+    for name in ("x.py", "y.py"):
+        (tmp_path / name).write_text("", encoding="utf-8")
+    (tmp_path / "v.py").write_text("U = 1\n", encoding="utf-8")
+    data = {"scripts": ["a.py", "b.py", "u.py"]}
+
+    # standaard geen prune: verdwenen entries blijven staan
+    kept = reconcile_scripts(tmp_path, data, ["v.py", "x.py", "y.py"])
+    assert not kept.removed and not kept.renamed
+    assert script_paths(data) == ["a.py", "b.py", "u.py", "v.py", "x.py", "y.py"]
+
+    data = {"scripts": ["a.py", "b.py", "u.py"]}
+    rep = reconcile_scripts(tmp_path, data, ["v.py", "x.py", "y.py"], prune=True)
+    assert rep.renamed == [("u.py", "v.py")]
+    assert sorted(rep.removed) == ["a.py", "b.py"]
+    assert rep.added == ["x.py", "y.py"]
+
+# [END: test_reconcile_only_unique_renames]
+
+
+# [FUNC: test_reconcile_uses_scan_deltas]
+def test_reconcile_uses_scan_deltas(tmp_path, monkeypatch):
+    (tmp_path / "a.py").write_text("A = 1\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "a.py"], cwd=tmp_path, check=True)
+    (tmp_path / "a.py").rename(tmp_path / "b.py")
+    (tmp_path / "oud.py").write_text("A = 1\n", encoding="utf-8")
+
+    import services.script_ops as ops
+
+    hashed = []
+    real = ops._disk_blob_ids
+    monkeypatch.setattr(ops, "_disk_blob_ids", lambda p: hashed.append(p.name) or real(p))
+    data = {"scripts": ["a.py"]}
+    # oud.py stond er al bij de vorige scan: enkel b.py is een rename-kandidaat
+    rep = reconcile_scripts(
+        tmp_path, data, ["b.py", "oud.py"], prune=True, added={"b.py"}, removed={"a.py"}
+    )
+    assert rep.renamed == [("a.py", "b.py")] and rep.added == ["oud.py"]
+    assert hashed == ["b.py"]
+
+# [END: test_reconcile_uses_scan_deltas]
@@ -0,0 +1,117 @@
+# [SECTION: Imports]
+import json
+import subprocess
+
+import pytest
+
+from services import stage_filter
+from services.git_service import GitService, get_git_service
+from services.stage_filter import StagePolicy, plan_stage, policy_for, track_lfs
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: repo]
+@pytest.fixture
+def repo(tmp_path):
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("A = 1\n", encoding="utf-8")
+    (tmp_path / "run.log").write_text("log\n", encoding="utf-8")
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist" / "app.exe").write_bytes(b"\0" * 10)
+    (tmp_path / "groot.bin").write_bytes(b"\0" * 2048)
+    return tmp_path
+
+# [END: repo]
+
+
+# [FUNC: test_whole_tree_replaces_git_add_dot]
+def test_whole_tree_replaces_git_add_dot(repo):
+    plan = plan_stage(repo, policy=StagePolicy(max_bytes=1024))
+    assert sorted(plan.stage) == [".gitignore", "pkg/a.py"]
+    assert plan.ignored == ["run.log"]
+    assert [p for p, _why in plan.refused] == ["groot.bin"]
+    assert "groot.bin" in plan.summary()
+
+# [END: test_whole_tree_replaces_git_add_dot]
+
+
+# [FUNC: test_explicit_paths_and_lfs]
+def test_explicit_paths_and_lfs(repo, monkeypatch):
+    monkeypatch.setattr(stage_filter, "lfs_available", lambda: True)
+    plan = plan_stage(
+        repo,
+        ["a.py", "../dist/app.exe", "../groot.bin", "weg.py"],
+        StagePolicy(max_bytes=1024, lfs=True),
+        cwd=repo / "pkg",
+        check_ignore=False,
+    )
+    assert plan.stage == ["a.py", "weg.py", "../groot.bin"]  # verwijderd pad blijft staan
+    assert plan.refused == [("dist/app.exe", "buildmap")]
+    assert plan.lfs == ["groot.bin"]
+
+    attrs = track_lfs(repo, plan.lfs)
+    assert attrs.read_text(encoding="utf-8") == "/groot.bin filter=lfs diff=lfs merge=lfs -text\n"
+    assert track_lfs(repo, plan.lfs) is None  # al getrackt
+
+# [END: test_explicit_paths_and_lfs]
+
+
+# [FUNC: test_policy_from_projassist_json]
+def test_policy_from_projassist_json(repo):
+    (repo / ".projassist.json").write_text(
+        json.dumps({"git_stage": {"max_file_mb": 0.5, "lfs": False, "block_dirs": ["out"]}}),
+        encoding="utf-8",
+    )
+    pol = policy_for(repo)
+    assert pol.max_bytes == 512 * 1024 and not pol.lfs and pol.block_dirs == {"out"}
+
+# [END: test_policy_from_projassist_json]
+
+
+# [FUNC: test_save_skips_oversized_files]
+def test_save_skips_oversized_files(repo):
+    (repo / ".projassist.json").write_text(
+        json.dumps({"git_stage": {"max_file_mb": 0.001, "lfs": False}}), encoding="utf-8"
+    )
+    svc = GitService(timeout=30)
+    try:
+        res = svc.save(repo, ["pkg/a.py", "groot.bin"], "klein", push=False).result(timeout=30)
+        assert res.ok and "groot.bin" in res.summary()
+        assert _git(["ls-files"], repo).split() == ["pkg/a.py"]
+
+        only_big = svc.save(repo, ["groot.bin"], "groot", push=False).result(timeout=30)
+        assert not only_big.ok and only_big.summary().startswith("Niets gecommit.")
+    finally:
+        svc.shutdown()
+
+# [END: test_save_skips_oversized_files]
+
+
+# [FUNC: test_save_with_lfs_policy_from_inside_the_repo]
+def test_save_with_lfs_policy_from_inside_the_repo(repo, monkeypatch):
+    # lfs_available() draait tijdens save in het repo-slot; met de procesmap in
+    # de repo mocht dat niet op datzelfde slot wachten (deadlock)
+    (repo / ".projassist.json").write_text(
+        json.dumps({"git_stage": {"max_file_mb": 0.001, "lfs": True}}), encoding="utf-8"
+    )
+    monkeypatch.chdir(repo)
+    stage_filter.lfs_available.cache_clear()
+    try:
+        res = get_git_service().save(repo, ["pkg/a.py", "groot.bin"], "lfs", push=False)
+        assert res.result(timeout=30).ok
+    finally:
+        stage_filter.lfs_available.cache_clear()
+
+# [END: test_save_with_lfs_policy_from_inside_the_repo]
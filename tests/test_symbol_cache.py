@@ -0,0 +1,46 @@
+# [SECTION: Imports]
+from services import symbol_cache
+from services.symbol_cache import SymbolCache, find_symbol, get_cache
+
+# [END: Imports]
+SRC = (
+    "import os\n"
+    "\n"
+    "class A:\n"
+    "    @staticmethod\n"
+    "    def m():\n"
+    "        return os.sep\n"
+    "\n"
+    "def f():\n"
+    "    return 1\n"
+)
+
+
+# [FUNC: test_second_pass_costs_only_stat]
+def test_second_pass_costs_only_stat(tmp_path, monkeypatch):
+    monkeypatch.setattr(symbol_cache, "_CACHES", {})
+    (tmp_path / ".projassist.json").write_text("{}", encoding="utf-8")
+    src = tmp_path / "mod.py"
+    src.write_text(SRC, encoding="utf-8")
+
+    meta = get_cache(tmp_path).for_file(src)
+    assert find_symbol(meta, "m") == (4, 6)
+    assert find_symbol(meta, "f") == (8, 9)
+    assert meta["imports"] == (0, 1)
+    get_cache(tmp_path).save()
+    assert (tmp_path / ".projassist_cache" / "symbols.pickle").exists()
+
+    # nieuwe (lege) procescache: laadt van schijf en parset niet opnieuw
+    def boom(lines):
+        raise AssertionError("onverwachte parse")
+
+    fresh = SymbolCache(tmp_path.resolve()).load()
+    assert fresh.for_file(src, collect=boom) == meta
+    # zelfde inhoud via for_lines: hash-hit, ook geen parse
+    assert fresh.for_lines(SRC.splitlines(keepends=True), ".py", boom) == meta
+
+    # gewijzigd bestand → wel opnieuw parsen
+    src.write_text(SRC + "\ndef g():\n    pass\n", encoding="utf-8")
+    assert find_symbol(fresh.for_file(src), "g") == (11, 12)
+
+# [END: test_second_pass_costs_only_stat]
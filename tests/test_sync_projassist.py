@@ -0,0 +1,91 @@
+# [SECTION: Imports]
+import json
+import subprocess
+import threading
+
+from PyQt6 import QtWidgets
+
+from handlers import sync_projassist
+from handlers.sync_projassist import SyncProjassistService
+from services.json_store import split_scripts
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: _boxes]
+def _boxes(monkeypatch):
+    shown = []
+    for box in ("critical", "information"):
+        monkeypatch.setattr(
+            QtWidgets.QMessageBox, box, lambda _p, title, text, _b=box: shown.append((_b, title, text))
+        )
+    return shown
+
+# [END: _boxes]
+
+
+# [FUNC: test_sync_commits_sidecar_in_split_layout]
+def test_sync_commits_sidecar_in_split_layout(qtbot, tmp_path, monkeypatch):
+    shown = _boxes(monkeypatch)
+    threads = []
+    real = sync_projassist.sync_scripts
+    monkeypatch.setattr(
+        sync_projassist,
+        "sync_scripts",
+        lambda *a, **k: (threads.append(threading.current_thread()), real(*a, **k))[1],
+    )
+    _git(["init", "-q", "-b", "main"], tmp_path)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], tmp_path)
+    jp = tmp_path / ".projassist.json"
+    jp.write_text(
+        json.dumps({"project_name": "demo", "scripts": [{"path": "a.py"}]}), encoding="utf-8"
+    )
+    (tmp_path / ".gitignore").write_text(".projassist_cache/\n", encoding="utf-8")
+    (tmp_path / "a.py").write_text("A = 1\n", encoding="utf-8")
+    side = split_scripts(jp)
+    _git(["add", "."], tmp_path)
+    _git(["commit", "-qm", "start"], tmp_path)
+
+    (tmp_path / "b.py").write_text("B = 1\n", encoding="utf-8")
+    parent = QtWidgets.QWidget()
+    qtbot.addWidget(parent)
+    SyncProjassistService(tmp_path, jp, parent).run()
+
+    qtbot.waitUntil(
+        lambda: _git(["log", "-1", "--format=%s"], tmp_path).startswith("SyncProjAssist"),
+        timeout=15000,
+    )
+    assert threads and threads[0] is not threading.main_thread()
+    assert shown[0][:2] == ("information", "Sync voltooid")
+    assert "b.py" in side.read_text(encoding="utf-8")
+    assert side.name in _git(["show", "--name-only", "--format=", "HEAD"], tmp_path).split()
+    assert _git(["status", "--porcelain", "--", side.name, jp.name], tmp_path) == ""
+
+# [END: test_sync_commits_sidecar_in_split_layout]
+
+
+# [FUNC: test_sync_shows_config_error]
+def test_sync_shows_config_error(qtbot, tmp_path, monkeypatch):
+    shown = _boxes(monkeypatch)
+    jp = tmp_path / ".projassist.json"
+    jp.write_text(json.dumps({"scripts": [{"naam": "zonder pad"}]}), encoding="utf-8")
+    before = jp.read_text(encoding="utf-8")
+    parent = QtWidgets.QWidget()
+    qtbot.addWidget(parent)
+
+    SyncProjassistService(tmp_path, jp, parent).run()
+
+    qtbot.waitUntil(lambda: bool(shown), timeout=10000)
+    kind, title, text = shown[0]
+    assert (kind, title) == ("critical", "Sync") and "scripts[0]" in text
+    assert jp.read_text(encoding="utf-8") == before
+
+# [END: test_sync_shows_config_error]
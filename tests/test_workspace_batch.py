@@ -0,0 +1,45 @@
+# [SECTION: Imports]
+import json
+import subprocess
+
+from handlers.workspace_batch import discover_projects, run_workspace
+
+# [END: Imports]
+
+
+# [FUNC: _project]
+def _project(base, name, scripts):
+    root = base / name
+    root.mkdir(parents=True)
+    (root / "main.py").write_text("def main():\n    pass\n", encoding="utf-8")
+    (root / ".projassist.json").write_text(
+        json.dumps({"scripts": scripts}), encoding="utf-8"
+    )
+    return root
+
+# [END: _project]
+
+
+# [FUNC: test_workspace_batch_summarizes_all_projects]
+def test_workspace_batch_summarizes_all_projects(tmp_path):
+    a = _project(tmp_path, "alpha", [])
+    _project(tmp_path / "groep", "beta", ["main.py", "weg.py"])
+    _project(tmp_path / "alpha" / "backup", "oud", [])  # backup/ wordt gesnoeid
+    subprocess.run(["git", "init", "-q"], cwd=a, check=True)
+
+    assert [p.parent.name for p in discover_projects(tmp_path)] == ["alpha", "beta"]
+
+    report = run_workspace(tmp_path, max_workers=2)
+    by_name = {r.name: r for r in report.projects}
+    assert by_name["alpha"].sync == "+1 -0 ~0"
+    assert by_name["beta"].sync == "+0 -1 ~0"
+    assert by_name["alpha"].markers == "1 te wijzigen"
+    assert by_name["beta"].git == "geen repo"
+    assert "nieuw" in by_name["alpha"].git
+    table = report.table()
+    assert table.splitlines()[0].startswith("Project")
+    assert "2 project(en), 0 met fouten." in table
+    # dry-run: niets genormaliseerd
+    assert (a / "main.py").read_text(encoding="utf-8").startswith("def main")
+
+# [END: test_workspace_batch_summarizes_all_projects]
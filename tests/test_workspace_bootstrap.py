@@ -0,0 +1,114 @@
+# [SECTION: Imports]
+import json
+import subprocess
+
+import pytest
+
+from handlers.workspace_bootstrap import bootstrap_workspace
+from services.git_clone import fast_clone, repo_name, sparse_dirs
+from services.git_service import get_git_service
+
+# [END: Imports]
+
+
+# [FUNC: _git]
+def _git(args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+# [END: _git]
+
+
+# [FUNC: _bare]
+def _bare(tmp_path, name, scripts):
+    src = tmp_path / "src" / name
+    src.mkdir(parents=True)
+    _git(["init", "-q", "-b", "main"], src)
+    for key, val in (("user.name", "t"), ("user.email", "t@example.com")):
+        _git(["config", key, val], src)
+    for rel in ("main.py", "tools/a.py", "gui/venster.ui", "data/groot.bin"):
+        (src / rel).parent.mkdir(parents=True, exist_ok=True)
+        (src / rel).write_text(f"# {rel}\n", encoding="utf-8")
+    (src / ".projassist.json").write_text(json.dumps({"scripts": scripts}), encoding="utf-8")
+    _git(["add", "."], src)
+    _git(["commit", "-qm", "init"], src)
+    bare = tmp_path / "remote" / f"{name}.git"
+    _git(["clone", "-q", "--bare", str(src), str(bare)], tmp_path)
+    _git(["config", "uploadpack.allowFilter", "true"], bare)
+    return bare
+
+# [END: _bare]
+
+
+# [FUNC: _missing_blobs]
+def _missing_blobs(repo):
+    out = _git(["rev-list", "--objects", "--missing=print", "--all"], repo)
+    return sum(1 for ln in out.splitlines() if ln.startswith("?"))
+
+# [END: _missing_blobs]
+
+
+# [FUNC: test_helpers]
+def test_helpers():
+    assert repo_name("https://github.com/o/project_x.git") == "project_x"
+    assert repo_name("git@github.com:o/project_y.git") == "project_y"
+    assert sparse_dirs(["main.py", "tools/a.py", "tools/sub/b.py", "gui\\x.ui"]) == ["gui", "tools"]
+
+# [END: test_helpers]
+
+
+# [FUNC: test_sparse_partial_clone]
+def test_sparse_partial_clone(tmp_path):
+    bare = _bare(tmp_path, "project_a", ["main.py", "tools/a.py"])
+    res = fast_clone(str(bare), tmp_path / "ws" / "project_a")
+    assert res.ok, res.error
+    dest = res.dest
+    assert res.sparse == ["tools"]
+    assert (dest / "main.py").exists() and (dest / "tools" / "a.py").exists()
+    assert not (dest / "gui").exists() and not (dest / "data").exists()
+    assert _missing_blobs(dest) == 2  # venster.ui en groot.bin nooit opgehaald
+    # buiten de checkout: blob komt op aanvraag van de remote
+    assert _git(["show", "HEAD:gui/venster.ui"], dest) == "# gui/venster.ui\n"
+
+    again = fast_clone(str(bare), dest)
+    assert again.ok and again.status == "bestaat al"
+
+# [END: test_sparse_partial_clone]
+
+
+# [FUNC: test_bootstrap_many_in_parallel]
+def test_bootstrap_many_in_parallel(tmp_path):
+    sources = [str(_bare(tmp_path, f"project_{i}", [])) for i in range(3)]
+    sources.append(str(tmp_path / "remote" / "bestaat-niet.git"))
+    report = bootstrap_workspace(tmp_path / "ws", sources, max_workers=4)
+
+    ok = [r for r in report.results if r.ok]
+    assert [r.dest.name for r in ok] == ["project_0", "project_1", "project_2"]
+    for r in ok:
+        # lege scripts[]: volledige checkout
+        assert (r.dest / "gui" / "venster.ui").exists()
+    assert not (tmp_path / "ws" / "bestaat-niet").exists()
+    assert "1 met fouten" in report.table()
+
+# [END: test_bootstrap_many_in_parallel]
+
+
+# [FUNC: test_clone_inside_a_repo_locks_dest]
+def test_clone_inside_a_repo_locks_dest(tmp_path):
+    bare = _bare(tmp_path, "project_b", [])
+    outer = tmp_path / "outer"
+    outer.mkdir()
+    _git(["init", "-q"], outer)  # werkmap ligt zelf in een repo
+    locks = get_git_service().locks
+    seen = []
+    listener = lambda root, depth: seen.append(root)  # noqa: E731
+    locks.add_listener(listener)
+    try:
+        res = fast_clone(str(bare), outer / "ws" / "project_b")
+    finally:
+        locks.remove_listener(listener)
+    assert res.ok, res.error
+    keys = {str(p) for p in seen}
+    assert str(outer) not in keys
+    assert str(res.dest) in keys
+
+# [END: test_clone_inside_a_repo_locks_dest]